@@ -0,0 +1,52 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attribute", "0001_initial"),
+        ("entry", "0002_category_category_name_slug_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attribute",
+            index=models.Index(fields=["name", "slug"], name="attribute_name_slug_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="attribute",
+            index=models.Index(
+                fields=["value_required", "name", "slug"],
+                name="attribute_value_required_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="attribute",
+            index=models.Index(
+                fields=["visible_in_website", "name", "slug"],
+                name="attribute_visible_website_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="attribute",
+            index=models.Index(
+                fields=["filterable_in_website", "name", "slug"],
+                name="attribute_filter_website_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="attribute",
+            index=models.Index(
+                fields=["filterable_in_dashboard", "name", "slug"],
+                name="attribute_filter_dashboard_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="attributevalue",
+            index=models.Index(
+                fields=["name", "slug"], name="attribute_value_name_slug_idx"
+            ),
+        ),
+    ]
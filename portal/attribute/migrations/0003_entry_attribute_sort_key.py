@@ -0,0 +1,86 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:40
+
+import django.db.models.deletion
+from django.contrib.postgres.aggregates import StringAgg
+from django.db import migrations, models
+
+
+def populate_sort_keys(apps, schema_editor):
+    AssignedEntryAttributeValue = apps.get_model(
+        "attribute", "AssignedEntryAttributeValue"
+    )
+    EntryAttributeSortKey = apps.get_model("attribute", "EntryAttributeSortKey")
+    rows = (
+        AssignedEntryAttributeValue.objects.order_by()
+        .values("entry_id", "value__attribute_id")
+        .annotate(
+            sort_key=StringAgg(
+                "value__name",
+                delimiter=", ",
+                ordering=("value__sort_order", "value__name"),
+            )
+        )
+    )
+    EntryAttributeSortKey.objects.bulk_create(
+        (
+            EntryAttributeSortKey(
+                entry_id=row["entry_id"],
+                attribute_id=row["value__attribute_id"],
+                sort_key=row["sort_key"],
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attribute", "0002_attribute_attribute_name_slug_idx_and_more"),
+        ("entry", "0002_category_category_name_slug_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EntryAttributeSortKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sort_key", models.TextField()),
+                (
+                    "attribute",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="attribute.attribute",
+                    ),
+                ),
+                (
+                    "entry",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="attribute_sort_keys",
+                        to="entry.entry",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["attribute", "sort_key", "entry"],
+                        name="entry_attribute_sort_key_idx",
+                    )
+                ],
+                "unique_together": {("entry", "attribute")},
+            },
+        ),
+        migrations.RunPython(populate_sort_keys, migrations.RunPython.noop),
+    ]
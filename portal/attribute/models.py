@@ -1,6 +1,10 @@
-from django.db import models
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import models, transaction
 from django.db.models import Exists, OuterRef
+from django.dispatch import receiver
 
+from ..core.db.utils import is_cascade_delete
 from ..core.models import SortableModel
 from ..core.permissions import AttributePermissions
 from ..entry.models import Entry, EntryType
@@ -124,6 +128,25 @@ class Attribute(models.Model):
 
     class Meta:
         ordering = ("name",)
+        indexes = [
+            models.Index(fields=["name", "slug"], name="attribute_name_slug_idx"),
+            models.Index(
+                fields=["value_required", "name", "slug"],
+                name="attribute_value_required_idx",
+            ),
+            models.Index(
+                fields=["visible_in_website", "name", "slug"],
+                name="attribute_visible_website_idx",
+            ),
+            models.Index(
+                fields=["filterable_in_website", "name", "slug"],
+                name="attribute_filter_website_idx",
+            ),
+            models.Index(
+                fields=["filterable_in_dashboard", "name", "slug"],
+                name="attribute_filter_dashboard_idx",
+            ),
+        ]
         permissions = (
             (AttributePermissions.MANAGE_ATTRIBUTES.codename, "Manage attributes."),
         )
@@ -160,6 +183,9 @@ class AttributeValue(SortableModel):
 
     class Meta:
         ordering = ("name",)
+        indexes = [
+            models.Index(fields=["name", "slug"], name="attribute_value_name_slug_idx"),
+        ]
         unique_together = ("slug", "attribute")
 
     def __str__(self) -> str:
@@ -171,3 +197,142 @@ class AttributeValue(SortableModel):
 
     def get_ordering_queryset(self):
         return self.attribute.values.all()
+
+
+class EntryAttributeSortKeyQueryset(models.QuerySet):
+    def refresh(self, entry_ids, attribute_ids=None):
+        """Recompute sort keys of the entries from their assigned attribute values.
+
+        The sort key of an entry is the names of its values of the attribute, in
+        the order of the attribute values. Sort keys are upserted so that
+        concurrent refreshes do not conflict, and only those without assigned
+        values are deleted.
+        """
+        assignments = AssignedEntryAttributeValue.objects.filter(entry_id__in=entry_ids)
+        sort_keys = self.filter(entry_id__in=entry_ids)
+        if attribute_ids is not None:
+            assignments = assignments.filter(value__attribute_id__in=attribute_ids)
+            sort_keys = sort_keys.filter(attribute_id__in=attribute_ids)
+
+        rows = (
+            assignments.order_by()
+            .values("entry_id", "value__attribute_id")
+            .annotate(
+                sort_key=StringAgg(
+                    "value__name",
+                    delimiter=", ",
+                    ordering=("value__sort_order", "value__name"),
+                )
+            )
+        )
+        assigned = assignments.filter(
+            entry_id=OuterRef("entry_id"), value__attribute_id=OuterRef("attribute_id")
+        )
+        with transaction.atomic():
+            self.bulk_create(
+                (
+                    self.model(
+                        entry_id=row["entry_id"],
+                        attribute_id=row["value__attribute_id"],
+                        sort_key=row["sort_key"],
+                    )
+                    for row in rows
+                ),
+                update_conflicts=True,
+                unique_fields=["entry", "attribute"],
+                update_fields=["sort_key"],
+            )
+            sort_keys.exclude(Exists(assigned)).delete()
+
+
+EntryAttributeSortKeyManager = models.Manager.from_queryset(
+    EntryAttributeSortKeyQueryset
+)
+
+
+class EntryAttributeSortKey(models.Model):
+    """Values of an entry's attribute denormalized for sorting entries by them."""
+
+    entry = models.ForeignKey(
+        Entry, related_name="attribute_sort_keys", on_delete=models.CASCADE
+    )
+    attribute = models.ForeignKey(Attribute, related_name="+", on_delete=models.CASCADE)
+    sort_key = models.TextField()
+
+    objects = EntryAttributeSortKeyManager()
+
+    class Meta:
+        unique_together = (("entry", "attribute"),)
+        indexes = [
+            models.Index(
+                fields=["attribute", "sort_key", "entry"],
+                name="entry_attribute_sort_key_idx",
+            ),
+        ]
+
+
+def refresh_entries_attribute_value_ids(entry_ids):
+    """Copy IDs of the values assigned to the entries to `attribute_value_ids`."""
+    value_ids = (
+        AssignedEntryAttributeValue.objects.filter(entry_id=OuterRef("pk"))
+        .order_by("value_id")
+        .values("value_id")
+    )
+    Entry.objects.filter(pk__in=entry_ids).order_by().update(
+        attribute_value_ids=ArraySubquery(value_ids)
+    )
+
+
+@receiver(models.signals.post_save, sender=AssignedEntryAttributeValue)
+@receiver(models.signals.post_delete, sender=AssignedEntryAttributeValue)
+def refresh_assigned_value_sort_key(sender, instance, raw=False, origin=None, **kwargs):
+    # Values deleted by a cascade are refreshed once for all their entries.
+    if raw or is_cascade_delete(sender, origin):
+        return
+    attribute_ids = AttributeValue.objects.filter(pk=instance.value_id).values(
+        "attribute_id"
+    )
+    EntryAttributeSortKey.objects.refresh([instance.entry_id], attribute_ids)
+
+
+@receiver(models.signals.post_save, sender=AssignedEntryAttributeValue)
+@receiver(models.signals.post_delete, sender=AssignedEntryAttributeValue)
+def refresh_assigned_value_ids(sender, instance, raw=False, origin=None, **kwargs):
+    # Values deleted by a cascade are refreshed once for all their entries.
+    if raw or is_cascade_delete(sender, origin):
+        return
+    refresh_entries_attribute_value_ids([instance.entry_id])
+
+
+@receiver(models.signals.post_save, sender=AttributeValue)
+def refresh_attribute_value_sort_keys(sender, instance, created, raw, **kwargs):
+    if created or raw:
+        return
+    entry_ids = AssignedEntryAttributeValue.objects.filter(value_id=instance.pk).values(
+        "entry_id"
+    )
+    EntryAttributeSortKey.objects.refresh(entry_ids, [instance.attribute_id])
+
+
+@receiver(models.signals.pre_delete, sender=AttributeValue)
+def collect_attribute_value_entries(sender, instance, **kwargs):
+    # Assignments of the value are deleted before its post_delete is sent.
+    instance._assigned_entry_ids = list(
+        AssignedEntryAttributeValue.objects.filter(value_id=instance.pk).values_list(
+            "entry_id", flat=True
+        )
+    )
+
+
+@receiver(models.signals.post_delete, sender=AttributeValue)
+def refresh_deleted_attribute_value_sort_keys(sender, instance, **kwargs):
+    entry_ids = getattr(instance, "_assigned_entry_ids", None)
+    if entry_ids:
+        EntryAttributeSortKey.objects.refresh(entry_ids, [instance.attribute_id])
+
+
+@receiver(models.signals.post_delete, sender=AttributeValue)
+def refresh_deleted_attribute_value_ids(sender, instance, **kwargs):
+    entry_ids = getattr(instance, "_assigned_entry_ids", None)
+    if entry_ids:
+        refresh_entries_attribute_value_ids(entry_ids)
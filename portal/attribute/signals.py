@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent with the entry and the attribute after values of the attribute were
+# assigned to the entry in bulk, which doesn't send the signals of the models.
+entry_attribute_values_assigned = Signal()
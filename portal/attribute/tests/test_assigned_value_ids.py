@@ -0,0 +1,58 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ...entry.models import Entry
+from ..models import AssignedEntryAttributeValue
+from ..utils import associate_attribute_values_to_instance
+
+pytestmark = pytest.mark.django_db
+
+
+def test_associate_attribute_values_updates_value_ids(
+    vehicle, color_attribute, size_attribute
+):
+    red, blue = color_attribute.values.order_by("pk")
+    small = size_attribute.values.get(slug="small")
+
+    associate_attribute_values_to_instance(vehicle, color_attribute, blue, red)
+    associate_attribute_values_to_instance(vehicle, size_attribute, small)
+    associate_attribute_values_to_instance(vehicle, color_attribute, blue)
+
+    vehicle.refresh_from_db()
+    assert vehicle.attribute_value_ids == sorted([blue.pk, small.pk])
+
+
+def test_removing_assigned_value_updates_value_ids(vehicle, color_attribute):
+    red, blue = color_attribute.values.order_by("pk")
+    associate_attribute_values_to_instance(vehicle, color_attribute, red, blue)
+
+    AssignedEntryAttributeValue.objects.filter(entry=vehicle, value=red).delete()
+    vehicle.refresh_from_db()
+    assert vehicle.attribute_value_ids == [blue.pk]
+
+    blue.delete()
+    vehicle.refresh_from_db()
+    assert vehicle.attribute_value_ids == []
+
+
+def test_deleting_attribute_value_refreshes_value_ids_once(
+    vehicle_list, color_attribute
+):
+    red, blue = color_attribute.values.order_by("pk")
+    for vehicle in vehicle_list:
+        associate_attribute_values_to_instance(vehicle, color_attribute, red, blue)
+
+    with CaptureQueriesContext(connection) as queries:
+        red.delete()
+
+    updates = [
+        query
+        for query in queries.captured_queries
+        if query["sql"].startswith(f'UPDATE "{Entry._meta.db_table}"')
+        and "attribute_value_ids" in query["sql"]
+    ]
+    assert len(updates) == 1
+    for vehicle in vehicle_list:
+        vehicle.refresh_from_db()
+        assert vehicle.attribute_value_ids == [blue.pk]
@@ -0,0 +1,90 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ...entry.models import Entry
+from ..models import AssignedEntryAttributeValue, EntryAttributeSortKey
+from ..utils import associate_attribute_values_to_instance
+
+pytestmark = pytest.mark.django_db
+
+
+def _get_sort_key(entry, attribute):
+    return (
+        EntryAttributeSortKey.objects.filter(entry=entry, attribute=attribute)
+        .values_list("sort_key", flat=True)
+        .first()
+    )
+
+
+def test_associate_attribute_values_updates_sort_key(vehicle, color_attribute):
+    red, blue = color_attribute.values.order_by("pk")
+
+    associate_attribute_values_to_instance(vehicle, color_attribute, blue, red)
+
+    assert _get_sort_key(vehicle, color_attribute) == "Red, Blue"
+
+
+def test_removing_assigned_value_updates_sort_key(vehicle, color_attribute):
+    red, blue = color_attribute.values.order_by("pk")
+    associate_attribute_values_to_instance(vehicle, color_attribute, red, blue)
+
+    AssignedEntryAttributeValue.objects.filter(entry=vehicle, value=red).delete()
+    assert _get_sort_key(vehicle, color_attribute) == "Blue"
+
+    AssignedEntryAttributeValue.objects.filter(entry=vehicle, value=blue).delete()
+    assert _get_sort_key(vehicle, color_attribute) is None
+
+
+def test_renaming_attribute_value_updates_sort_key(vehicle, color_attribute):
+    red = color_attribute.values.get(slug="red")
+    associate_attribute_values_to_instance(vehicle, color_attribute, red)
+
+    red.name = "Crimson"
+    red.save(update_fields=["name"])
+
+    assert _get_sort_key(vehicle, color_attribute) == "Crimson"
+
+
+def test_deleting_attribute_value_refreshes_sort_keys_once(
+    vehicle_list, color_attribute
+):
+    red, blue = color_attribute.values.order_by("pk")
+    for vehicle in vehicle_list:
+        associate_attribute_values_to_instance(vehicle, color_attribute, red, blue)
+
+    with CaptureQueriesContext(connection) as queries:
+        red.delete()
+
+    upserts = [
+        query
+        for query in queries.captured_queries
+        if query["sql"].startswith(
+            f'INSERT INTO "{EntryAttributeSortKey._meta.db_table}"'
+        )
+    ]
+    assert len(upserts) == 1
+    assert [_get_sort_key(vehicle, color_attribute) for vehicle in vehicle_list] == [
+        "Blue"
+    ] * len(vehicle_list)
+
+
+def test_sort_by_attribute(vehicle_list, color_attribute, size_attribute):
+    red = color_attribute.values.get(slug="red")
+    blue = color_attribute.values.get(slug="blue")
+    vehicle_1, vehicle_2, vehicle_3 = vehicle_list
+    associate_attribute_values_to_instance(vehicle_1, color_attribute, red)
+    associate_attribute_values_to_instance(vehicle_2, color_attribute, blue)
+    associate_attribute_values_to_instance(
+        vehicle_3, size_attribute, size_attribute.values.first()
+    )
+
+    ascending = Entry.objects.sort_by_attribute(color_attribute.pk)
+    descending = Entry.objects.sort_by_attribute(color_attribute.pk, descending=True)
+
+    assert list(ascending) == [vehicle_2, vehicle_1, vehicle_3]
+    assert list(descending) == [vehicle_3, vehicle_1, vehicle_2]
+
+
+def test_sort_by_invalid_attribute_sorts_by_name(vehicle_list):
+    assert list(Entry.objects.sort_by_attribute("")) == vehicle_list
@@ -1,7 +1,14 @@
 from django.db.models.expressions import Exists, OuterRef
 
 from ..entry.models import Entry
-from .models import AssignedEntryAttributeValue, AttributeValue
+from ..entry.search import update_entries_search_vector
+from .models import (
+    AssignedEntryAttributeValue,
+    AttributeValue,
+    EntryAttributeSortKey,
+    refresh_entries_attribute_value_ids,
+)
+from .signals import entry_attribute_values_assigned
 
 
 def associate_attribute_values_to_instance(instance, attribute, *values):
@@ -39,6 +46,15 @@ def _associate_attribute_to_instance(instance, attribute, *values):
             AssignedEntryAttributeValue(entry=instance, value_id=value_id)
             for value_id in new_values
         )
+        # Bulk created values don't send signals refreshing the sort keys, the
+        # value IDs and the search vector, nor invalidating cached results
+        # depending on the assigned values, like the facets.
+        EntryAttributeSortKey.objects.refresh([instance.pk], [attribute.pk])
+        refresh_entries_attribute_value_ids([instance.pk])
+        update_entries_search_vector(Entry.objects.filter(pk=instance.pk))
+        entry_attribute_values_assigned.send(
+            sender=AssignedEntryAttributeValue, entry=instance, attribute=attribute
+        )
 
         return None
 
@@ -1,6 +1,24 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "portal.core"
+
+    def ready(self):
+        # Register the `any` lookup used by the data loaders.
+        from .db import lookups  # noqa: F401
+
+        # Connect the receivers invalidating cached GraphQL responses, counts
+        # and data loader results.
+        from ..graphql.core import (  # noqa: F401
+            dataloader_cache,
+            response_cache,
+            total_count,
+        )
+
+        from ..graphql.core.checks import check_shared_cache, check_sort_indexes
+
+        checks.register(check_sort_indexes, checks.Tags.models)
+        checks.register(check_shared_cache, checks.Tags.caches)
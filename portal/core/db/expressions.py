@@ -0,0 +1,45 @@
+from typing import Any, List, Sequence
+
+from django.db.models import BooleanField, F, Field, Func, Value
+
+
+class RowValueComparison(Func):
+    """Compare row values, e.g. `(name, slug) > ('Name', 'slug')`.
+
+    PostgreSQL compares row values lexicographically and can match them to
+    a composite index, unlike the equivalent tree of OR'ed conditions. Rows with
+    NULL in any of the compared columns never match.
+    """
+
+    conditional = True
+    output_field = BooleanField()
+    operators = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+    def __init__(
+        self,
+        fields: Sequence[str],
+        values: Sequence[Any],
+        lookup: str,
+        output_fields: List[Field],
+    ):
+        if lookup not in self.operators:
+            raise ValueError(f"Unsupported row value comparison: {lookup}.")
+        if not len(fields) == len(values) == len(output_fields):
+            raise ValueError("Row values must have the same length.")
+        self.lookup = lookup
+        expressions = [F(field) for field in fields] + [
+            Value(value, output_field=output_field)
+            for value, output_field in zip(values, output_fields)
+        ]
+        super().__init__(*expressions)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        size = len(self.source_expressions) // 2
+        sql_parts, params = [], []
+        for expression in self.source_expressions:
+            sql, expression_params = compiler.compile(expression)
+            sql_parts.append(sql)
+            params.extend(expression_params)
+        lhs = ", ".join(sql_parts[:size])
+        rhs = ", ".join(sql_parts[size:])
+        return f"({lhs}) {self.operators[self.lookup]} ({rhs})", params
@@ -0,0 +1,49 @@
+from django.db.models import CharField, Field, ForeignObject, Lookup, TextField
+from django.db.models.lookups import Contains
+
+
+class AnyLookup(Lookup):
+    """Match any of the values, e.g. `entry_id = ANY('{1,2,3}'::bigint[])`.
+
+    Unlike `__in`, the values are passed as a single array parameter, so the
+    statement doesn't grow with the number of values and PostgreSQL can reuse
+    its plan.
+    """
+
+    lookup_name = "any"
+    prepare_rhs = False
+
+    def get_db_prep_lookup(self, value, connection):
+        field = self.lhs.output_field
+        return (
+            "%s",
+            [[field.get_db_prep_value(item, connection) for item in value]],
+        )
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        db_type = self.lhs.output_field.cast_db_type(connection)
+        return f"{lhs_sql} = ANY({rhs_sql}::{db_type}[])", (*lhs_params, *rhs_params)
+
+
+class TrigramIContains(Contains):
+    """Case-insensitive containment, e.g. `document_number ILIKE '%1234%'`.
+
+    Unlike `__icontains`, which compares `UPPER(column)`, the column itself is
+    compared, so the lookup can use its `gin_trgm_ops` index.
+    """
+
+    lookup_name = "trigram_icontains"
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs_sql} ILIKE {rhs_sql}", (*lhs_params, *rhs_params)
+
+
+Field.register_lookup(AnyLookup)
+# Lookups of relations don't inherit the ones registered on `Field`.
+ForeignObject.register_lookup(AnyLookup)
+CharField.register_lookup(TrigramIContains)
+TextField.register_lookup(TrigramIContains)
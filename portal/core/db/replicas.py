@@ -0,0 +1,148 @@
+"""Routing of reads to replicas of the default database.
+
+Replicas and their weights are listed in `settings.DATABASE_REPLICAS`. Each
+worker process probes their replication lag at most once per
+`DATABASE_REPLICA_LAG_CHECK_INTERVAL`, and skips replicas lagging by more than
+`DATABASE_REPLICA_MAX_LAG` seconds or failing the probe. Reads fall back to the
+default database when no replica is available.
+
+Clients that ran a mutation get a cookie and a response header with the time
+until which their requests read from the default database.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError, connection, connections
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest, HttpResponseBase
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_STICKY_COOKIE = "read_primary_until"
+PRIMARY_STICKY_HEADER = "Read-Primary-Until"
+
+REPLICA_LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+
+def measure_replica_lag(name: str) -> Optional[float]:
+    """Return the replication lag of the replica in seconds, None if unknown."""
+    try:
+        with connections[name].cursor() as cursor:
+            cursor.execute(REPLICA_LAG_QUERY)
+            (lag,) = cursor.fetchone()
+    except DatabaseError:
+        logger.warning("Replica %s is unavailable.", name, exc_info=True)
+        connections[name].close()
+        return None
+    return None if lag is None else float(lag)
+
+
+class ReplicaLagProbe:
+    """Per-process cache of the replication lag of the replicas.
+
+    A single thread probes the replicas at a time; the others use the previous
+    measurement in the meantime, or skip replicas that were never measured.
+    """
+
+    def __init__(self):
+        self._lags: Dict[str, Tuple[float, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get_lag(self, name: str) -> Optional[float]:
+        checked_at, lag = self._lags.get(name, (None, None))
+        interval = settings.DATABASE_REPLICA_LAG_CHECK_INTERVAL
+        if checked_at is not None and time.monotonic() - checked_at < interval:
+            return lag
+        if not self._lock.acquire(blocking=False):
+            return lag
+        try:
+            lag = measure_replica_lag(name)
+            self._lags[name] = (time.monotonic(), lag)
+        finally:
+            self._lock.release()
+        return lag
+
+    def clear(self):
+        self._lags.clear()
+
+
+lag_probe = ReplicaLagProbe()
+
+
+def get_available_replicas() -> Dict[str, int]:
+    max_lag = settings.DATABASE_REPLICA_MAX_LAG
+    available = {}
+    for name, weight in settings.DATABASE_REPLICAS.items():
+        if weight <= 0:
+            continue
+        lag = lag_probe.get_lag(name)
+        if lag is not None and lag <= max_lag:
+            available[name] = weight
+    return available
+
+
+def choose_replica() -> str:
+    """Return a replica drawn by weight, or the default database if none is up."""
+    replicas = get_available_replicas()
+    if not replicas:
+        return settings.DATABASE_CONNECTION_DEFAULT_NAME
+    return random.choices(list(replicas), weights=list(replicas.values()))[0]
+
+
+def use_tenant_schema(name: str):
+    """Switch the connection to the schema used by the default connection.
+
+    `django_tenants` only sets the tenant of the default connection, both in
+    its middleware and in the data loader worker threads.
+    """
+    if name == settings.DATABASE_CONNECTION_DEFAULT_NAME:
+        return
+    tenant = getattr(connection, "tenant", None)
+    replica_connection = connections[name]
+    if tenant is None or not hasattr(replica_connection, "set_tenant"):
+        return
+    if replica_connection.tenant is not tenant:
+        replica_connection.set_tenant(tenant)
+
+
+def is_primary_sticky(request: "HttpRequest") -> bool:
+    value = request.COOKIES.get(PRIMARY_STICKY_COOKIE) or request.headers.get(
+        PRIMARY_STICKY_HEADER
+    )
+    if not value:
+        return False
+    try:
+        read_primary_until = float(value)
+    except ValueError:
+        return False
+    # Clients can't extend the window past the configured timeout.
+    now = time.time()
+    return now < read_primary_until <= now + settings.DATABASE_PRIMARY_STICKY_TIMEOUT
+
+
+def set_primary_sticky(response: "HttpResponseBase"):
+    timeout = settings.DATABASE_PRIMARY_STICKY_TIMEOUT
+    if not (settings.DATABASE_REPLICAS and timeout):
+        return
+    read_primary_until = str(int(time.time()) + timeout)
+    response[PRIMARY_STICKY_HEADER] = read_primary_until
+    response.set_cookie(
+        PRIMARY_STICKY_COOKIE,
+        read_primary_until,
+        max_age=timeout,
+        secure=settings.SESSION_COOKIE_SECURE,
+        httponly=True,
+        samesite="Lax",
+    )
@@ -1,13 +1,45 @@
 from typing import TYPE_CHECKING
 
 from django.conf import settings
+from django.db.models import QuerySet
+
+from .replicas import choose_replica, use_tenant_schema
 
 if TYPE_CHECKING:
     from django.http import HttpRequest
 
 
-def get_database_connection_name(context: "HttpRequest"):
-    is_mutation = getattr(context, "is_mutation", False)
-    if not is_mutation:
-        return settings.DATABASE_CONNECTION_REPLICA_NAME
-    return settings.DATABASE_CONNECTION_DEFAULT_NAME
+def get_database_connection_name(context: "HttpRequest") -> str:
+    """Return the database connection reads of the request should use.
+
+    Requests that executed a mutation, or whose client did shortly before,
+    don't allow the replica, so they read their own writes from the default
+    database. Other requests read from a single replica chosen on first use.
+    """
+    if not getattr(context, "allow_replica", True):
+        return settings.DATABASE_CONNECTION_DEFAULT_NAME
+    name = getattr(context, "replica_connection_name", None)
+    if name is None:
+        name = choose_replica()
+        context.replica_connection_name = name  # type: ignore[attr-defined]
+    use_tenant_schema(name)
+    return name
+
+
+def get_replica_connection_name() -> str:
+    """Return a replica connection for reads made outside of a request."""
+    name = choose_replica()
+    use_tenant_schema(name)
+    return name
+
+
+def is_cascade_delete(model, origin) -> bool:
+    """Return whether instances of the model are deleted by a cascade.
+
+    `origin` is the instance or queryset `delete()` was called on, as sent
+    with the `pre_delete` and `post_delete` signals.
+    """
+    if origin is None:
+        return False
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return origin_model is not model
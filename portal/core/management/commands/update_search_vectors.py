@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from django_tenants.utils import schema_context
+
+from portal.customer.models import Client
+from portal.document.models import Document
+from portal.document.search import update_documents_search_vector
+from portal.entry.models import Category, Entry
+from portal.entry.search import (
+    update_categories_search_vector,
+    update_entries_search_vector,
+)
+from portal.session.models import Session
+from portal.session.search import update_sessions_search_vector
+
+BATCH_SIZE = 1000
+
+SEARCH_VECTORS = [
+    (Entry, update_entries_search_vector),
+    (Category, update_categories_search_vector),
+    (Document, update_documents_search_vector),
+    (Session, update_sessions_search_vector),
+]
+
+
+def update_search_vectors(batch_size=BATCH_SIZE):
+    """Rebuild search vectors of all records, in batches of primary keys."""
+    for model, update_search_vector in SEARCH_VECTORS:
+        pks = list(model.objects.order_by("pk").values_list("pk", flat=True))
+        for start in range(0, len(pks), batch_size):
+            batch = pks[start : start + batch_size]
+            update_search_vector(model.objects.filter(pk__in=batch))
+
+
+class Command(BaseCommand):
+    help = "Rebuild search vectors of entries, categories, documents and sessions"
+
+    def handle(self, *args, **kwargs):
+        clients = Client.objects.exclude(schema_name="public")
+        for client in clients:
+            with schema_context(client.schema_name):
+                self.stdout.write(f"Updating search vectors of {client.schema_name}.")
+                update_search_vectors()
@@ -0,0 +1,58 @@
+from functools import reduce
+from operator import or_
+from typing import Sequence
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, Q, QuerySet
+from django.db.models.functions import Greatest
+
+
+class SearchMode:
+    FULL_TEXT = "full_text"
+    FUZZY = "fuzzy"
+
+    CHOICES = [
+        (FULL_TEXT, "Full-text search of words, ranked by relevance."),
+        (FUZZY, "Search of partial or misspelled values, ranked by similarity."),
+    ]
+
+
+def get_search_vector(*expressions, weight: str) -> SearchVector:
+    return SearchVector(*expressions, weight=weight, config=settings.SEARCH_CONFIG)
+
+
+def search_queryset(queryset: QuerySet, value: str) -> QuerySet:
+    """Filter the records matching the search and annotate their `search_rank`.
+
+    The records are matched by their `search_vector`, covered by a GIN index.
+    """
+    query = SearchQuery(value, search_type="websearch", config=settings.SEARCH_CONFIG)
+    return queryset.filter(search_vector=query).annotate(
+        search_rank=SearchRank(F("search_vector"), query)
+    )
+
+
+def fuzzy_search_queryset(
+    queryset: QuerySet, value: str, fields: Sequence[str]
+) -> QuerySet:
+    """Filter the records with fields containing or resembling the search.
+
+    The records are annotated with the `search_rank` of the most similar field.
+    Both lookups are covered by `gin_trgm_ops` indexes of the fields, provided
+    the search has at least three characters.
+    """
+    lookups = [
+        Q(**{f"{field}__trigram_icontains": value})
+        | Q(**{f"{field}__trigram_word_similar": value})
+        for field in fields
+    ]
+    ranks = [TrigramWordSimilarity(value, field) for field in fields]
+    return queryset.filter(reduce(or_, lookups)).annotate(
+        search_rank=Greatest(*ranks) if len(ranks) > 1 else ranks[0]
+    )
@@ -0,0 +1,134 @@
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from django.db import connection, connections
+from freezegun import freeze_time
+
+from ...graphql.tests.utils import get_graphql_content_from_response
+from ..db import replicas
+from ..db.replicas import (
+    PRIMARY_STICKY_COOKIE,
+    PRIMARY_STICKY_HEADER,
+    ReplicaLagProbe,
+    choose_replica,
+    measure_replica_lag,
+)
+from ..db.utils import get_database_connection_name
+
+QUERY_CHANNELS = "query { channels { slug } }"
+MUTATION_CHANNEL_DELETE = """
+    mutation {
+        channelDelete(id: "Q2hhbm5lbDox") {
+            errors {
+                field
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+def test_measure_replica_lag_of_primary_database():
+    assert measure_replica_lag("default") == 0
+
+
+def test_replica_lag_is_probed_once_per_interval(settings):
+    settings.DATABASE_REPLICA_LAG_CHECK_INTERVAL = 5
+    probe = ReplicaLagProbe()
+
+    with mock.patch.object(
+        replicas, "measure_replica_lag", side_effect=[1.5, 0.5]
+    ) as measure_replica_lag:
+        with freeze_time("2024-01-01 12:00:00") as frozen_time:
+            assert probe.get_lag("replica") == 1.5
+            assert probe.get_lag("replica") == 1.5
+            frozen_time.tick(6)
+            assert probe.get_lag("replica") == 0.5
+
+    assert measure_replica_lag.call_count == 2
+
+
+def test_choose_replica_skips_lagging_and_unavailable_replicas(settings):
+    settings.DATABASE_REPLICAS = {"lagging": 5, "down": 5, "disabled": 0, "up": 1}
+    settings.DATABASE_REPLICA_MAX_LAG = 5
+    lags = {"lagging": 30.0, "down": None, "disabled": 0.0, "up": 1.0}
+
+    with mock.patch.object(replicas.lag_probe, "get_lag", side_effect=lags.get):
+        assert {choose_replica() for _ in range(20)} == {"up"}
+
+
+def test_choose_replica_by_weight(settings):
+    settings.DATABASE_REPLICAS = {"replica_1": 1, "replica_2": 3}
+
+    with mock.patch.object(replicas.lag_probe, "get_lag", return_value=0.0):
+        with mock.patch.object(
+            replicas.random, "choices", return_value=["replica_2"]
+        ) as choices:
+            assert choose_replica() == "replica_2"
+
+    choices.assert_called_once_with(["replica_1", "replica_2"], weights=[1, 3])
+
+
+def test_choose_replica_falls_back_to_primary_database(settings):
+    settings.DATABASE_REPLICAS = {"replica": 1}
+    settings.DATABASE_REPLICA_MAX_LAG = 5
+
+    with mock.patch.object(replicas.lag_probe, "get_lag", return_value=60.0):
+        assert choose_replica() == "default"
+
+
+def test_replica_reads_use_tenant_schema(replica_database):
+    context = SimpleNamespace(allow_replica=True)
+
+    name = get_database_connection_name(context)
+
+    assert name == replica_database
+    assert context.replica_connection_name == replica_database
+    assert connections[name].tenant is connection.tenant
+
+
+def test_requests_not_allowing_replica_read_from_primary(replica_database):
+    context = SimpleNamespace(allow_replica=False)
+
+    assert get_database_connection_name(context) == "default"
+
+
+@pytest.mark.django_db
+def test_mutation_makes_client_read_from_primary(
+    api_client, replica_database, settings
+):
+    settings.DATABASE_PRIMARY_STICKY_TIMEOUT = 10
+
+    response = api_client.post({"query": MUTATION_CHANNEL_DELETE})
+
+    get_graphql_content_from_response(response)
+    read_primary_until = int(response[PRIMARY_STICKY_HEADER])
+    assert 0 < read_primary_until - time.time() <= 10
+    assert response.cookies[PRIMARY_STICKY_COOKIE].value == str(read_primary_until)
+    assert response.cookies[PRIMARY_STICKY_COOKIE]["max-age"] == 10
+
+
+@pytest.mark.django_db
+def test_queries_dont_make_client_read_from_primary(api_client, replica_database):
+    response = api_client.post({"query": QUERY_CHANNELS})
+
+    get_graphql_content_from_response(response)
+    assert PRIMARY_STICKY_HEADER not in response
+    assert PRIMARY_STICKY_COOKIE not in response.cookies
+
+
+@pytest.mark.parametrize(
+    ("offset", "is_sticky"), [(5, True), (-1, False), (3600, False)]
+)
+def test_is_primary_sticky(rf, settings, offset, is_sticky):
+    settings.DATABASE_PRIMARY_STICKY_TIMEOUT = 10
+    value = str(time.time() + offset)
+
+    cookie_request = rf.get("/")
+    cookie_request.COOKIES[PRIMARY_STICKY_COOKIE] = value
+    header_request = rf.get("/", HTTP_READ_PRIMARY_UNTIL=value)
+
+    assert replicas.is_primary_sticky(cookie_request) is is_sticky
+    assert replicas.is_primary_sticky(header_request) is is_sticky
@@ -0,0 +1,119 @@
+import pytest
+from django.db import connection
+
+from ...attribute.utils import associate_attribute_values_to_instance
+from ...document.models import Document
+from ...entry.models import Category, Entry
+from ...session.models import Session
+from ..management.commands.update_search_vectors import update_search_vectors
+from ..search import fuzzy_search_queryset, search_queryset
+
+pytestmark = pytest.mark.django_db
+
+
+def _search(model, value):
+    return list(search_queryset(model.objects.all(), value))
+
+
+def test_entry_search_vector_is_updated_on_save(vehicle):
+    assert _search(Entry, "vehicle@email.com") == [vehicle]
+    assert _search(Entry, "123456789") == [vehicle]
+
+    vehicle.name = "Truck"
+    vehicle.save()
+
+    assert _search(Entry, "truck") == [vehicle]
+    assert _search(Entry, "vehicle") == []
+
+
+def test_entry_search_vector_contains_attribute_values(vehicle, color_attribute):
+    red = color_attribute.values.get(slug="red")
+
+    associate_attribute_values_to_instance(vehicle, color_attribute, red)
+    assert _search(Entry, "red") == [vehicle]
+
+    red.name = "Crimson"
+    red.save()
+    assert _search(Entry, "crimson") == [vehicle]
+
+    vehicle.attributevalues.all().delete()
+    assert _search(Entry, "crimson") == []
+
+
+def test_deleting_attribute_value_updates_search_vectors(vehicle_list, color_attribute):
+    red = color_attribute.values.get(slug="red")
+    for vehicle in vehicle_list:
+        associate_attribute_values_to_instance(vehicle, color_attribute, red)
+    assert len(_search(Entry, "red")) == len(vehicle_list)
+
+    red.delete()
+
+    assert _search(Entry, "red") == []
+
+
+def test_search_rank_weights_names_first():
+    by_document_number = Entry.objects.create(
+        name="Provider", slug="provider", document_number="truck-42"
+    )
+    by_name = Entry.objects.create(name="Truck", slug="truck", document_number="7")
+
+    results = search_queryset(Entry.objects.all(), "truck").order_by("-search_rank")
+
+    assert list(results) == [by_name, by_document_number]
+
+
+def test_document_search_vector(vehicle):
+    document = Document.objects.create(
+        name="License", description="Operating permit", entry=vehicle
+    )
+
+    assert _search(Document, "permit") == [document]
+
+
+def test_session_search_vector_contains_content_text(channel_city_1):
+    session = Session.objects.create(
+        name="Session",
+        slug="session",
+        date="2024-01-01T12:00:00Z",
+        channel=channel_city_1,
+        content={
+            "blocks": [
+                {"type": "paragraph", "data": {"text": "Budget <b>hearing</b>"}},
+                {"type": "list", "data": {"items": ["Roads", "Schools"]}},
+            ]
+        },
+    )
+
+    assert _search(Session, "hearing") == [session]
+    assert _search(Session, "schools") == [session]
+
+
+def test_update_search_vectors_backfills_records(category_list, vehicle):
+    Category.objects.update(search_vector=None)
+    Entry.objects.update(search_vector=None)
+
+    update_search_vectors(batch_size=2)
+
+    assert _search(Category, "category 2") == [category_list[1]]
+    assert _search(Entry, "vehicle") == [vehicle]
+
+
+@pytest.mark.usefixtures("pg_trgm")
+@pytest.mark.parametrize("search", ["56789", "Vehicle"])
+def test_fuzzy_search_uses_trigram_indexes(vehicle_list, search):
+    entries = fuzzy_search_queryset(
+        Entry.objects.all(), search, ["name", "document_number", "email"]
+    )
+
+    with connection.cursor() as cursor:
+        # The tables are too small for the planner to prefer the bitmap scans.
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute("SET LOCAL enable_indexscan = off")
+        plan = entries.explain()
+
+    for index in [
+        "entry_name_trgm_idx",
+        "entry_document_number_trgm_idx",
+        "entry_email_trgm_idx",
+    ]:
+        assert index in plan
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("customer", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="client",
+            name="graphql_query_cost_limit",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="Maximum cost of a single GraphQL query. Leave empty to use the default limit.",
+                null=True,
+            ),
+        ),
+    ]
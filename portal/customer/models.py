@@ -5,6 +5,12 @@ from django_tenants.models import DomainMixin, TenantMixin
 class Client(TenantMixin):
     name = models.CharField(max_length=100)
     created = models.DateField(auto_now_add=True)
+    graphql_query_cost_limit = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Maximum cost of a single GraphQL query. "
+        "Leave empty to use the default limit.",
+    )
     auto_create_schema = True
 
 
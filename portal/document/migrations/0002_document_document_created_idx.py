@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("document", "0001_initial"),
+        ("entry", "0002_category_category_name_slug_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="document",
+            index=models.Index(fields=["created"], name="document_created_idx"),
+        ),
+    ]
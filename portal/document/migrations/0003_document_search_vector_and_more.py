@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:59
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("document", "0002_document_document_created_idx"),
+        ("entry", "0003_category_search_vector_entry_search_vector_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="document",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="document",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="document_search_vector_idx"
+            ),
+        ),
+    ]
@@ -1,5 +1,7 @@
 import os
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.dispatch import receiver
 from django_tenants.utils import parse_tenant_config_path
@@ -43,9 +45,14 @@ class Document(ModelWithDates, PublishableModel):
         choices=DocumentLoadOptions.CHOICES,
         default=DocumentLoadOptions.EMPTY,
     )
+    search_vector = SearchVectorField(blank=True, null=True)
 
     class Meta:
         ordering = ["-created"]
+        indexes = [
+            models.Index(fields=["created"], name="document_created_idx"),
+            GinIndex(fields=["search_vector"], name="document_search_vector_idx"),
+        ]
         permissions = (
             (DocumentPermissions.MANAGE_DOCUMENTS.codename, "Manage documents."),
         )
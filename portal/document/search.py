@@ -0,0 +1,20 @@
+from django.db import models
+from django.db.models import QuerySet
+from django.dispatch import receiver
+
+from ..core.search import get_search_vector
+from .models import Document
+
+
+def update_documents_search_vector(documents: QuerySet):
+    documents.order_by().update(
+        search_vector=get_search_vector("name", weight="A")
+        + get_search_vector("description", weight="B")
+    )
+
+
+@receiver(models.signals.post_save, sender=Document)
+def update_document_search_vector(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    update_documents_search_vector(Document.objects.filter(pk=instance.pk))
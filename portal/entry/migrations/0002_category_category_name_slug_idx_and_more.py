@@ -0,0 +1,39 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("entry", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(fields=["name", "slug"], name="category_name_slug_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=models.Index(fields=["name", "slug"], name="entry_name_slug_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=models.Index(
+                fields=["updated", "name", "slug"], name="entry_updated_name_slug_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=models.Index(
+                fields=["created", "name", "slug"], name="entry_created_name_slug_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="entrytype",
+            index=models.Index(
+                fields=["name", "slug"], name="entry_type_name_slug_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:59
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("entry", "0002_category_category_name_slug_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="entry",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="category_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="entry_search_vector_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.15 on 2026-10-18 21:05
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("entry", "0003_category_search_vector_entry_search_vector_and_more"),
+    ]
+
+    operations = [
+        # Extensions are shared by the tenant schemas, so it's created in the
+        # public schema, which is on the search path of all of them.
+        migrations.RunSQL(
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public",
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="entry_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["document_number"],
+                name="entry_document_number_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["email"],
+                name="entry_email_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
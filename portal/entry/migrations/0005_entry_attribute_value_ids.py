@@ -0,0 +1,45 @@
+# Generated by Django 5.1.15 on 2026-10-18 21:08
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import migrations, models
+from django.db.models import OuterRef
+
+
+def populate_attribute_value_ids(apps, schema_editor):
+    AssignedEntryAttributeValue = apps.get_model(
+        "attribute", "AssignedEntryAttributeValue"
+    )
+    Entry = apps.get_model("entry", "Entry")
+    value_ids = (
+        AssignedEntryAttributeValue.objects.filter(entry_id=OuterRef("pk"))
+        .order_by("value_id")
+        .values("value_id")
+    )
+    Entry.objects.update(attribute_value_ids=ArraySubquery(value_ids))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attribute", "0003_entry_attribute_sort_key"),
+        ("entry", "0004_entry_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="entry",
+            name="attribute_value_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.BigIntegerField(), blank=True, default=list, size=None
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["attribute_value_ids"], name="entry_attribute_value_ids_idx"
+            ),
+        ),
+        migrations.RunPython(populate_attribute_value_ids, migrations.RunPython.noop),
+    ]
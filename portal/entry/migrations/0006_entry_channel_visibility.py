@@ -0,0 +1,79 @@
+# Generated by Django 5.1.15 on 2026-10-18 21:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_channel_visibilities(apps, schema_editor):
+    EntryChannelListing = apps.get_model("entry", "EntryChannelListing")
+    EntryChannelVisibility = apps.get_model("entry", "EntryChannelVisibility")
+    rows = EntryChannelListing.objects.order_by().values_list(
+        "entry_id", "channel_id", "channel__slug", "is_published", "channel__is_active"
+    )
+    EntryChannelVisibility.objects.bulk_create(
+        (
+            EntryChannelVisibility(
+                entry_id=entry_id,
+                channel_id=channel_id,
+                channel_slug=channel_slug,
+                is_published=is_published and is_active,
+            )
+            for entry_id, channel_id, channel_slug, is_published, is_active in (
+                rows.iterator()
+            )
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("channel", "0001_initial"),
+        ("entry", "0005_entry_attribute_value_ids"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EntryChannelVisibility",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("channel_slug", models.SlugField(db_index=False, max_length=255)),
+                ("is_published", models.BooleanField()),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="channel.channel",
+                    ),
+                ),
+                (
+                    "entry",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="channel_visibilities",
+                        to="entry.entry",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["channel_slug", "is_published", "entry"],
+                        name="entry_channel_visibility_idx",
+                    )
+                ],
+                "unique_together": {("entry", "channel")},
+            },
+        ),
+        migrations.RunPython(populate_channel_visibilities, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,12 @@
+from typing import Union
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
-from django.db.models import Exists, OuterRef, Q
+from django.db import models, transaction
+from django.db.models import Exists, F, FilteredRelation, OuterRef, Q, TextField, Value
+from django.dispatch import receiver
 
 from ..channel.models import Channel
 from ..core.models import ModelWithDates, ModelWithSlug, PublishableModel
@@ -10,6 +16,9 @@ from ..core.permissions import EntryPermissions
 class EntryType(ModelWithSlug):
     class Meta:
         ordering = ["slug"]
+        indexes = [
+            models.Index(fields=["name", "slug"], name="entry_type_name_slug_idx"),
+        ]
         permissions = (
             (EntryPermissions.MANAGE_ENTRY_TYPES.codename, "Manage entry types."),
         )
@@ -17,14 +26,10 @@ class EntryType(ModelWithSlug):
 
 class EntryQueryset(models.QuerySet):
     def published(self, channel_slug: str):
-        channels = Channel.objects.filter(
-            slug=str(channel_slug), is_active=True
-        ).values("id")
-        channel_listings = EntryChannelListing.objects.filter(
-            Exists(channels.filter(pk=OuterRef("channel_id"))),
-            is_published=True,
-        ).values("id")
-        return self.filter(Exists(channel_listings.filter(entry_id=OuterRef("pk"))))
+        visibilities = EntryChannelVisibility.objects.filter(
+            channel_slug=str(channel_slug), is_published=True
+        )
+        return self.filter(Exists(visibilities.filter(entry_id=OuterRef("pk"))))
 
     def not_published(self, channel_slug: str):
         return self.annotate_publication_info(channel_slug).filter(
@@ -34,16 +39,36 @@ class EntryQueryset(models.QuerySet):
     def visible_to_user(self, user, channel_slug: str):
         if user:
             if channel_slug:
-                channels = Channel.objects.filter(slug=str(channel_slug)).values("id")
-                channel_listings = EntryChannelListing.objects.filter(
-                    Exists(channels.filter(pk=OuterRef("channel_id")))
-                ).values("id")
-                return self.filter(
-                    Exists(channel_listings.filter(entry_id=OuterRef("pk")))
+                visibilities = EntryChannelVisibility.objects.filter(
+                    channel_slug=str(channel_slug)
                 )
+                return self.filter(Exists(visibilities.filter(entry_id=OuterRef("pk"))))
             return self.all()
         return self.published(channel_slug)
 
+    def sort_by_attribute(self, attribute_pk: Union[int, str], descending=False):
+        """Sort entries by their values of the attribute.
+
+        Values are read from the precomputed sort keys, joined by the indexed
+        (attribute, entry) pair. Entries without the attribute are sorted
+        after the others in ascending order.
+        """
+        qs = self
+        if str(attribute_pk).isnumeric():
+            qs = qs.annotate(
+                attribute_sort=FilteredRelation(
+                    "attribute_sort_keys",
+                    condition=Q(attribute_sort_keys__attribute_id=attribute_pk),
+                ),
+                attribute_sort_key=F("attribute_sort__sort_key"),
+            )
+        else:
+            qs = qs.annotate(attribute_sort_key=Value(None, output_field=TextField()))
+        direction = "-" if descending else ""
+        return qs.order_by(
+            *[f"{direction}{field}" for field in self.model.sort_by_attribute_fields()]
+        )
+
 
 EntryManager = models.Manager.from_queryset(EntryQueryset)
 
@@ -59,16 +84,50 @@ class Entry(ModelWithDates, ModelWithSlug):
     document_number = models.CharField(max_length=256)
     document_file = models.FileField(upload_to="entry", blank=True)
     email = models.CharField(max_length=258)
+    search_vector = SearchVectorField(blank=True, null=True)
+    # IDs of the assigned attribute values, denormalized for filtering entries
+    # by several attributes with a single indexed array predicate.
+    attribute_value_ids = ArrayField(models.BigIntegerField(), blank=True, default=list)
 
     objects = EntryManager()
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["name", "slug"], name="entry_name_slug_idx"),
+            models.Index(
+                fields=["updated", "name", "slug"], name="entry_updated_name_slug_idx"
+            ),
+            models.Index(
+                fields=["created", "name", "slug"], name="entry_created_name_slug_idx"
+            ),
+            GinIndex(fields=["search_vector"], name="entry_search_vector_idx"),
+            GinIndex(
+                fields=["attribute_value_ids"], name="entry_attribute_value_ids_idx"
+            ),
+            GinIndex(
+                fields=["name"], name="entry_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+            GinIndex(
+                fields=["document_number"],
+                name="entry_document_number_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["email"],
+                name="entry_email_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
         permissions = ((EntryPermissions.MANAGE_ENTRIES.codename, "Manage entries."),)
 
     def __str__(self):
         return self.name
 
+    @staticmethod
+    def sort_by_attribute_fields() -> list:
+        return ["attribute_sort_key", "name", "slug"]
+
 
 class EntryChannelListing(PublishableModel):
     entry = models.ForeignKey(
@@ -92,6 +151,82 @@ class EntryChannelListing(PublishableModel):
         ordering = ("pk",)
 
 
+class EntryChannelVisibilityQueryset(models.QuerySet):
+    def refresh(self, entry_ids=None, channel_ids=None):
+        """Recompute visibilities of the entries in the channels from their listings.
+
+        Entries are published in a channel when their listing is published and
+        the channel is active. Visibilities are upserted so that concurrent
+        refreshes do not conflict, and only those without a listing are deleted.
+        """
+        listings = EntryChannelListing.objects.all()
+        visibilities = self.all()
+        if entry_ids is not None:
+            listings = listings.filter(entry_id__in=entry_ids)
+            visibilities = visibilities.filter(entry_id__in=entry_ids)
+        if channel_ids is not None:
+            listings = listings.filter(channel_id__in=channel_ids)
+            visibilities = visibilities.filter(channel_id__in=channel_ids)
+
+        rows = listings.order_by().values_list(
+            "entry_id",
+            "channel_id",
+            "channel__slug",
+            "is_published",
+            "channel__is_active",
+        )
+        listed = EntryChannelListing.objects.filter(
+            entry_id=OuterRef("entry_id"), channel_id=OuterRef("channel_id")
+        )
+        with transaction.atomic():
+            self.bulk_create(
+                (
+                    self.model(
+                        entry_id=entry_id,
+                        channel_id=channel_id,
+                        channel_slug=slug,
+                        is_published=is_published and is_active,
+                    )
+                    for entry_id, channel_id, slug, is_published, is_active in rows
+                ),
+                update_conflicts=True,
+                unique_fields=["entry", "channel"],
+                update_fields=["channel_slug", "is_published"],
+            )
+            visibilities.exclude(Exists(listed)).delete()
+
+
+EntryChannelVisibilityManager = models.Manager.from_queryset(
+    EntryChannelVisibilityQueryset
+)
+
+
+class EntryChannelVisibility(models.Model):
+    """Channel listings of entries denormalized for filtering visible entries.
+
+    Entries are filtered by the slug of the channel with a single semi-join
+    covered by the index, instead of joining the listings with the channels.
+    """
+
+    entry = models.ForeignKey(
+        Entry, related_name="channel_visibilities", on_delete=models.CASCADE
+    )
+    channel = models.ForeignKey(Channel, related_name="+", on_delete=models.CASCADE)
+    channel_slug = models.SlugField(max_length=255, db_index=False)
+    is_published = models.BooleanField()
+
+    objects = EntryChannelVisibilityManager()
+
+    class Meta:
+        unique_together = (("entry", "channel"),)
+        indexes = [
+            models.Index(
+                fields=["channel_slug", "is_published", "entry"],
+                name="entry_channel_visibility_idx",
+            ),
+        ]
+
+
 class Category(ModelWithDates, ModelWithSlug):
     entries = models.ManyToManyField(
         Entry,
@@ -100,9 +235,14 @@ class Category(ModelWithDates, ModelWithSlug):
         related_name="categories",
         through_fields=("category", "entry"),
     )
+    search_vector = SearchVectorField(blank=True, null=True)
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["name", "slug"], name="category_name_slug_idx"),
+            GinIndex(fields=["search_vector"], name="category_search_vector_idx"),
+        ]
         permissions = (
             (EntryPermissions.MANAGE_CATEGORIES.codename, "Manage categories."),
         )
@@ -130,3 +270,19 @@ class Consult(ModelWithDates):
 
     class Meta:
         ordering = ["-created"]
+
+
+@receiver(models.signals.post_save, sender=EntryChannelListing)
+@receiver(models.signals.post_delete, sender=EntryChannelListing)
+def refresh_listing_visibility(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    EntryChannelVisibility.objects.refresh([instance.entry_id], [instance.channel_id])
+
+
+@receiver(models.signals.post_save, sender=Channel)
+def refresh_channel_visibilities(sender, instance, created, raw, **kwargs):
+    # Refresh the slug and the publication of the entries of the channel.
+    if created or raw:
+        return
+    EntryChannelVisibility.objects.refresh(channel_ids=[instance.pk])
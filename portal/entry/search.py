@@ -0,0 +1,77 @@
+from django.contrib.postgres.aggregates import StringAgg
+from django.db import models
+from django.db.models import OuterRef, QuerySet, Subquery
+from django.dispatch import receiver
+
+from ..attribute.models import AssignedEntryAttributeValue, AttributeValue
+from ..core.db.utils import is_cascade_delete
+from ..core.search import get_search_vector
+from .models import Category, Entry
+
+
+def prepare_entry_search_vector():
+    attribute_value_names = (
+        AssignedEntryAttributeValue.objects.filter(entry_id=OuterRef("pk"))
+        .order_by()
+        .values("entry_id")
+        .annotate(names=StringAgg("value__name", delimiter=" "))
+        .values("names")
+    )
+    return (
+        get_search_vector("name", weight="A")
+        + get_search_vector("document_number", "email", weight="B")
+        + get_search_vector(Subquery(attribute_value_names), weight="C")
+    )
+
+
+def update_entries_search_vector(entries: QuerySet):
+    """Rebuild search vectors of the entries in a single query."""
+    entries.order_by().update(search_vector=prepare_entry_search_vector())
+
+
+def update_categories_search_vector(categories: QuerySet):
+    categories.order_by().update(search_vector=get_search_vector("name", weight="A"))
+
+
+@receiver(models.signals.post_save, sender=Entry)
+def update_entry_search_vector(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    update_entries_search_vector(Entry.objects.filter(pk=instance.pk))
+
+
+@receiver(models.signals.post_save, sender=Category)
+def update_category_search_vector(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    update_categories_search_vector(Category.objects.filter(pk=instance.pk))
+
+
+@receiver(models.signals.post_save, sender=AssignedEntryAttributeValue)
+@receiver(models.signals.post_delete, sender=AssignedEntryAttributeValue)
+def update_assigned_value_search_vector(
+    sender, instance, raw=False, origin=None, **kwargs
+):
+    # Values deleted by a cascade update the search vectors of all their
+    # entries at once.
+    if raw or is_cascade_delete(sender, origin):
+        return
+    update_entries_search_vector(Entry.objects.filter(pk=instance.entry_id))
+
+
+@receiver(models.signals.post_save, sender=AttributeValue)
+def update_attribute_value_search_vectors(sender, instance, created, raw, **kwargs):
+    if created or raw:
+        return
+    entry_ids = AssignedEntryAttributeValue.objects.filter(value_id=instance.pk).values(
+        "entry_id"
+    )
+    update_entries_search_vector(Entry.objects.filter(pk__in=entry_ids))
+
+
+@receiver(models.signals.post_delete, sender=AttributeValue)
+def update_deleted_attribute_value_search_vectors(sender, instance, **kwargs):
+    # Entries of the value are collected by the attribute models' pre_delete.
+    entry_ids = getattr(instance, "_assigned_entry_ids", None)
+    if entry_ids:
+        update_entries_search_vector(Entry.objects.filter(pk__in=entry_ids))
@@ -0,0 +1,85 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ..models import Entry, EntryChannelListing, EntryChannelVisibility
+
+pytestmark = pytest.mark.django_db
+
+
+def _get_visibilities(entry):
+    return list(
+        EntryChannelVisibility.objects.filter(entry=entry).values_list(
+            "channel_slug", "is_published"
+        )
+    )
+
+
+def test_listing_changes_update_visibility(vehicle, channel_city_1):
+    listing = EntryChannelListing.objects.create(
+        entry=vehicle, channel=channel_city_1, is_published=False
+    )
+    assert _get_visibilities(vehicle) == [(channel_city_1.slug, False)]
+
+    listing.is_published = True
+    listing.save(update_fields=["is_published"])
+    assert _get_visibilities(vehicle) == [(channel_city_1.slug, True)]
+
+    listing.delete()
+    assert _get_visibilities(vehicle) == []
+
+
+def test_channel_changes_update_visibilities(vehicle, channel_city_1):
+    EntryChannelListing.objects.create(
+        entry=vehicle, channel=channel_city_1, is_published=True
+    )
+
+    channel_city_1.is_active = False
+    channel_city_1.slug = "renamed"
+    channel_city_1.save(update_fields=["is_active", "slug"])
+
+    assert _get_visibilities(vehicle) == [("renamed", False)]
+
+
+def test_refresh_updates_visibilities_in_place(vehicle, channel_city_1, channel_city_2):
+    listing = EntryChannelListing.objects.create(
+        entry=vehicle, channel=channel_city_1, is_published=False
+    )
+    stale = EntryChannelVisibility.objects.create(
+        entry=vehicle,
+        channel=channel_city_2,
+        channel_slug=channel_city_2.slug,
+        is_published=True,
+    )
+    visibility = EntryChannelVisibility.objects.get(channel=channel_city_1)
+    EntryChannelListing.objects.filter(pk=listing.pk).update(is_published=True)
+
+    EntryChannelVisibility.objects.refresh([vehicle.pk])
+
+    assert EntryChannelVisibility.objects.get(pk=visibility.pk).is_published
+    assert not EntryChannelVisibility.objects.filter(pk=stale.pk).exists()
+
+
+def test_published_and_visible_entries(
+    vehicle_list, channel_city_1, channel_city_2, staff_user
+):
+    vehicle_1, vehicle_2, vehicle_3 = vehicle_list
+    EntryChannelListing.objects.create(
+        entry=vehicle_1, channel=channel_city_1, is_published=True
+    )
+    EntryChannelListing.objects.create(
+        entry=vehicle_2, channel=channel_city_1, is_published=False
+    )
+    EntryChannelListing.objects.create(
+        entry=vehicle_3, channel=channel_city_2, is_published=True
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        published = list(Entry.objects.published(channel_city_1.slug))
+    visible = Entry.objects.visible_to_user(staff_user, channel_city_1.slug)
+
+    assert published == [vehicle_1]
+    assert list(visible) == [vehicle_1, vehicle_2]
+    sql = queries.captured_queries[-1]["sql"]
+    assert "entry_entrychannelvisibility" in sql
+    assert "channel_channel" not in sql
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("document", "0002_document_document_created_idx"),
+        ("event", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["date"], name="event_date_idx"),
+        ),
+    ]
@@ -38,6 +38,9 @@ class Event(models.Model):
 
     class Meta:
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["date"], name="event_date_idx"),
+        ]
         permissions = ((EventPermissions.MANAGE_EVENTS.codename, "Manage events."),)
 
     def __repr__(self):
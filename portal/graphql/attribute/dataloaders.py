@@ -6,11 +6,12 @@ from ..core.dataloaders import DataLoader
 
 class AttributeValuesByAttributeIdLoader(DataLoader):
     context_key = "attributevalues_by_attribute"
+    shared_cache_models = (AttributeValue,)
 
     def batch_load(self, keys):
         attribute_values = AttributeValue.objects.using(
             self.database_connection_name
-        ).filter(attribute_id__in=keys)
+        ).filter(attribute_id__any=keys)
         attribute_to_attributevalues = defaultdict(list)
         for attribute_value in attribute_values.iterator():
             attribute_to_attributevalues[attribute_value.attribute_id].append(
@@ -21,6 +22,7 @@ class AttributeValuesByAttributeIdLoader(DataLoader):
 
 class AttributesByAttributeId(DataLoader):
     context_key = "attributes_by_id"
+    shared_cache_models = (Attribute,)
 
     def batch_load(self, keys):
         attributes = Attribute.objects.using(self.database_connection_name).in_bulk(
@@ -4,6 +4,7 @@ from ..core.dataloaders import DataLoader
 
 class ChannelByIdLoader(DataLoader):
     context_key = "channel_by_id"
+    shared_cache_models = (Channel,)
 
     def batch_load(self, keys):
         channels = Channel.objects.using(self.database_connection_name).in_bulk(keys)
@@ -17,6 +17,7 @@ def get_context_value(request: HttpRequest) -> PortalContext:
     request.dataloaders = {}
     request.allow_replica = getattr(request, "allow_replica", True)
     request.request_time = timezone.now()
+    request.total_count_strategies = []
     set_auth_on_context(request)
     set_decoded_auth_token(request)
     return request
@@ -0,0 +1,48 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    with _executors_lock:
+        if name not in _executors:
+            _executors[name] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=name
+            )
+    return _executors[name]
+
+
+def get_batch_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool used to run batched operations concurrently.
+
+    Every worker thread holds its own database connection, so the pool size
+    bounds the number of extra connections a process can open.
+    """
+    return _get_executor("graphql-batch", settings.GRAPHQL_BATCH_CONCURRENCY)
+
+
+def get_dataloader_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool used to run `AsyncDataLoader` batch loads."""
+    return _get_executor("graphql-dataloader", settings.GRAPHQL_DATALOADER_CONCURRENCY)
+
+
+def call_with_tenant_connection(tenant, func: Callable, *args, **kwargs) -> Any:
+    """Call the function in a worker thread using the tenant's database schema.
+
+    Connections of worker threads are not managed by the request cycle, so the
+    expired ones are closed before and after each call, the same way Django
+    does it for every request.
+    """
+    close_old_connections()
+    try:
+        if tenant is not None and hasattr(connection, "set_tenant"):
+            connection.set_tenant(tenant)
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
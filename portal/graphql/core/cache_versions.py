@@ -0,0 +1,84 @@
+import time
+from functools import partial
+from typing import Dict, Iterable
+
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from ... import __version__ as portal_version
+
+
+def get_schema_name() -> str:
+    return getattr(connection, "schema_name", "public")
+
+
+def get_cache_version_key(namespace: str, schema_name: str) -> str:
+    return f"{portal_version}-{namespace}-version-{schema_name}"
+
+
+def get_new_cache_version() -> int:
+    # Versions start from the current time, so a version evicted from the cache
+    # isn't reused by keys stored before the eviction.
+    return time.time_ns() // 1000
+
+
+def add_cache_version(key: str) -> int:
+    version = get_new_cache_version()
+    if not cache.add(key, version, timeout=None):
+        version = cache.get(key, version)
+    return version
+
+
+def get_cache_version(namespace: str, schema_name: str) -> int:
+    """Return the version of the tenant's cache namespace.
+
+    The version is a part of the keys stored in the namespace, so bumping it
+    invalidates all of them at once.
+    """
+    key = get_cache_version_key(namespace, schema_name)
+    version = cache.get(key)
+    if version is None:
+        version = add_cache_version(key)
+    return version
+
+
+def get_cache_versions(namespaces: Iterable[str], schema_name: str) -> Dict[str, int]:
+    """Return versions of the tenant's cache namespaces with a single lookup."""
+    keys = {
+        get_cache_version_key(namespace, schema_name): namespace
+        for namespace in namespaces
+    }
+    found = cache.get_many(keys)
+    versions = {}
+    for key, namespace in keys.items():
+        version = found.get(key)
+        if version is None:
+            version = add_cache_version(key)
+        versions[namespace] = version
+    return versions
+
+
+def invalidate_cache_version(namespace: str, schema_name: str):
+    key = get_cache_version_key(namespace, schema_name)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, get_new_cache_version(), timeout=None)
+
+
+def invalidate_cache_version_on_commit(namespace: str):
+    schema_name = get_schema_name()
+    invalidate = partial(invalidate_cache_version, namespace, schema_name)
+    # Deleting or saving many rows sends a signal for each of them, but the
+    # version only needs to be bumped once per transaction. Callbacks of rolled
+    # back savepoints are discarded, so they don't hide later invalidations.
+    for _, callback, _ in connection.run_on_commit:
+        if (
+            isinstance(callback, partial)
+            and callback.func is invalidate_cache_version
+            and callback.args == invalidate.args
+        ):
+            return
+    # Invalidating before the commit would let concurrent requests cache the
+    # old rows again.
+    transaction.on_commit(invalidate)
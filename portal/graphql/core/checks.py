@@ -0,0 +1,201 @@
+from typing import Iterator, List, NamedTuple, Optional, Type
+
+import graphene
+from django.conf import settings
+from django.contrib.postgres.indexes import BTreeIndex, PostgresIndex
+from django.core import checks
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, UniqueConstraint
+from graphene.relay import Connection
+
+from ..utils.sorting import get_model_default_ordering
+from .total_count import EXACT
+from .types.sort_input import SortInputObjectType
+
+# Cache backends storing the values in the memory of each process.
+PROCESS_CACHE_BACKENDS = ["django.core.cache.backends.locmem.LocMemCache"]
+
+
+class SortOrder(NamedTuple):
+    label: str
+    model: Type[Model]
+    fields: List[str]
+
+
+def _unwrap_type(field_type):
+    while isinstance(field_type, (graphene.NonNull, graphene.List)) or (
+        isinstance(field_type, type)
+        and issubclass(field_type, (graphene.NonNull, graphene.List))
+    ):
+        field_type = field_type.of_type
+    return field_type
+
+
+def _get_connection_model(field_type) -> Optional[Type[Model]]:
+    field_type = _unwrap_type(field_type)
+    if not (isinstance(field_type, type) and issubclass(field_type, Connection)):
+        return None
+    return getattr(field_type._meta.node._meta, "model", None)
+
+
+def get_connection_sort_orders(schema) -> Iterator[SortOrder]:
+    """Yield orderings used to paginate the connection fields of the schema.
+
+    Each connection is paginated by the default ordering of its model and by
+    every value of its `sortBy` enum, except values sorted by a custom
+    annotation (`qs_with_<value>`), which can't be covered by an index.
+    """
+    for graphql_type in schema.get_type_map().values():
+        graphene_type = getattr(graphql_type, "graphene_type", None)
+        if not (
+            isinstance(graphene_type, type)
+            and issubclass(graphene_type, graphene.ObjectType)
+        ):
+            continue
+        for field_name, field in graphene_type._meta.fields.items():
+            model = _get_connection_model(field.type)
+            if model is None:
+                continue
+            label = f"{graphene_type._meta.name}.{field_name}"
+            default_ordering = get_model_default_ordering(model) or ["pk"]
+            yield SortOrder(
+                label, model, [field.lstrip("-") for field in default_ordering]
+            )
+
+            sort_by = field.args.get("sort_by")
+            sort_input = _unwrap_type(sort_by.type) if sort_by else None
+            if not (
+                isinstance(sort_input, type)
+                and issubclass(sort_input, SortInputObjectType)
+            ):
+                continue
+            sort_enum = sort_input._meta.sort_enum
+            for name, value in sort_enum._meta.enum.__members__.items():
+                if hasattr(sort_enum, f"qs_with_{name.lower()}"):
+                    continue
+                yield SortOrder(f"{label}({name})", model, list(value.value))
+
+
+def _is_ordered_index(index) -> bool:
+    # GIN and the other PostgreSQL index types don't return rows in order.
+    return not isinstance(index, PostgresIndex) or isinstance(index, BTreeIndex)
+
+
+def get_model_index_prefixes(model: Type[Model]) -> List[List[str]]:
+    """Return field names of every index of the model, in index column order."""
+    opts = model._meta
+    indexes = [[opts.pk.name]]
+    for field in opts.local_concrete_fields:
+        if field.unique or field.db_index:
+            indexes.append([field.name])
+    indexes.extend(list(fields) for fields in opts.unique_together)
+    indexes.extend(
+        [field.lstrip("-") for field in index.fields]
+        for index in opts.indexes
+        if index.fields and _is_ordered_index(index)
+    )
+    indexes.extend(
+        list(constraint.fields)
+        for constraint in opts.constraints
+        if isinstance(constraint, UniqueConstraint) and constraint.fields
+    )
+    return indexes
+
+
+def _get_column_field_names(model: Type[Model], fields: List[str]):
+    """Return names of the model columns, None if ordering by anything else."""
+    opts = model._meta
+    names = []
+    for field_name in fields:
+        if field_name == "pk":
+            names.append(opts.pk.name)
+            continue
+        try:
+            field = opts.get_field(field_name)
+        except FieldDoesNotExist:
+            return None
+        # Ordering by a relation uses the ordering of the related model.
+        if not field.concrete or field.is_relation:
+            return None
+        names.append(field.name)
+    return names
+
+
+def is_sort_order_covered(sort_order: SortOrder) -> bool:
+    fields = _get_column_field_names(sort_order.model, sort_order.fields)
+    if fields is None:
+        return True
+    return any(
+        index[: len(fields)] == fields
+        for index in get_model_index_prefixes(sort_order.model)
+    )
+
+
+def check_sort_indexes(app_configs=None, **kwargs):
+    """Require a composite index covering each connection sort order.
+
+    Keyset pagination reads pages from an index scan only when the sorting
+    fields are a prefix of an index; otherwise every page sorts the whole
+    filtered set.
+    """
+    from ..schema import schema
+
+    errors = []
+    reported = set()
+    for sort_order in get_connection_sort_orders(schema):
+        key = (sort_order.model, tuple(sort_order.fields))
+        if key in reported or is_sort_order_covered(sort_order):
+            continue
+        reported.add(key)
+        errors.append(
+            checks.Error(
+                f"{sort_order.label} is sorted by {sort_order.fields} of "
+                f"{sort_order.model._meta.label}, which isn't covered by an index.",
+                hint=(
+                    "Add an index starting with these fields to "
+                    f"{sort_order.model.__name__}.Meta.indexes."
+                ),
+                obj=sort_order.model,
+                id="graphql.E001",
+            )
+        )
+    return errors
+
+
+def get_enabled_cache_settings() -> List[str]:
+    """Return names of the enabled settings caching GraphQL results."""
+    enabled = [
+        name
+        for name in [
+            "GRAPHQL_DATALOADER_CACHE_TIMEOUT",
+            "GRAPHQL_FACETS_CACHE_TIMEOUT",
+            "GRAPHQL_RESPONSE_CACHE_TIMEOUT",
+        ]
+        if getattr(settings, name)
+    ]
+    if (
+        settings.GRAPHQL_TOTAL_COUNT_STRATEGY != EXACT
+        and settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT
+    ):
+        enabled.append("GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT")
+    return enabled
+
+
+def check_shared_cache(app_configs=None, **kwargs):
+    """Require a cache shared by the processes when GraphQL results are cached.
+
+    Cached results are invalidated by bumping versions stored in the cache, so
+    with a cache of each process the other processes keep serving stale ones.
+    """
+    backend = settings.CACHES["default"]["BACKEND"]
+    enabled = get_enabled_cache_settings()
+    if backend not in PROCESS_CACHE_BACKENDS or not enabled:
+        return []
+    return [
+        checks.Error(
+            f"{', '.join(enabled)} cache GraphQL results in {backend}, which "
+            "isn't shared by the processes.",
+            hint="Set CACHE_URL to a Redis server or disable these settings.",
+            id="graphql.E002",
+        )
+    ]
@@ -0,0 +1,93 @@
+from typing import Iterable, List, Optional, Set
+
+from django.db.models import QuerySet
+from graphene.utils.str_converters import to_snake_case
+from graphql.language import ast
+
+
+def collect_fields(selection_set, fragments) -> List[ast.Field]:
+    """Return the fields of a selection set with all fragments expanded."""
+    fields: List[ast.Field] = []
+    if selection_set is None:
+        return fields
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.Field):
+            fields.append(selection)
+        elif isinstance(selection, ast.InlineFragment):
+            fields.extend(collect_fields(selection.selection_set, fragments))
+        elif isinstance(selection, ast.FragmentSpread):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                fields.extend(collect_fields(fragment.selection_set, fragments))
+    return fields
+
+
+def get_node_field_names(info) -> Set[str]:
+    """Return names of the fields selected on `edges.node` of the connection."""
+    names = set()
+    for field_ast in info.field_asts:
+        for edges in collect_fields(field_ast.selection_set, info.fragments):
+            if edges.name.value != "edges":
+                continue
+            for node in collect_fields(edges.selection_set, info.fragments):
+                if node.name.value != "node":
+                    continue
+                names.update(
+                    field.name.value
+                    for field in collect_fields(node.selection_set, info.fragments)
+                )
+    return names
+
+
+def get_required_columns(
+    node_type, field_names: Iterable[str], sorting_fields: Iterable[str]
+) -> Optional[Set[str]]:
+    """Return model fields needed to resolve the selected fields of the node type.
+
+    Types opt in by declaring `field_columns` in their Meta: a mapping of the
+    GraphQL fields to the model fields their resolvers read. Fields missing from
+    the mapping need the model field of the same name. `None` is returned when
+    a selected field can't be mapped, and the whole rows have to be fetched.
+    """
+    field_columns = getattr(node_type._meta, "field_columns", None)
+    model = getattr(node_type._meta, "model", None)
+    if field_columns is None or model is None:
+        return None
+
+    concrete_fields = {field.name for field in model._meta.concrete_fields}
+    columns = {model._meta.pk.name}
+    for name in field_names:
+        if name.startswith("__"):
+            continue
+        name = to_snake_case(name)
+        if name in field_columns:
+            columns.update(field_columns[name])
+        elif name in concrete_fields:
+            columns.add(name)
+        else:
+            return None
+
+    # Cursors are built from the values of the sorting fields.
+    for sorting_field in sorting_fields:
+        name = sorting_field.split("__")[0]
+        if name in concrete_fields:
+            columns.add(name)
+    return columns
+
+
+def prune_queryset_columns(
+    queryset: QuerySet, info, node_type, sorting_fields: Iterable[str]
+) -> QuerySet:
+    """Fetch only the columns needed to resolve the selected fields of the nodes."""
+    query = queryset.query
+    if query.select_related or query.combinator or query.values_select:
+        return queryset
+    if query.deferred_loading != (frozenset(), True):
+        return queryset
+
+    columns = get_required_columns(
+        node_type, get_node_field_names(info), sorting_fields
+    )
+    if columns is None:
+        return queryset
+    return queryset.only(*columns)
@@ -1,24 +1,27 @@
 import json
 from decimal import Decimal, InvalidOperation
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 import graphene
 from django.conf import settings
-from django.db.models import Model as DjangoModel
-from django.db.models import Q, QuerySet
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F, Field, Q, QuerySet
 from graphene.relay import Connection
 from graphql import GraphQLError, ResolveInfo
 from graphql.language.ast import FragmentSpread
 from graphql_relay.connection.arrayconnection import connection_from_list_slice
 from graphql_relay.connection.connectiontypes import Edge, PageInfo
-from graphql_relay.utils import base64, unbase64
 
 from ...channel.exceptions import ChannelNotDefined, NoDefaultChannel
+from ...core.db.expressions import RowValueComparison
 from ..channel import ChannelContext, ChannelQsContext
 from ..channel.utils import get_default_channel_slug_or_graphql_error
 from ..core.enums import OrderDirection
 from ..core.types import NonNullList
 from ..utils.sorting import sort_queryset_for_connection
+from .column_pruning import prune_queryset_columns
+from .cursors import CursorError, decode_cursor, encode_cursor, get_sort_signature
+from .total_count import TotalCount
 
 ConnectionArguments = Dict[str, Any]
 
@@ -27,32 +30,8 @@ FILTERS_NAME = "_FILTERS_NAME"
 FILTERSET_CLASS = "_FILTERSET_CLASS"
 
 
-def to_global_cursor(values):
-    if not isinstance(values, Iterable):
-        values = [values]
-    values = [value if value is None else str(value) for value in values]
-    return base64(json.dumps(values))
-
-
-def from_global_cursor(cursor) -> List[str]:
-    values = unbase64(cursor)
-    return json.loads(values)
-
-
-def get_field_value(instance: DjangoModel, field_name: str):
-    """Get field value for given field in filter format 'field__foreign_key_field'."""
-    field_path = field_name.split("__")
-    attr = instance
-    for elem in field_path:
-        attr = getattr(attr, elem, None)  # type:ignore
-
-    if callable(attr):
-        return "%s" % attr()
-    return attr
-
-
 def _prepare_filter_by_rank_expression(
-    cursor: List[str],
+    cursor: List[Any],
     sorting_direction: str,
     coerce_id: Callable[[str], Any],
 ) -> Q:
@@ -68,10 +47,10 @@ def _prepare_filter_by_rank_expression(
     # making equal comparisons impossible. Instead we compare rank against small
     # range of values, constructed using epsilon.
     if sorting_direction == "gt":
-        return Q(search_rank__range=(rank - EPSILON, rank + EPSILON), id__lt=id) | Q(
+        return Q(search_rank__range=(rank - EPSILON, rank + EPSILON), id__gt=id) | Q(
             search_rank__gt=rank + EPSILON
         )
-    return Q(search_rank__range=(rank - EPSILON, rank + EPSILON), id__gt=id) | Q(
+    return Q(search_rank__range=(rank - EPSILON, rank + EPSILON), id__lt=id) | Q(
         search_rank__lt=rank - EPSILON
     )
 
@@ -79,11 +58,11 @@ def _prepare_filter_by_rank_expression(
 def _prepare_filter_expression(
     field_name: str,
     index: int,
-    cursor: List[str],
+    cursor: List[Any],
     sorting_fields: List[str],
     sorting_direction: str,
-) -> Tuple[Q, Dict[str, Union[str, bool]]]:
-    field_expression: Dict[str, Union[str, bool]] = {}
+) -> Tuple[Q, Dict[str, Any]]:
+    field_expression: Dict[str, Any] = {}
     extra_expression = Q()
     for cursor_id, cursor_value in enumerate(cursor[:index]):
         field_expression[sorting_fields[cursor_id]] = cursor_value
@@ -100,7 +79,7 @@ def _prepare_filter_expression(
 
 
 def _prepare_filter(
-    cursor: List[str],
+    cursor: List[Any],
     sorting_fields: List[str],
     sorting_direction: str,
     coerce_id: Callable[[str], Any],
@@ -135,6 +114,63 @@ def _prepare_filter(
     return filter_kwargs
 
 
+def _get_keyset_fields(
+    qs: QuerySet, sorting_fields: List[str]
+) -> Optional[List[Field]]:
+    """Return model fields of the sorting fields if they can be compared as a row.
+
+    NULLs never match a row value comparison, so it's used only when all sorting
+    fields are non-nullable columns reached through non-nullable relations.
+    """
+    keyset_fields = []
+    for field_path in sorting_fields:
+        field_names = field_path.split("__")
+        if field_names[0] in qs.query.annotations:
+            return None
+        opts = qs.model._meta
+        field = None
+        for name in field_names:
+            if field is not None:
+                if not field.is_relation:
+                    return None
+                opts = field.related_model._meta
+            try:
+                field = opts.pk if name == "pk" else opts.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if not field.concrete or field.null or field.many_to_many:
+                return None
+        # Ordering by a relation uses the ordering of the related model.
+        if field is None or field.is_relation:
+            return None
+        keyset_fields.append(field)
+    return keyset_fields
+
+
+def _prepare_keyset_filter(
+    qs: QuerySet,
+    cursor: List[Any],
+    sorting_fields: List[str],
+    sorting_direction: str,
+) -> Union[Q, RowValueComparison]:
+    """Create a filter of records following the cursor in the sorting order.
+
+    Compare all sorting fields as a single row value, `(a, b) > (x, y)`, which
+    PostgreSQL matches to a composite index, and fall back to the equivalent
+    tree of conditions when the sorting fields may hold NULLs.
+    """
+    keyset_fields = _get_keyset_fields(qs, sorting_fields)
+    if keyset_fields is None or None in cursor:
+        return _prepare_filter(
+            cursor, sorting_fields, sorting_direction, _get_id_coercion(qs)
+        )
+    try:
+        values = [field.to_python(value) for field, value in zip(keyset_fields, cursor)]
+    except ValidationError:
+        raise GraphQLError("Received cursor is invalid.")
+    return RowValueComparison(sorting_fields, values, sorting_direction, keyset_fields)
+
+
 def _validate_connection_args(args):
     first = args.get("first")
     last = args.get("last")
@@ -163,6 +199,12 @@ def _get_sorting_fields(sort_by, qs):
     return sorting_fields
 
 
+def _get_cursor_signature(sort_by, sorting_fields: List[str]) -> int:
+    return get_sort_signature(
+        sorting_fields, sort_by.get("direction", ""), sort_by.get("attribute_id")
+    )
+
+
 def _get_sorting_direction(sort_by, last=None):
     direction = sort_by.get("direction", "")
     sorting_desc = direction == OrderDirection.DESC
@@ -193,7 +235,23 @@ def _get_page_info(matching_records, cursor, first, last):
     return page_info
 
 
-def _get_edges_for_connection(edge_type, qs, args, sorting_fields):
+def _get_cursor_aliases(sorting_fields: List[str]) -> List[str]:
+    return [f"_cursor_{index}" for index in range(len(sorting_fields))]
+
+
+def _annotate_cursor_values(qs: QuerySet, sorting_fields: List[str]) -> QuerySet:
+    """Select values of the sorting fields along with the records.
+
+    Cursors are built from the annotated values, so related fields are joined
+    in the same query instead of being fetched for every record.
+    """
+    aliases = _get_cursor_aliases(sorting_fields)
+    return qs.annotate(
+        **{alias: F(field) for alias, field in zip(aliases, sorting_fields)}
+    )
+
+
+def _get_edges_for_connection(edge_type, qs, args, sorting_fields, signature):
     before = args.get("before")
     after = args.get("after")
     first = args.get("first")
@@ -205,24 +263,21 @@ def _get_edges_for_connection(edge_type, qs, args, sorting_fields):
     if not first and not last:
         return [], {"has_previous_page": False, "has_next_page": False}
 
-    if last:
-        start_slice, end_slice = 1, None
-    else:
-        start_slice, end_slice = 0, requested_count
-
+    # The queryset is already ordered backwards for `last` and fetches one extra
+    # record to tell whether there are more pages; it's dropped before the page
+    # is put back in the requested order.
     matching_records = list(qs)
-    if last:
-        matching_records = list(reversed(matching_records))
-        if len(matching_records) <= requested_count:
-            start_slice = 0
     page_info = _get_page_info(matching_records, cursor, first, last)
-    matching_records = matching_records[start_slice:end_slice]
+    del matching_records[requested_count:]
+    if last:
+        matching_records.reverse()
 
+    aliases = _get_cursor_aliases(sorting_fields)
     edges = [
         edge_type(
             node=record,
-            cursor=to_global_cursor(
-                [get_field_value(record, field) for field in sorting_fields]
+            cursor=encode_cursor(
+                [getattr(record, alias) for alias in aliases], signature
             ),
         )
         for record in matching_records
@@ -255,24 +310,20 @@ def connection_from_queryset_slice(
     requested_count = first or last
     end_margin = requested_count + 1 if requested_count else None
 
-    cursor = after or before
-    try:
-        cursor = from_global_cursor(cursor) if cursor else None
-    except ValueError:
-        raise GraphQLError("Received cursor is invalid.")
-
     sort_by = args.get("sort_by", {})
     sorting_fields = _get_sorting_fields(sort_by, qs)
     sorting_direction = _get_sorting_direction(sort_by, last)
+    signature = _get_cursor_signature(sort_by, sorting_fields)
+
+    cursor = after or before
+    try:
+        cursor = decode_cursor(cursor, signature) if cursor else None
+    except CursorError as e:
+        raise GraphQLError(str(e))
     if cursor and len(cursor) != len(sorting_fields):
         raise GraphQLError("Received cursor is invalid.")
     filter_kwargs = (
-        _prepare_filter(
-            cursor,
-            sorting_fields,
-            sorting_direction,
-            _get_id_coercion(qs),
-        )
+        _prepare_keyset_filter(qs, cursor, sorting_fields, sorting_direction)
         if cursor
         else Q()
     )
@@ -280,21 +331,17 @@ def connection_from_queryset_slice(
         filtered_qs = qs.filter(filter_kwargs)
     except ValueError:
         raise GraphQLError("Received cursor is invalid.")
-    filtered_qs = filtered_qs[:end_margin]
+    filtered_qs = _annotate_cursor_values(filtered_qs, sorting_fields)[:end_margin]
 
     edges, page_info = _get_edges_for_connection(
-        edge_type, filtered_qs, args, sorting_fields
+        edge_type, filtered_qs, args, sorting_fields, signature
     )
 
     if "total_count" in connection_type._meta.fields:
-
-        def get_total_count():
-            return qs.count()
-
         return connection_type(
             edges=edges,
             page_info=pageinfo_type(**page_info),
-            total_count=get_total_count,
+            total_count=TotalCount(qs),
         )
 
     return connection_type(
@@ -330,6 +377,12 @@ def create_connection_slice(
 
     queryset, sort_by = sort_queryset_for_connection(iterable=queryset, args=args)
     args["sort_by"] = sort_by
+    queryset = prune_queryset_columns(
+        queryset,
+        info,
+        connection_type._meta.node,
+        _get_sorting_fields(sort_by, queryset),
+    )
 
     slice = connection_from_queryset_slice(
         queryset,
@@ -517,7 +570,7 @@ class CountableConnection(NonNullConnection):
     total_count = graphene.Int(description="A total count of items in the collection.")
 
     @staticmethod
-    def resolve_total_count(root, _info):
+    def resolve_total_count(root, info):
         try:
             if isinstance(root, dict):
                 total_count = root["total_count"]
@@ -526,6 +579,15 @@ class CountableConnection(NonNullConnection):
         except (AttributeError, KeyError):
             return None
 
+        if isinstance(total_count, TotalCount):
+            count = total_count()
+            # Reported in the `totalCount` extension of the response.
+            if hasattr(info.context, "total_count_strategies"):
+                info.context.total_count_strategies.append(
+                    {"path": info.path, "strategy": total_count.strategy}
+                )
+            return count
+
         if callable(total_count):
             return total_count()
 
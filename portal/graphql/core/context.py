@@ -1,5 +1,5 @@
 import datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from django.http import HttpRequest
 
@@ -13,6 +13,8 @@ class PortalContext(HttpRequest):
     _cached_user: Optional[User]
     decoded_auth_token: Optional[Dict[str, Any]]
     allow_replica: bool = True
+    replica_connection_name: Optional[str]
     dataloaders: Dict[str, "DataLoader"]
     user: Optional[User]  # type: ignore[assignment]
     request_time: datetime.datetime
+    total_count_strategies: List[Dict[str, Any]]
@@ -0,0 +1,198 @@
+"""Compact, versioned codec of connection cursors.
+
+A cursor holds a version byte, a signature of the sort order it was created
+for and the sort key values, each prefixed with a type tag so they're decoded
+back to the exact Python type:
+
+    version (1 byte) | signature (4 bytes) | tag (1 byte) value | ...
+
+The payload is encoded with URL-safe base64 without padding.
+"""
+
+import base64
+import binascii
+import datetime
+import struct
+import uuid
+import zlib
+from decimal import Decimal
+from typing import Any, Iterable, List, Optional
+
+CURSOR_VERSION = 1
+
+TAG_NULL = b"N"
+TAG_TRUE = b"T"
+TAG_FALSE = b"F"
+TAG_INT = b"i"
+TAG_FLOAT = b"f"
+TAG_DECIMAL = b"d"
+TAG_STR = b"s"
+TAG_DATETIME = b"t"
+TAG_NAIVE_DATETIME = b"n"
+TAG_DATE = b"D"
+TAG_UUID = b"u"
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+NAIVE_EPOCH = datetime.datetime(1970, 1, 1)
+MICROSECOND = datetime.timedelta(microseconds=1)
+
+_HEADER = struct.Struct(">BI")
+_FLOAT = struct.Struct(">d")
+
+
+class CursorError(ValueError):
+    pass
+
+
+def get_sort_signature(
+    sorting_fields: List[str], direction: str = "", attribute_id: Optional[str] = None
+) -> int:
+    """Return a checksum identifying the sort order that cursors are valid for."""
+    key = f"{','.join(sorting_fields)}|{direction or ''}|{attribute_id or ''}"
+    return zlib.crc32(key.encode("utf-8"))
+
+
+def _encode_varint(value: int) -> bytes:
+    if not -(2**63) <= value < 2**63:
+        raise CursorError("Value is out of the cursor range.")
+    # Zigzag encoding keeps small negative numbers short.
+    value = (value << 1) ^ (value >> 63)
+    result = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            result.append(byte | 0x80)
+        else:
+            result.append(byte)
+            return bytes(result)
+
+
+def _decode_varint(data: bytes, offset: int):
+    result = shift = 0
+    while True:
+        if offset >= len(data) or shift > 63:
+            raise CursorError("Received cursor is invalid.")
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return (result >> 1) ^ -(result & 1), offset
+
+
+def _encode_bytes(tag: bytes, value: bytes) -> bytes:
+    return tag + _encode_varint(len(value)) + value
+
+
+def _encode_value(value: Any) -> bytes:
+    if value is None:
+        return TAG_NULL
+    if isinstance(value, bool):
+        return TAG_TRUE if value else TAG_FALSE
+    if isinstance(value, int):
+        return TAG_INT + _encode_varint(value)
+    if isinstance(value, float):
+        return TAG_FLOAT + _FLOAT.pack(value)
+    if isinstance(value, Decimal):
+        return _encode_bytes(TAG_DECIMAL, str(value).encode("ascii"))
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            delta = value - NAIVE_EPOCH
+            tag = TAG_NAIVE_DATETIME
+        else:
+            delta = value - EPOCH
+            tag = TAG_DATETIME
+        return tag + _encode_varint(delta // MICROSECOND)
+    if isinstance(value, datetime.date):
+        return TAG_DATE + _encode_varint(value.toordinal())
+    if isinstance(value, uuid.UUID):
+        return TAG_UUID + value.bytes
+    return _encode_bytes(TAG_STR, str(value).encode("utf-8"))
+
+
+def _decode_value(data: bytes, offset: int):
+    tag = data[offset : offset + 1]
+    offset += 1
+    if tag == TAG_NULL:
+        return None, offset
+    if tag == TAG_TRUE:
+        return True, offset
+    if tag == TAG_FALSE:
+        return False, offset
+    if tag == TAG_INT:
+        return _decode_varint(data, offset)
+    if tag == TAG_FLOAT:
+        end = offset + _FLOAT.size
+        if end > len(data):
+            raise CursorError("Received cursor is invalid.")
+        return _FLOAT.unpack(data[offset:end])[0], end
+    if tag in (TAG_DATETIME, TAG_NAIVE_DATETIME):
+        microseconds, offset = _decode_varint(data, offset)
+        epoch = EPOCH if tag == TAG_DATETIME else NAIVE_EPOCH
+        try:
+            return epoch + microseconds * MICROSECOND, offset
+        except OverflowError:
+            raise CursorError("Received cursor is invalid.")
+    if tag == TAG_DATE:
+        ordinal, offset = _decode_varint(data, offset)
+        try:
+            return datetime.date.fromordinal(ordinal), offset
+        except ValueError:
+            raise CursorError("Received cursor is invalid.")
+    if tag == TAG_UUID:
+        end = offset + 16
+        if end > len(data):
+            raise CursorError("Received cursor is invalid.")
+        return uuid.UUID(bytes=data[offset:end]), end
+    if tag in (TAG_DECIMAL, TAG_STR):
+        length, offset = _decode_varint(data, offset)
+        end = offset + length
+        if length < 0 or end > len(data):
+            raise CursorError("Received cursor is invalid.")
+        try:
+            text = data[offset:end].decode("utf-8")
+            return (Decimal(text) if tag == TAG_DECIMAL else text), end
+        except (UnicodeDecodeError, ArithmeticError):
+            raise CursorError("Received cursor is invalid.")
+    raise CursorError("Received cursor is invalid.")
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(value: str) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+    except (binascii.Error, ValueError, TypeError):
+        raise CursorError("Received cursor is invalid.")
+
+
+def encode_cursor(values: Iterable[Any], signature: int) -> str:
+    data = _HEADER.pack(CURSOR_VERSION, signature)
+    data += b"".join(_encode_value(value) for value in values)
+    return _b64encode(data)
+
+
+def decode_cursor(cursor: str, signature: int) -> List[Any]:
+    """Return the sort key values of a cursor created for the given sort order.
+
+    Raise `CursorError` for malformed cursors, cursors of other versions and
+    cursors created for a different sort order.
+    """
+    data = _b64decode(cursor)
+    if len(data) < _HEADER.size:
+        raise CursorError("Received cursor is invalid.")
+    version, cursor_signature = _HEADER.unpack_from(data)
+    if version != CURSOR_VERSION:
+        raise CursorError("Received cursor is invalid.")
+    if cursor_signature != signature:
+        raise CursorError("Received cursor was created for a different sort order.")
+
+    values = []
+    offset = _HEADER.size
+    while offset < len(data):
+        value, offset = _decode_value(data, offset)
+        values.append(value)
+    return values
@@ -0,0 +1,192 @@
+"""Cache of data loader results shared between requests.
+
+Data loaders of rarely changing reference data opt in by listing the models
+their results are read from in `shared_cache_models`. Results are kept in
+a per-process LRU cache backed by the Django cache, both namespaced by tenant.
+
+Keys contain the cache versions of the listed models, bumped when their rows
+are saved or deleted, so changes are visible to the next request after the
+transaction commits, in all processes. Only versions of the models in
+`SHARED_CACHE_MODELS` are bumped, so the listed models must be added there.
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from ... import __version__ as portal_version
+from ...attribute.models import (
+    AssignedEntryAttributeValue,
+    Attribute,
+    AttributeEntry,
+    AttributeValue,
+)
+from ...attribute.signals import entry_attribute_values_assigned
+from ...channel.models import Channel
+from ...entry.models import (
+    Category,
+    CategoryEntry,
+    Entry,
+    EntryChannelListing,
+    EntryType,
+)
+from .cache_versions import (
+    get_cache_versions,
+    get_schema_name,
+    invalidate_cache_version_on_commit,
+)
+
+if TYPE_CHECKING:
+    from .dataloaders import DataLoader
+
+# Models whose versions are bumped when their rows are saved or deleted. They
+# list the `shared_cache_models` of the data loaders and the models of other
+# cached results, like the facets. Processes saving the rows, like Celery
+# workers, may not import the data loaders, so the list is kept here.
+SHARED_CACHE_MODELS = [
+    AssignedEntryAttributeValue,
+    Attribute,
+    AttributeEntry,
+    AttributeValue,
+    Category,
+    CategoryEntry,
+    Channel,
+    Entry,
+    EntryChannelListing,
+    EntryType,
+]
+
+
+class LocalCache:
+    """Thread-safe, LRU-evicted in-process cache of values expiring after a TTL.
+
+    Values are stored pickled, so objects returned to one request are never
+    shared with another one.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is not None:
+            return self._maxsize
+        return settings.GRAPHQL_DATALOADER_CACHE_SIZE
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                expires, payload = entry
+                if expires <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = payload
+        return {key: pickle.loads(payload) for key, payload in found.items()}
+
+    def set_many(self, data: Dict[str, Any], timeout: int):
+        maxsize = self.maxsize
+        if maxsize <= 0:
+            return
+        expires = time.monotonic() + timeout
+        payloads = {
+            key: pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            for key, value in data.items()
+        }
+        with self._lock:
+            for key, payload in payloads.items():
+                self._entries[key] = (expires, payload)
+                self._entries.move_to_end(key)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+local_cache = LocalCache()
+
+
+def get_model_namespace(model) -> str:
+    return f"dataloader-{model._meta.label_lower}"
+
+
+def get_models_cache_version(models: Iterable[Any]) -> str:
+    """Return the tenant's combined cache version of the models."""
+    schema_name = get_schema_name()
+    namespaces = [get_model_namespace(model) for model in models]
+    versions = get_cache_versions(namespaces, schema_name)
+    return ".".join(str(versions[namespace]) for namespace in namespaces)
+
+
+def get_shared_cache_prefix(loader: "DataLoader") -> str:
+    schema_name = get_schema_name()
+    version = get_models_cache_version(loader.shared_cache_models)
+    variant = loader.get_shared_cache_variant()
+    return (
+        f"{portal_version}-dataloader-{loader.context_key}-{schema_name}-"
+        f"{version}-{variant}"
+    )
+
+
+def get_many(prefix: str, keys: Iterable[Any]) -> Dict[Any, Any]:
+    """Return cached results of the keys, looked up in memory first."""
+    cache_keys = {f"{prefix}-{key}": key for key in keys}
+    found = local_cache.get_many(cache_keys)
+    missing = [cache_key for cache_key in cache_keys if cache_key not in found]
+    if missing:
+        shared = cache.get_many(missing)
+        if shared:
+            local_cache.set_many(shared, settings.GRAPHQL_DATALOADER_CACHE_TIMEOUT)
+            found.update(shared)
+    return {cache_keys[cache_key]: value for cache_key, value in found.items()}
+
+
+def set_many(prefix: str, results: Dict[Any, Any]):
+    timeout = settings.GRAPHQL_DATALOADER_CACHE_TIMEOUT
+    data = {f"{prefix}-{key}": value for key, value in results.items()}
+    local_cache.set_many(data, timeout)
+    cache.set_many(data, timeout)
+
+
+def invalidate_model_cache(sender, **kwargs):
+    invalidate_cache_version_on_commit(get_model_namespace(sender))
+
+
+for model in SHARED_CACHE_MODELS:
+    post_save.connect(
+        invalidate_model_cache,
+        sender=model,
+        dispatch_uid=f"dataloader_cache_post_save_{model._meta.label_lower}",
+    )
+    post_delete.connect(
+        invalidate_model_cache,
+        sender=model,
+        dispatch_uid=f"dataloader_cache_post_delete_{model._meta.label_lower}",
+    )
+    m2m_changed.connect(
+        invalidate_model_cache,
+        sender=model,
+        dispatch_uid=f"dataloader_cache_m2m_changed_{model._meta.label_lower}",
+    )
+
+# Values assigned in bulk don't send the model signals.
+entry_attribute_values_assigned.connect(
+    invalidate_model_cache,
+    sender=AssignedEntryAttributeValue,
+    dispatch_uid="dataloader_cache_entry_attribute_values_assigned",
+)
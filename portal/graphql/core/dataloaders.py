@@ -1,10 +1,15 @@
-from typing import Generic, Iterable, List, TypeVar, Union
+from typing import Generic, Iterable, List, Optional, Tuple, Type, TypeVar, Union
 
+from django.conf import settings
+from django.db import connection
+from django.db.models import Model
 from django.http import HttpRequest
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
 from ...core.db.utils import get_database_connection_name
+from . import dataloader_cache
+from .batching import call_with_tenant_connection, get_dataloader_executor
 
 K = TypeVar("K")
 R = TypeVar("R")
@@ -13,7 +18,13 @@ R = TypeVar("R")
 class DataLoader(BaseLoader, Generic[K, R]):
     context_key = None
     context = None
-    database_connection_name = None
+    # Loaders of rarely changing data opt in to the cache shared between
+    # requests by listing the models their results are read from.
+    shared_cache_models: Tuple[Type[Model], ...] = ()
+    # Maximum number of keys passed to a single `batch_load` call, defaults to
+    # `GRAPHQL_DATALOADER_MAX_BATCH_SIZE`. Results of the chunks are resolved
+    # in key order.
+    max_batch_size: Optional[int] = None
 
     def __new__(cls, context: HttpRequest):
         key = cls.context_key
@@ -25,16 +36,30 @@ class DataLoader(BaseLoader, Generic[K, R]):
             context.dataloaders[key] = super().__new__(cls, context)
         loader = context.dataloaders[key]
         assert isinstance(loader, cls)
-        cls.database_connection_name = get_database_connection_name(context)
         return loader
 
     def __init__(self, context):
         if self.context != context:
             self.context = context
             self.user = context.user
-            super().__init__()
+            super().__init__(
+                max_batch_size=self.max_batch_size
+                or settings.GRAPHQL_DATALOADER_MAX_BATCH_SIZE
+                or None
+            )
+
+    @property
+    def database_connection_name(self) -> str:
+        # Resolved from the context of each loader instance, as loaders of
+        # concurrent requests may read from different databases.
+        return get_database_connection_name(self.context)
 
     def batch_load_fn(self, keys: Iterable[K]) -> Promise[List[R]]:
+        if self.use_shared_cache():
+            return self.batch_load_with_shared_cache(keys)
+        return self.load_batch(keys)
+
+    def load_batch(self, keys: Iterable[K]) -> Promise[List[R]]:
         results = self.batch_load(keys)
         if not isinstance(results, Promise):
             return Promise.resolve(results)
@@ -43,3 +68,72 @@ class DataLoader(BaseLoader, Generic[K, R]):
 
     def batch_load(self, keys: Iterable[K]) -> Union[Promise[List[R]], List[R]]:
         raise NotImplementedError()
+
+    def use_shared_cache(self) -> bool:
+        # Mutations read their own uncommitted changes, which aren't invalidated
+        # in the shared cache until the transaction is committed.
+        return bool(
+            self.shared_cache_models
+            and settings.GRAPHQL_DATALOADER_CACHE_TIMEOUT
+            and getattr(self.context, "allow_replica", True)
+        )
+
+    def get_shared_cache_variant(self) -> str:
+        """Return a part of the shared cache keys of results varying by requestor."""
+        return ""
+
+    def batch_load_with_shared_cache(self, keys: Iterable[K]) -> Promise[List[R]]:
+        keys = list(keys)
+        prefix = dataloader_cache.get_shared_cache_prefix(self)
+        results = dataloader_cache.get_many(prefix, keys)
+        missing_keys = [key for key in keys if key not in results]
+        if not missing_keys:
+            return Promise.resolve([results[key] for key in keys])
+
+        def store_results(loaded):
+            loaded_results = dict(zip(missing_keys, loaded))
+            dataloader_cache.set_many(prefix, loaded_results)
+            results.update(loaded_results)
+            return [results[key] for key in keys]
+
+        return self.load_batch(missing_keys).then(store_results)
+
+
+class AsyncDataLoader(DataLoader[K, R]):
+    """Data loader running its batch loads in the dataloader worker pool.
+
+    Batch loads of all loaders dispatched together run concurrently, so the
+    query waits for the slowest of them instead of their sum. It suits loaders
+    bound by database or file storage latency.
+
+    Promises are not thread-safe, so `batch_load` must return the results
+    instead of a promise, and they are resolved in the thread executing the
+    query. Without `GRAPHQL_DATALOADER_CONCURRENCY` the loader behaves like a
+    regular data loader.
+    """
+
+    def use_worker_pool(self) -> bool:
+        # Worker threads use their own database connections, which don't see
+        # the uncommitted changes of the transaction, like those of mutations.
+        return bool(
+            settings.GRAPHQL_DATALOADER_CONCURRENCY
+            and getattr(self.context, "allow_replica", True)
+            and not connection.in_atomic_block
+        )
+
+    def load_batch(self, keys: Iterable[K]) -> Promise[List[R]]:
+        if not self.use_worker_pool():
+            return super().load_batch(keys)
+
+        future = get_dataloader_executor().submit(
+            call_with_tenant_connection,
+            getattr(connection, "tenant", None),
+            self.batch_load,
+            keys,
+        )
+        # The callback is queued after the dispatches of the other loaders, so
+        # their batch loads are submitted before this thread blocks on the result.
+        return Promise.resolve(None).then(lambda _: future.result())
+
+    def batch_load(self, keys: Iterable[K]) -> List[R]:
+        raise NotImplementedError()
@@ -0,0 +1,132 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from django.conf import settings
+from graphql import GraphQLDocument
+from graphql.error import GraphQLError, GraphQLSyntaxError
+from graphql.execution import ExecutionResult
+from graphql.validation import validate
+
+from ... import __version__ as portal_version
+
+CachedErrors = List[Exception]
+CachedEntry = Union[GraphQLDocument, CachedErrors]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class DocumentCache:
+    """Bounded, LRU-evicted cache of parsed and validated GraphQL documents.
+
+    Entries are keyed by the hash of the query string and the schema version, so
+    a schema change never serves a document validated against the old schema.
+    Queries that fail to parse or validate are cached as well, which keeps
+    malformed queries repeated by a broken client cheap.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, CachedEntry]" = OrderedDict()
+        self._schema_versions: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is not None:
+            return self._maxsize
+        return settings.GRAPHQL_DOCUMENT_CACHE_SIZE
+
+    def get_schema_version(self, schema) -> str:
+        schema_id = id(schema)
+        version = self._schema_versions.get(schema_id)
+        if version is None:
+            printed_schema = f"{portal_version}:{schema}"
+            version = hashlib.sha256(printed_schema.encode("utf-8")).hexdigest()[:16]
+            self._schema_versions[schema_id] = version
+        return version
+
+    def get_key(self, schema, query: str) -> str:
+        hashed_query = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        return f"{self.get_schema_version(schema)}-{hashed_query}"
+
+    def get(self, key: str) -> Optional[CachedEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: str, entry: CachedEntry):
+        maxsize = self.maxsize
+        if maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+    def document_from_string(
+        self, backend, schema, query: str
+    ) -> Tuple[Optional[GraphQLDocument], Optional[ExecutionResult]]:
+        """Return a validated document for the query or a result with errors."""
+        key = self.get_key(schema, query)
+        entry = self.get(key)
+        if entry is None:
+            entry = parse_and_validate(backend, schema, query)
+            self.set(key, entry)
+
+        if isinstance(entry, GraphQLDocument):
+            return entry, None
+        return None, ExecutionResult(errors=list(entry), invalid=True)
+
+
+def parse_and_validate(backend, schema, query: str) -> CachedEntry:
+    try:
+        document = backend.document_from_string(schema, query)
+    except (ValueError, GraphQLSyntaxError) as e:
+        return [e]
+
+    validation_errors: List[GraphQLError] = validate(schema, document.document_ast)
+    if validation_errors:
+        return list(validation_errors)
+
+    # The document was validated above; skip the validation run by the backend
+    # each time the cached document gets executed.
+    return GraphQLDocument(
+        schema=document.schema,
+        document_string=document.document_string,
+        document_ast=document.document_ast,
+        execute=partial(document.execute, validate=False),
+    )
+
+
+document_cache = DocumentCache()
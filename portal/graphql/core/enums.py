@@ -1,5 +1,7 @@
 import graphene
 
+from ...core.search import SearchMode
+
 
 class OrderDirection(graphene.Enum):
     ASC = ""
@@ -29,3 +31,6 @@ def to_enum(enum_cls, *, type_name=None, **options) -> graphene.Enum:
     type_name = type_name or (enum_cls.__name__ + "Enum")
     enum_data = [(str_to_enum(code.upper()), code) for code, name in enum_cls.CHOICES]
     return graphene.Enum(type_name, enum_data, **options)
+
+
+SearchModeEnum = to_enum(SearchMode, description="Mode of the search filter.")
@@ -5,11 +5,12 @@ from django.forms import CharField, Field, MultipleChoiceField
 from django_filters import Filter, MultipleChoiceFilter
 from graphql_relay import from_global_id
 
+from ...core.search import search_queryset
 from ..utils.filters import filter_range_field
 
 
 def search_filter(queryset, name, value):
-    return queryset.filter(name__search=value)
+    return search_queryset(queryset, value)
 
 
 class DefaultMultipleChoiceField(MultipleChoiceField):
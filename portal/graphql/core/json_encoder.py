@@ -0,0 +1,62 @@
+import json
+from typing import Any, Iterator
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON = "orjson"
+STDLIB = "json"
+
+if orjson is not None:
+    # Dates are passed to `DjangoJSONEncoder` as orjson formats them differently.
+    ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def get_json_encoder() -> str:
+    """Return the encoder selected by `GRAPHQL_JSON_ENCODER`.
+
+    orjson is used only when it is installed; otherwise responses are encoded by
+    the standard library encoder, the same way as `JsonResponse` does.
+    """
+    if settings.GRAPHQL_JSON_ENCODER == ORJSON and orjson is not None:
+        return ORJSON
+    return STDLIB
+
+
+def _default(obj: Any) -> Any:
+    return DjangoJSONEncoder().default(obj)
+
+
+def dumps(data: Any) -> bytes:
+    """Encode data to JSON, serializing values like `DjangoJSONEncoder` does."""
+    if get_json_encoder() == ORJSON:
+        return orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+    return json.dumps(data, cls=DjangoJSONEncoder).encode("utf-8")
+
+
+def iter_dumps(data: Any) -> Iterator[bytes]:
+    """Encode data to JSON in chunks.
+
+    Dictionaries are walked recursively and every item of a list is encoded
+    separately, so only a single list item is held encoded in memory at once.
+    """
+    if isinstance(data, dict):
+        yield b"{"
+        for index, (key, value) in enumerate(data.items()):
+            prefix = b"," if index else b""
+            yield prefix + dumps(str(key)) + b":"
+            yield from iter_dumps(value)
+        yield b"}"
+    elif isinstance(data, list):
+        yield b"["
+        for index, item in enumerate(data):
+            prefix = b"," if index else b""
+            yield prefix + dumps(item)
+        yield b"]"
+    else:
+        yield dumps(data)
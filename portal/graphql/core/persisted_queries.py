@@ -0,0 +1,82 @@
+import hashlib
+import re
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql.error import GraphQLError
+
+from ... import __version__ as portal_version
+
+PERSISTED_QUERY_VERSION = 1
+SHA256_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class PersistedQueryNotFound(GraphQLError):
+    def __init__(self):
+        super().__init__(
+            "PersistedQueryNotFound",
+            extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+        )
+
+
+class PersistedQueryNotSupported(GraphQLError):
+    def __init__(self):
+        super().__init__(
+            "PersistedQueryNotSupported",
+            extensions={"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+        )
+
+
+class PersistedQueryInvalid(GraphQLError):
+    pass
+
+
+def get_persisted_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def get_persisted_query_cache_key(query_hash: str) -> str:
+    return f"{portal_version}-apq-{query_hash}"
+
+
+def get_persisted_query(query_hash: str) -> Optional[str]:
+    return cache.get(get_persisted_query_cache_key(query_hash))
+
+
+def register_persisted_query(query_hash: str, query: str):
+    cache.set(
+        get_persisted_query_cache_key(query_hash),
+        query,
+        timeout=settings.GRAPHQL_PERSISTED_QUERIES_TIMEOUT,
+    )
+
+
+def resolve_persisted_query(query: Optional[str], persisted_query) -> str:
+    """Return the query string for an automatic persisted query request.
+
+    A request carrying only the hash is resolved from the registry. A request
+    carrying both the hash and the query registers the query under its hash,
+    so the following requests can omit the query string.
+    """
+    if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+        raise PersistedQueryNotSupported()
+    if not isinstance(persisted_query, dict):
+        raise PersistedQueryInvalid("Invalid persisted query extension.")
+    if persisted_query.get("version") != PERSISTED_QUERY_VERSION:
+        raise PersistedQueryInvalid("Unsupported persisted query version.")
+
+    query_hash = persisted_query.get("sha256Hash")
+    if not isinstance(query_hash, str) or not SHA256_HASH_RE.match(query_hash):
+        raise PersistedQueryInvalid("Invalid persisted query hash.")
+
+    if not query:
+        persisted_query_string = get_persisted_query(query_hash)
+        if persisted_query_string is None:
+            raise PersistedQueryNotFound()
+        return persisted_query_string
+
+    if not isinstance(query, str) or get_persisted_query_hash(query) != query_hash:
+        raise PersistedQueryInvalid("Provided sha256Hash does not match query.")
+    register_persisted_query(query_hash, query)
+    return query
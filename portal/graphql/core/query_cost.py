@@ -0,0 +1,176 @@
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+from graphql.error import GraphQLError
+from graphql.language import ast
+from graphql.type.definition import get_named_type
+
+from ..query_cost_map import COST_MAP
+
+CostMap = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+class QueryCostError(GraphQLError):
+    pass
+
+
+def get_query_cost_limit() -> int:
+    """Return the query cost budget of the current tenant.
+
+    Tenants without an explicit budget use `GRAPHQL_QUERY_COST_LIMIT`.
+    """
+    tenant = getattr(connection, "tenant", None)
+    limit = getattr(tenant, "graphql_query_cost_limit", None)
+    if limit is None:
+        limit = settings.GRAPHQL_QUERY_COST_LIMIT
+    return limit
+
+
+class QueryCostAnalyzer:
+    """Compute the static cost of a GraphQL operation.
+
+    Each field listed in the cost map adds its `complexity` to the cost of its
+    selection set, and the sum is multiplied by the value of the first of its
+    `multipliers` arguments that was given (e.g. `first` or `last` on
+    connections). Fields missing from the cost map are free but the cost of
+    their selections still counts.
+
+    Each fragment is only measured once for every type it is spread on. When a
+    limit is given, measuring stops as soon as a part of the operation costs
+    more than the limit.
+    """
+
+    def __init__(
+        self, schema, document_ast, variables, cost_map: CostMap, limit: int = 0
+    ):
+        self.schema = schema
+        self.variables = variables if isinstance(variables, dict) else {}
+        self.cost_map = cost_map
+        self.limit = limit
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document_ast.definitions
+            if isinstance(definition, ast.FragmentDefinition)
+        }
+        self.fragment_costs: Dict[Tuple[str, Optional[str]], int] = {}
+        self.operations = [
+            definition
+            for definition in document_ast.definitions
+            if isinstance(definition, ast.OperationDefinition)
+        ]
+
+    def get_operation(self, operation_name: Optional[str]):
+        if not operation_name:
+            return self.operations[0] if len(self.operations) == 1 else None
+        for operation in self.operations:
+            if operation.name and operation.name.value == operation_name:
+                return operation
+        return None
+
+    def get_root_type(self, operation):
+        if operation.operation == "mutation":
+            return self.schema.get_mutation_type()
+        if operation.operation == "subscription":
+            return self.schema.get_subscription_type()
+        return self.schema.get_query_type()
+
+    def get_cost(self, operation_name: Optional[str] = None) -> int:
+        operation = self.get_operation(operation_name)
+        if operation is None:
+            return 0
+        root_type = self.get_root_type(operation)
+        if root_type is None:
+            return 0
+        return self.get_selection_set_cost(operation.selection_set, root_type)
+
+    def get_selection_set_cost(self, selection_set, parent_type, visited=()):
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                cost += self.get_field_cost(selection, parent_type, visited)
+            elif isinstance(selection, ast.InlineFragment):
+                fragment_type = self.get_type_condition(selection, parent_type)
+                cost += self.get_selection_set_cost(
+                    selection.selection_set, fragment_type, visited
+                )
+            elif isinstance(selection, ast.FragmentSpread):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited:
+                    continue
+                key = (name, getattr(parent_type, "name", None))
+                if key not in self.fragment_costs:
+                    fragment_type = self.get_type_condition(fragment, parent_type)
+                    self.fragment_costs[key] = self.get_selection_set_cost(
+                        fragment.selection_set, fragment_type, (*visited, name)
+                    )
+                cost += self.fragment_costs[key]
+            if self.limit and cost > self.limit:
+                raise_query_cost_error(cost, self.limit)
+        return cost
+
+    def get_type_condition(self, fragment, parent_type):
+        if fragment.type_condition:
+            return self.schema.get_type(fragment.type_condition.name.value)
+        return parent_type
+
+    def get_field_cost(self, field: ast.Field, parent_type, visited) -> int:
+        field_name = field.name.value
+        fields = getattr(parent_type, "fields", None)
+        if field_name.startswith("__") or not fields or field_name not in fields:
+            return 0
+
+        selections_cost = 0
+        if field.selection_set:
+            field_type = get_named_type(fields[field_name].type)
+            selections_cost = self.get_selection_set_cost(
+                field.selection_set, field_type, visited
+            )
+
+        field_config = self.cost_map.get(parent_type.name, {}).get(field_name)
+        if not field_config:
+            return selections_cost
+        complexity = field_config.get("complexity", 1)
+        multiplier = self.get_multiplier(field, field_config.get("multipliers", []))
+        return (complexity + selections_cost) * multiplier
+
+    def get_multiplier(self, field: ast.Field, multipliers) -> int:
+        arguments = {
+            argument.name.value: argument.value for argument in field.arguments
+        }
+        for argument_name in multipliers:
+            value = self.get_argument_value(arguments.get(argument_name))
+            if isinstance(value, int) and value > 0:
+                return value
+        return 1
+
+    def get_argument_value(self, value_ast):
+        if isinstance(value_ast, ast.IntValue):
+            return int(value_ast.value)
+        if isinstance(value_ast, ast.Variable):
+            return self.variables.get(value_ast.name.value)
+        return None
+
+
+def raise_query_cost_error(cost: int, limit: int):
+    raise QueryCostError(
+        f"The query exceeds the maximum cost of {limit}. Actual cost is {cost}.",
+        extensions={"cost": {"requestedQueryCost": cost, "maximumAvailable": limit}},
+    )
+
+
+def validate_query_cost(
+    schema,
+    document_ast,
+    operation_name: Optional[str],
+    variables,
+    cost_map: Optional[CostMap] = None,
+) -> Tuple[int, int]:
+    """Return the query cost and the budget, or raise if the budget is exceeded."""
+    if cost_map is None:
+        cost_map = COST_MAP
+
+    limit = get_query_cost_limit()
+    analyzer = QueryCostAnalyzer(schema, document_ast, variables, cost_map, limit)
+    return analyzer.get_cost(operation_name), limit
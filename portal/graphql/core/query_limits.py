@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from django.conf import settings
+from graphql.error import GraphQLError
+from graphql.language import ast
+
+
+class QueryLimitError(GraphQLError):
+    pass
+
+
+@dataclass
+class QueryShape:
+    depth: int = 0
+    aliases: int = 0
+    fields: int = 0
+
+
+class QueryShapeAnalyzer:
+    """Measure the selection depth, alias count and field count of an operation.
+
+    Fragments count at every place they are used, but each fragment is only
+    measured once. Introspection fields are not measured. When limits are
+    given, measuring stops as soon as a part of the operation exceeds them.
+    """
+
+    def __init__(self, document_ast, limits: Optional[QueryShape] = None):
+        self.limits = limits or QueryShape()
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document_ast.definitions
+            if isinstance(definition, ast.FragmentDefinition)
+        }
+        self.fragment_shapes: Dict[str, QueryShape] = {}
+        self.operations = [
+            definition
+            for definition in document_ast.definitions
+            if isinstance(definition, ast.OperationDefinition)
+        ]
+
+    def get_operation(self, operation_name: Optional[str]):
+        if not operation_name:
+            return self.operations[0] if len(self.operations) == 1 else None
+        for operation in self.operations:
+            if operation.name and operation.name.value == operation_name:
+                return operation
+        return None
+
+    def get_shape(self, operation_name: Optional[str] = None) -> QueryShape:
+        operation = self.get_operation(operation_name)
+        if operation is None:
+            return QueryShape()
+        return self.measure_selection_set(operation.selection_set, ())
+
+    def measure_selection_set(self, selection_set, visited) -> QueryShape:
+        """Return the shape of the selection set, with depth counted from it."""
+        shape = QueryShape()
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                if selection.name.value.startswith("__"):
+                    continue
+                child = QueryShape()
+                if selection.selection_set:
+                    child = self.measure_selection_set(selection.selection_set, visited)
+                shape.fields += 1 + child.fields
+                shape.aliases += child.aliases + (1 if selection.alias else 0)
+                shape.depth = max(shape.depth, child.depth + 1)
+            elif isinstance(selection, ast.InlineFragment):
+                self.add_shape(
+                    shape, self.measure_selection_set(selection.selection_set, visited)
+                )
+            elif isinstance(selection, ast.FragmentSpread):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited:
+                    continue
+                if name not in self.fragment_shapes:
+                    self.fragment_shapes[name] = self.measure_selection_set(
+                        fragment.selection_set, (*visited, name)
+                    )
+                self.add_shape(shape, self.fragment_shapes[name])
+            self.check_limits(shape)
+        return shape
+
+    @staticmethod
+    def add_shape(shape: QueryShape, other: QueryShape):
+        shape.fields += other.fields
+        shape.aliases += other.aliases
+        shape.depth = max(shape.depth, other.depth)
+
+    def check_limits(self, shape: QueryShape):
+        limits = [
+            (shape.depth, self.limits.depth, "depth"),
+            (shape.aliases, self.limits.aliases, "number of aliases"),
+            (shape.fields, self.limits.fields, "number of fields"),
+        ]
+        for value, limit, name in limits:
+            if limit and value > limit:
+                raise QueryLimitError(
+                    f"The query exceeds the maximum {name} of {limit}. "
+                    f"Actual {name} is {value}."
+                )
+
+
+def validate_query_limits(document_ast, operation_name: Optional[str]):
+    """Raise if the operation is deeper or broader than the configured limits.
+
+    A limit set to 0 is not checked.
+    """
+    limits = QueryShape(
+        depth=settings.GRAPHQL_MAX_QUERY_DEPTH,
+        aliases=settings.GRAPHQL_MAX_QUERY_ALIASES,
+        fields=settings.GRAPHQL_MAX_QUERY_FIELDS,
+    )
+    QueryShapeAnalyzer(document_ast, limits).get_shape(operation_name)
@@ -0,0 +1,112 @@
+import hashlib
+import json
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpRequest
+from graphql import GraphQLDocument
+
+from ... import __version__ as portal_version
+from ...attribute.models import AssignedEntryAttributeValue, Attribute, AttributeValue
+from ...attribute.signals import entry_attribute_values_assigned
+from ...channel.models import Channel
+from ...core.auth import get_token_from_request
+from ...document.models import Document, DocumentFile
+from ...entry.models import (
+    Category,
+    CategoryEntry,
+    Entry,
+    EntryChannelListing,
+    EntryType,
+)
+from ...event.models import Event
+from ...investment.models import Investment, Item
+from ...session.models import Session
+from .cache_versions import (
+    get_cache_version,
+    get_schema_name,
+    invalidate_cache_version_on_commit,
+)
+
+# Changes of these models invalidate all cached responses of the tenant.
+INVALIDATING_MODELS = [
+    AssignedEntryAttributeValue,
+    Attribute,
+    AttributeValue,
+    Category,
+    CategoryEntry,
+    Channel,
+    Document,
+    DocumentFile,
+    Entry,
+    EntryChannelListing,
+    EntryType,
+    Event,
+    Investment,
+    Item,
+    Session,
+]
+
+RESPONSE_CACHE = "response"
+
+
+def is_response_cacheable(
+    request: HttpRequest, document: GraphQLDocument, operation_name: Optional[str]
+) -> bool:
+    """Return whether the response can be shared by all anonymous requests."""
+    if not settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT:
+        return False
+    if get_token_from_request(request):
+        return False
+    return document.get_operation_type(operation_name) == "query"
+
+
+def get_response_cache_key(
+    query: str, operation_name: Optional[str], variables: Optional[dict]
+) -> str:
+    """Return the key of the response in the current tenant's cache.
+
+    The channel is given as an argument in the query or in its variables, so it
+    is part of the hashed payload. The key contains the tenant's cache version,
+    bumping it invalidates all of its responses at once.
+    """
+    schema_name = get_schema_name()
+    version = get_cache_version(RESPONSE_CACHE, schema_name)
+    payload = json.dumps(
+        [query, operation_name, variables], cls=DjangoJSONEncoder, sort_keys=True
+    )
+    payload_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{portal_version}-response-{schema_name}-{version}-{payload_hash}"
+
+
+def invalidate_tenant_response_cache(sender, **kwargs):
+    invalidate_cache_version_on_commit(RESPONSE_CACHE)
+
+
+for model in INVALIDATING_MODELS:
+    post_save.connect(
+        invalidate_tenant_response_cache,
+        sender=model,
+        dispatch_uid=f"response_cache_post_save_{model._meta.label_lower}",
+    )
+    post_delete.connect(
+        invalidate_tenant_response_cache,
+        sender=model,
+        dispatch_uid=f"response_cache_post_delete_{model._meta.label_lower}",
+    )
+
+# Categories of entries are changed through the m2m relation and values are
+# assigned to entries in bulk, neither sends the model signals.
+m2m_changed.connect(
+    invalidate_tenant_response_cache,
+    sender=Category.entries.through,
+    dispatch_uid="response_cache_m2m_changed_category_entries",
+)
+entry_attribute_values_assigned.connect(
+    invalidate_tenant_response_cache,
+    sender=AssignedEntryAttributeValue,
+    dispatch_uid="response_cache_entry_attribute_values_assigned",
+)
@@ -0,0 +1,130 @@
+"""Benchmark of backward pagination of connections.
+
+Compares building edges of `last: 100` pages with the previous implementation,
+which reversed the fetched records in Python and read the cursor values of
+every record by walking the sorting field paths, with the keyset one selecting
+cursor values in the same query.
+
+Run it with:
+    BENCHMARK_PAGINATION=1 pytest portal/graphql/core/tests/benchmark -s
+"""
+
+import json
+import os
+import time
+
+import pytest
+from graphql_relay.connection.connectiontypes import Edge
+from graphql_relay.utils import base64
+
+from .....entry.models import Entry, EntryType
+from ...connection import (
+    _annotate_cursor_values,
+    _get_edges_for_connection,
+    _get_page_info,
+)
+from ...cursors import get_sort_signature
+
+ENTRIES_COUNT = int(os.environ.get("BENCHMARK_PAGINATION_ENTRIES", 100_000))
+PAGE_SIZE = 100
+PAGES = 20
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("BENCHMARK_PAGINATION"),
+    reason="Set BENCHMARK_PAGINATION to run the pagination benchmark.",
+)
+
+
+def to_global_cursor(values):
+    values = [value if value is None else str(value) for value in values]
+    return base64(json.dumps(values))
+
+
+def get_field_value(instance, field_name):
+    attr = instance
+    for elem in field_name.split("__"):
+        attr = getattr(attr, elem, None)
+    if callable(attr):
+        return "%s" % attr()
+    return attr
+
+
+def legacy_get_edges_for_connection(edge_type, qs, args, sorting_fields):
+    before = args.get("before")
+    last = args.get("last")
+    start_slice, end_slice = 1, None
+
+    matching_records = list(qs)
+    matching_records = list(reversed(matching_records))
+    if len(matching_records) <= last:
+        start_slice = 0
+    page_info = _get_page_info(matching_records, before, None, last)
+    matching_records = matching_records[start_slice:end_slice]
+
+    edges = [
+        edge_type(
+            node=record,
+            cursor=to_global_cursor(
+                [get_field_value(record, field) for field in sorting_fields]
+            ),
+        )
+        for record in matching_records
+    ]
+    return edges, page_info
+
+
+@pytest.fixture
+def benchmark_entries():
+    entry_type = EntryType.objects.create(name="Benchmark", slug="benchmark")
+    Entry.objects.bulk_create(
+        [
+            Entry(
+                name=f"Entry {index:06}",
+                slug=f"entry-{index:06}",
+                entry_type=entry_type,
+            )
+            for index in range(ENTRIES_COUNT)
+        ],
+        batch_size=5000,
+    )
+
+
+def _get_pages(get_edges, sorting_fields, annotate):
+    # Pages are compared by records, as cursors of both paths are encoded
+    # differently.
+    # Ordered backwards, the way `last` pages are fetched.
+    qs = Entry.objects.order_by(*[f"-{field}" for field in sorting_fields])
+    if annotate:
+        qs = _annotate_cursor_values(qs, sorting_fields)
+    args = {"last": PAGE_SIZE}
+    pages = []
+    start = time.perf_counter()
+    for page in range(PAGES):
+        offset = page * PAGE_SIZE
+        edges, _ = get_edges(
+            Edge, qs[offset : offset + PAGE_SIZE + 1], args, sorting_fields
+        )
+        pages.append([edge.node.pk for edge in edges])
+    return pages, time.perf_counter() - start
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "sorting_fields", [["name", "slug"], ["entry_type__name", "slug"]]
+)
+def test_backward_pagination_benchmark(benchmark_entries, sorting_fields):
+    legacy_pages, legacy_time = _get_pages(
+        legacy_get_edges_for_connection, sorting_fields, annotate=False
+    )
+    signature = get_sort_signature(sorting_fields)
+
+    def get_edges(edge_type, qs, args, sorting_fields):
+        return _get_edges_for_connection(edge_type, qs, args, sorting_fields, signature)
+
+    pages, keyset_time = _get_pages(get_edges, sorting_fields, annotate=True)
+
+    assert pages == legacy_pages
+    print(
+        f"\n{ENTRIES_COUNT} entries, {PAGES} pages of {PAGE_SIZE} sorted by "
+        f"{sorting_fields}: legacy {legacy_time:.3f}s, keyset {keyset_time:.3f}s"
+    )
@@ -0,0 +1,159 @@
+import json
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connections
+from django.test import RequestFactory
+from promise import Promise
+
+from ....channel.models import Channel
+from ...schema import schema
+from ...views import AsyncGraphQLView
+from ..dataloader_cache import local_cache
+from ..dataloaders import AsyncDataLoader
+
+
+class ThreadNameLoader(AsyncDataLoader):
+    context_key = "thread_name"
+
+    def batch_load(self, keys):
+        thread_name = threading.current_thread().name
+        return [(key, thread_name) for key in keys]
+
+
+class BarrierLoader(AsyncDataLoader):
+    barrier = None
+
+    def batch_load(self, keys):
+        # Both loaders have to be inside `batch_load` at the same time.
+        self.barrier.wait()
+        return keys
+
+
+class FirstBarrierLoader(BarrierLoader):
+    context_key = "first_barrier"
+
+
+class SecondBarrierLoader(BarrierLoader):
+    context_key = "second_barrier"
+
+
+class ChannelSlugLoader(AsyncDataLoader):
+    context_key = "channel_slug"
+    shared_cache_models = (Channel,)
+    calls = 0
+
+    def batch_load(self, keys):
+        ChannelSlugLoader.calls += 1
+        slugs = dict(Channel.objects.filter(pk__in=keys).values_list("pk", "slug"))
+        return [(slugs.get(key), threading.current_thread().name) for key in keys]
+
+
+@pytest.fixture
+def loader_context():
+    return SimpleNamespace(user=None)
+
+
+def test_async_dataloader_runs_inline_by_default(loader_context, settings):
+    settings.GRAPHQL_DATALOADER_CONCURRENCY = 0
+    loader = ThreadNameLoader(loader_context)
+
+    results = loader.load_many([1, 2]).get()
+
+    thread_name = threading.current_thread().name
+    assert results == [(1, thread_name), (2, thread_name)]
+
+
+def test_async_dataloader_runs_batch_load_in_worker_pool(loader_context, settings):
+    settings.GRAPHQL_DATALOADER_CONCURRENCY = 2
+    loader = ThreadNameLoader(loader_context)
+
+    results = loader.load_many([1, 2]).get()
+
+    assert [key for key, _ in results] == [1, 2]
+    assert all(name.startswith("graphql-dataloader") for _, name in results)
+
+
+@pytest.mark.django_db
+def test_async_dataloader_runs_inline_in_transaction(loader_context, settings):
+    settings.GRAPHQL_DATALOADER_CONCURRENCY = 2
+    channel = Channel.objects.create(name="New", slug="new")
+
+    slug, thread_name = ChannelSlugLoader(loader_context).load(channel.pk).get()
+
+    # The uncommitted channel isn't visible to connections of worker threads.
+    assert slug == "new"
+    assert thread_name == threading.current_thread().name
+
+
+def test_async_dataloader_runs_inline_in_mutations(settings):
+    settings.GRAPHQL_DATALOADER_CONCURRENCY = 2
+    context = SimpleNamespace(user=None, allow_replica=False)
+
+    results = ThreadNameLoader(context).load_many([1, 2]).get()
+
+    thread_name = threading.current_thread().name
+    assert results == [(1, thread_name), (2, thread_name)]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_dataloader_uses_shared_cache(channel_city_1, settings):
+    settings.GRAPHQL_DATALOADER_CONCURRENCY = 2
+    settings.GRAPHQL_DATALOADER_CACHE_TIMEOUT = 60
+    cache.clear()
+    local_cache.clear()
+    ChannelSlugLoader.calls = 0
+
+    def load_slug():
+        context = SimpleNamespace(user=None)
+        return ChannelSlugLoader(context).load(channel_city_1.pk).get()
+
+    # The worker thread uses its own connection.
+    with mock.patch.dict(connections.settings["default"], {"CONN_MAX_AGE": 0}):
+        slug, thread_name = load_slug()
+    assert slug == channel_city_1.slug
+    assert thread_name.startswith("graphql-dataloader")
+
+    assert load_slug() == (slug, thread_name)
+    assert ChannelSlugLoader.calls == 1
+    cache.clear()
+    local_cache.clear()
+
+
+def test_async_dataloaders_dispatched_together_run_concurrently(
+    loader_context, settings
+):
+    settings.GRAPHQL_DATALOADER_CONCURRENCY = 2
+    BarrierLoader.barrier = threading.Barrier(2, timeout=5)
+
+    def resolve(_):
+        # Like resolvers, load the keys while the promise queue is processed.
+        first = FirstBarrierLoader(loader_context).load(1)
+        second = SecondBarrierLoader(loader_context).load(2)
+        return Promise.all([first, second])
+
+    results = Promise.resolve(None).then(resolve).get()
+
+    assert results == [1, 2]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_view_executes_query(channel_city_1):
+    request = RequestFactory().post(
+        "/graphql/",
+        data=json.dumps({"query": "{ channels { slug } }"}),
+        content_type="application/json",
+    )
+    view = AsyncGraphQLView.as_view(schema=schema)
+
+    # The request is executed in a worker thread with its own connection.
+    with mock.patch.dict(connections.settings["default"], {"CONN_MAX_AGE": 0}):
+        response = async_to_sync(view)(request)
+
+    content = json.loads(response.content)
+    assert response.status_code == 200
+    assert content["data"]["channels"] == [{"slug": channel_city_1.slug}]
@@ -0,0 +1,91 @@
+from unittest import mock
+
+import pytest
+from django.db import connections
+
+from ...tests.utils import get_graphql_content_from_response
+from .. import batching
+
+QUERY_CHANNELS = "query { channels { slug } }"
+QUERY_CHANNEL = "query ($slug: String) { channel(slug: $slug) { name } }"
+MUTATION_CHANNEL_DELETE = """
+    mutation {
+        channelDelete(id: "Q2hhbm5lbDox") {
+            errors {
+                field
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def worker_connections_closed_after_use():
+    # Worker threads keep their own connections; make them short-lived so the
+    # test database can be dropped at the end of the session.
+    with mock.patch.dict(connections.settings["default"], {"CONN_MAX_AGE": 0}):
+        yield
+
+
+@pytest.mark.django_db
+def test_batch_executed_serially_by_default(api_client, channel_city_1, settings):
+    settings.GRAPHQL_BATCH_CONCURRENCY = 0
+    data = [
+        {"query": QUERY_CHANNELS},
+        {"query": QUERY_CHANNEL, "variables": {"slug": channel_city_1.slug}},
+    ]
+
+    with mock.patch("portal.graphql.views.get_batch_executor") as get_batch_executor:
+        response = api_client.post(data)
+
+    content = get_graphql_content_from_response(response)
+    assert content[0]["data"]["channels"][0]["slug"] == channel_city_1.slug
+    assert content[1]["data"]["channel"]["name"] == channel_city_1.name
+    get_batch_executor.assert_not_called()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_batch_queries_executed_concurrently_in_order(
+    api_client,
+    channel_city_1,
+    channel_city_2,
+    settings,
+    worker_connections_closed_after_use,
+):
+    settings.GRAPHQL_BATCH_CONCURRENCY = 4
+    data = [
+        {"query": QUERY_CHANNEL, "variables": {"slug": channel_city_1.slug}},
+        {"query": QUERY_CHANNEL, "variables": {"slug": channel_city_2.slug}},
+        {"query": MUTATION_CHANNEL_DELETE},
+        {"query": QUERY_CHANNEL, "variables": {"slug": channel_city_2.slug}},
+        {"query": QUERY_CHANNEL, "variables": {"slug": channel_city_1.slug}},
+    ]
+
+    with mock.patch(
+        "portal.graphql.views.call_with_tenant_connection",
+        wraps=batching.call_with_tenant_connection,
+    ) as call_with_tenant_connection:
+        response = api_client.post(data)
+
+    content = get_graphql_content_from_response(response)
+    assert len(content) == 5
+    assert content[0]["data"]["channel"]["name"] == channel_city_1.name
+    assert content[1]["data"]["channel"]["name"] == channel_city_2.name
+    assert "channelDelete" in content[2]["data"]
+    assert content[3]["data"]["channel"]["name"] == channel_city_2.name
+    assert content[4]["data"]["channel"]["name"] == channel_city_1.name
+    assert call_with_tenant_connection.call_count == 4
+
+
+@pytest.mark.django_db
+def test_batch_over_max_size_is_rejected(api_client, settings):
+    settings.GRAPHQL_BATCH_MAX_SIZE = 2
+    data = [{"query": QUERY_CHANNELS}] * 3
+
+    response = api_client.post(data)
+
+    content = get_graphql_content_from_response(response)
+    assert response.status_code == 400
+    assert content["errors"][0]["message"] == (
+        "Batch cannot contain more than 2 operations."
+    )
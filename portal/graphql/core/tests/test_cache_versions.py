@@ -0,0 +1,60 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+
+from ....entry.models import EntryType
+from ....tests.utils import flush_post_commit_hooks
+from ..cache_versions import (
+    get_cache_version,
+    invalidate_cache_version,
+    invalidate_cache_version_on_commit,
+)
+from ..dataloader_cache import get_model_namespace
+from ..response_cache import RESPONSE_CACHE
+from ..total_count import COUNT_CACHE
+
+pytestmark = pytest.mark.django_db
+
+
+@mock.patch("portal.graphql.core.cache_versions.invalidate_cache_version")
+def test_versions_are_bumped_once_per_transaction(invalidate_mock):
+    flush_post_commit_hooks()
+    with transaction.atomic():
+        for i in range(3):
+            EntryType.objects.create(name=f"Type {i}", slug=f"type-{i}")
+
+    flush_post_commit_hooks()
+
+    namespaces = [call.args[0] for call in invalidate_mock.call_args_list]
+    assert sorted(namespaces) == sorted(
+        [COUNT_CACHE, RESPONSE_CACHE, get_model_namespace(EntryType)]
+    )
+
+
+@mock.patch("portal.graphql.core.cache_versions.invalidate_cache_version")
+def test_rolled_back_invalidation_does_not_hide_later_ones(invalidate_mock):
+    flush_post_commit_hooks()
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                invalidate_cache_version_on_commit(COUNT_CACHE)
+                raise ValueError()
+        except ValueError:
+            pass
+        invalidate_cache_version_on_commit(COUNT_CACHE)
+
+    flush_post_commit_hooks()
+
+    invalidate_mock.assert_called_once_with(COUNT_CACHE, mock.ANY)
+
+
+def test_evicted_version_is_not_reused():
+    cache.clear()
+    version = get_cache_version(COUNT_CACHE, "tenant")
+    invalidate_cache_version(COUNT_CACHE, "tenant")
+
+    cache.clear()
+
+    assert get_cache_version(COUNT_CACHE, "tenant") > version + 1
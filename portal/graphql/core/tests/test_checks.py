@@ -0,0 +1,85 @@
+from unittest import mock
+
+from ....entry.models import Entry
+from ..checks import (
+    SortOrder,
+    check_shared_cache,
+    check_sort_indexes,
+    is_sort_order_covered,
+)
+from ..total_count import CACHED, EXACT
+
+
+def test_connection_sort_orders_are_covered_by_indexes():
+    assert check_sort_indexes() == []
+
+
+def test_sort_order_covered_by_index_prefix():
+    sort_order = SortOrder("Query.entries", Entry, ["created", "name"])
+
+    assert is_sort_order_covered(sort_order)
+
+
+def test_sort_order_covered_by_unique_field():
+    assert is_sort_order_covered(SortOrder("Query.entries", Entry, ["slug"]))
+
+
+def test_sort_order_without_index():
+    assert not is_sort_order_covered(SortOrder("Query.entries", Entry, ["email"]))
+
+
+def test_sort_order_by_related_field_is_skipped():
+    sort_order = SortOrder("Query.entries", Entry, ["entry_type__name"])
+
+    assert is_sort_order_covered(sort_order)
+
+
+@mock.patch("portal.graphql.core.checks.get_connection_sort_orders")
+def test_check_reports_sort_order_without_index(get_connection_sort_orders_mock):
+    get_connection_sort_orders_mock.return_value = [
+        SortOrder("Query.entries(EMAIL)", Entry, ["email", "name"]),
+        SortOrder("Entry.related(EMAIL)", Entry, ["email", "name"]),
+    ]
+
+    errors = check_sort_indexes()
+
+    assert len(errors) == 1
+    assert errors[0].id == "graphql.E001"
+    assert errors[0].obj is Entry
+    assert "Query.entries(EMAIL)" in errors[0].msg
+
+
+def test_shared_cache_check_passes_when_caches_are_disabled(settings):
+    settings.GRAPHQL_DATALOADER_CACHE_TIMEOUT = 0
+    settings.GRAPHQL_FACETS_CACHE_TIMEOUT = 0
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 0
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGY = EXACT
+
+    assert check_shared_cache() == []
+
+
+def test_shared_cache_check_reports_process_cache(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGY = CACHED
+
+    errors = check_shared_cache()
+
+    assert [error.id for error in errors] == ["graphql.E002"]
+    assert errors[0].msg.startswith(
+        "GRAPHQL_RESPONSE_CACHE_TIMEOUT, GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT cache"
+    )
+
+
+def test_shared_cache_check_passes_with_shared_cache(settings):
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": "redis://localhost:6379/1",
+        }
+    }
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+
+    assert check_shared_cache() == []
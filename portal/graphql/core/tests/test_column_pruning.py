@@ -0,0 +1,138 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ....session.models import Session
+from ...document.types import Document
+from ...entry.types import Category, Entry
+from ...tests.utils import get_graphql_content
+from ..column_pruning import get_required_columns
+
+QUERY_ENTRIES = """
+    query ($sortBy: EntrySortingInput) {
+        entries(first: 10, sortBy: $sortBy) {
+            edges {
+                node {
+                    ...EntryFragment
+                }
+            }
+        }
+    }
+    fragment EntryFragment on Entry {
+        id
+        name
+        entryType {
+            name
+        }
+    }
+"""
+
+QUERY_SESSIONS = """
+    query {
+        sessions(first: 10) {
+            edges {
+                node {
+                    id
+                    name
+                    slug
+                    isPublished
+                    date
+                    channel {
+                        slug
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def _get_select_sql(queries, table):
+    return next(
+        query["sql"]
+        for query in queries
+        if query["sql"].startswith("SELECT") and f'FROM "{table}"' in query["sql"]
+    )
+
+
+def _get_entries_sql(queries):
+    return _get_select_sql(queries, "entry_entry")
+
+
+def test_get_required_columns_of_selected_fields():
+    columns = get_required_columns(
+        Document, ["id", "name", "expired", "files"], ["created", "entry__name"]
+    )
+
+    assert columns == {"id", "name", "expires", "default_file", "created", "entry"}
+
+
+def test_get_required_columns_of_unknown_field():
+    assert get_required_columns(Entry, ["name", "unknownField"], []) is None
+
+
+def test_get_required_columns_of_type_without_field_columns():
+    assert get_required_columns(Category, ["name"], []) is None
+
+
+@pytest.mark.django_db
+def test_entries_connection_fetches_only_selected_columns(
+    staff_api_client, vehicle_list
+):
+    with CaptureQueriesContext(connection) as queries:
+        response = staff_api_client.post_graphql(QUERY_ENTRIES)
+
+    content = get_graphql_content(response)
+    assert len(content["data"]["entries"]["edges"]) == len(vehicle_list)
+    sql = _get_entries_sql(queries.captured_queries)
+    assert '"entry_entry"."entry_type_id"' in sql
+    assert '"entry_entry"."document_number"' not in sql
+    assert '"entry_entry"."document_file"' not in sql
+
+
+@pytest.mark.django_db
+def test_entries_connection_fetches_sorting_columns(staff_api_client, vehicle_list):
+    variables = {"sortBy": {"field": "CREATED", "direction": "DESC"}}
+
+    with CaptureQueriesContext(connection) as queries:
+        response = staff_api_client.post_graphql(QUERY_ENTRIES, variables)
+
+    content = get_graphql_content(response)
+    assert content["data"]["entries"]["edges"][0]["node"]["name"]
+    sql = _get_entries_sql(queries.captured_queries)
+    assert '"entry_entry"."created"' in sql
+    assert '"entry_entry"."email"' not in sql
+
+
+@pytest.mark.django_db
+def test_sessions_connection_fetches_only_selected_columns(
+    staff_api_client, channel_city_1
+):
+    Session.objects.bulk_create(
+        Session(
+            name=f"Session {index}",
+            slug=f"session-{index}",
+            date="2024-01-01T12:00:00Z",
+            channel=channel_city_1,
+        )
+        for index in range(3)
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        response = staff_api_client.post_graphql(QUERY_SESSIONS)
+
+    content = get_graphql_content(response)
+    edges = content["data"]["sessions"]["edges"]
+    assert len(edges) == 3
+    assert {edge["node"]["channel"]["slug"] for edge in edges} == {channel_city_1.slug}
+    session_queries = [
+        query
+        for query in queries.captured_queries
+        if query["sql"].startswith("SELECT")
+        and 'FROM "session_session"' in query["sql"]
+    ]
+    assert len(session_queries) == 1
+    sql = session_queries[0]["sql"]
+    assert '"session_session"."channel_id"' in sql
+    assert '"session_session"."content"' not in sql
+    assert '"session_session"."search_vector"' not in sql
@@ -0,0 +1,144 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ....entry.models import Entry
+from ...tests.utils import get_graphql_content
+
+QUERY_ENTRIES = """
+    query ($first: Int, $last: Int, $after: String, $before: String) {
+        entries(first: $first, last: $last, after: $after, before: $before) {
+            edges {
+                cursor
+                node {
+                    name
+                }
+            }
+            pageInfo {
+                hasNextPage
+                hasPreviousPage
+                startCursor
+                endCursor
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def entries():
+    return Entry.objects.bulk_create(
+        [Entry(name=f"Entry {index}", slug=f"entry-{index}") for index in range(1, 6)]
+    )
+
+
+def _get_entries(client, **variables):
+    content = get_graphql_content(client.post_graphql(QUERY_ENTRIES, variables))
+    data = content["data"]["entries"]
+    return [edge["node"]["name"] for edge in data["edges"]], data["pageInfo"]
+
+
+@pytest.mark.django_db
+def test_forward_pagination(staff_api_client, entries):
+    names, page_info = _get_entries(staff_api_client, first=2)
+    assert names == ["Entry 1", "Entry 2"]
+    assert page_info["hasNextPage"] is True
+    assert page_info["hasPreviousPage"] is False
+
+    names, page_info = _get_entries(
+        staff_api_client, first=2, after=page_info["endCursor"]
+    )
+    assert names == ["Entry 3", "Entry 4"]
+    assert page_info["hasNextPage"] is True
+    assert page_info["hasPreviousPage"] is True
+
+
+@pytest.mark.django_db
+def test_backward_pagination(staff_api_client, entries):
+    names, page_info = _get_entries(staff_api_client, last=2)
+    assert names == ["Entry 4", "Entry 5"]
+    assert page_info["hasNextPage"] is False
+    assert page_info["hasPreviousPage"] is True
+
+    names, page_info = _get_entries(
+        staff_api_client, last=2, before=page_info["startCursor"]
+    )
+    assert names == ["Entry 2", "Entry 3"]
+
+    names, page_info = _get_entries(
+        staff_api_client, last=2, before=page_info["startCursor"]
+    )
+    assert names == ["Entry 1"]
+    assert page_info["hasPreviousPage"] is False
+    assert page_info["hasNextPage"] is True
+
+
+def _get_cursors(client, **variables):
+    content = get_graphql_content(client.post_graphql(QUERY_ENTRIES, variables))
+    return [edge["cursor"] for edge in content["data"]["entries"]["edges"]]
+
+
+@pytest.mark.django_db
+def test_cursors_match_between_directions(staff_api_client, entries):
+    forward_cursors = _get_cursors(staff_api_client, first=5)
+    backward_cursors = _get_cursors(staff_api_client, last=5)
+
+    assert len(forward_cursors) == 5
+    assert backward_cursors == forward_cursors
+
+
+QUERY_SORTED_ENTRIES = """
+    query ($first: Int, $after: String, $sortBy: EntrySortingInput) {
+        entries(first: $first, after: $after, sortBy: $sortBy) {
+            edges {
+                node {
+                    name
+                }
+            }
+            pageInfo {
+                endCursor
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+def test_cursor_of_different_sort_order_is_rejected(staff_api_client, entries):
+    content = get_graphql_content(
+        staff_api_client.post_graphql(QUERY_SORTED_ENTRIES, {"first": 2})
+    )
+    cursor = content["data"]["entries"]["pageInfo"]["endCursor"]
+    variables = {
+        "first": 2,
+        "after": cursor,
+        "sortBy": {"field": "NAME", "direction": "DESC"},
+    }
+
+    response = staff_api_client.post_graphql(QUERY_SORTED_ENTRIES, variables)
+
+    content = get_graphql_content(response, ignore_errors=True)
+    assert content["errors"][0]["message"] == (
+        "Received cursor was created for a different sort order."
+    )
+
+
+@pytest.mark.django_db
+def test_pagination_compares_sorting_fields_as_row_value(staff_api_client, entries):
+    variables = {"first": 2, "sortBy": {"field": "CREATED", "direction": "DESC"}}
+    content = get_graphql_content(
+        staff_api_client.post_graphql(QUERY_SORTED_ENTRIES, variables)
+    )
+    variables["after"] = content["data"]["entries"]["pageInfo"]["endCursor"]
+
+    with CaptureQueriesContext(connection) as queries:
+        response = staff_api_client.post_graphql(QUERY_SORTED_ENTRIES, variables)
+
+    content = get_graphql_content(response)
+    names = [edge["node"]["name"] for edge in content["data"]["entries"]["edges"]]
+    assert names == ["Entry 3", "Entry 2"]
+    assert any(
+        '("entry_entry"."created", "entry_entry"."name", "entry_entry"."slug") < ('
+        in query["sql"]
+        for query in queries.captured_queries
+    )
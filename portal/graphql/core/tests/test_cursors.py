@@ -0,0 +1,53 @@
+import datetime
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from ..cursors import CursorError, decode_cursor, encode_cursor, get_sort_signature
+
+SIGNATURE = get_sort_signature(["created", "name", "slug"], "-")
+
+
+def test_cursor_values_keep_their_types():
+    values = [
+        None,
+        True,
+        False,
+        0,
+        -42,
+        2**40,
+        1.5,
+        Decimal("12.3400"),
+        "Zażółć",
+        datetime.datetime(2023, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+        datetime.datetime(1969, 12, 31, 23, 59, 59),
+        datetime.date(2023, 5, 1),
+        uuid.UUID("2f8d4b4e-6a62-4a4d-9f33-3d6f4d4f1a2b"),
+    ]
+
+    cursor = encode_cursor(values, SIGNATURE)
+
+    decoded = decode_cursor(cursor, SIGNATURE)
+    assert decoded == values
+    assert [type(value) for value in decoded] == [type(value) for value in values]
+
+
+def test_cursor_is_url_safe_and_compact():
+    cursor = encode_cursor(["Entry 1", "entry-1"], SIGNATURE)
+
+    assert "=" not in cursor
+    assert len(cursor) < 32
+
+
+def test_cursor_of_different_sort_order_is_rejected():
+    cursor = encode_cursor(["Entry 1", "entry-1"], get_sort_signature(["name", "slug"]))
+
+    with pytest.raises(CursorError, match="different sort order"):
+        decode_cursor(cursor, get_sort_signature(["name", "slug"], "-"))
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "WyJhIl0", "AQAAAABp"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(CursorError):
+        decode_cursor(cursor, SIGNATURE)
@@ -0,0 +1,145 @@
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.signals import post_delete, post_save
+from django.test.utils import CaptureQueriesContext
+
+from ....attribute.models import EntryAttributeSortKey
+from ....entry.models import EntryChannelVisibility, EntryType
+from ....tests.utils import flush_post_commit_hooks
+from ...entry.dataloaders import EntryTypeByIdLoader
+from ...entry.dataloaders.attributes import EntryAttributesByEntryTypeIdLoader
+from ...entry.facets import FACETS_CACHE_MODELS
+from ...schema import schema  # noqa: F401
+from ..dataloader_cache import SHARED_CACHE_MODELS, LocalCache, local_cache
+from ..dataloaders import DataLoader
+
+
+@pytest.fixture
+def dataloader_cache_enabled(settings):
+    settings.GRAPHQL_DATALOADER_CACHE_TIMEOUT = 60
+    flush_post_commit_hooks()
+    cache.clear()
+    local_cache.clear()
+    yield
+    cache.clear()
+    local_cache.clear()
+
+
+def _load_entry_type(entry_type_id, **context):
+    context.setdefault("user", None)
+    loader = EntryTypeByIdLoader(SimpleNamespace(**context))
+    return loader.load(entry_type_id).get()
+
+
+def _count_selects(queries):
+    return sum(query["sql"].startswith("SELECT") for query in queries.captured_queries)
+
+
+@pytest.mark.django_db
+def test_shared_cache_is_used_by_next_requests(entry_type, dataloader_cache_enabled):
+    assert _load_entry_type(entry_type.pk) == entry_type
+
+    with CaptureQueriesContext(connection) as queries:
+        cached_entry_type = _load_entry_type(entry_type.pk)
+
+    assert cached_entry_type == entry_type
+    assert cached_entry_type is not _load_entry_type(entry_type.pk)
+    assert _count_selects(queries) == 0
+
+
+@pytest.mark.django_db
+def test_shared_cache_is_invalidated_on_commit(entry_type, dataloader_cache_enabled):
+    _load_entry_type(entry_type.pk)
+
+    EntryType.objects.filter(pk=entry_type.pk).update(name="Stale")
+    entry_type.name = "Updated"
+    entry_type.save(update_fields=["name"])
+    assert _load_entry_type(entry_type.pk).name != "Updated"
+
+    flush_post_commit_hooks()
+    assert _load_entry_type(entry_type.pk).name == "Updated"
+
+
+@pytest.mark.django_db
+def test_shared_cache_is_skipped_for_mutations(entry_type, dataloader_cache_enabled):
+    _load_entry_type(entry_type.pk)
+
+    with CaptureQueriesContext(connection) as queries:
+        _load_entry_type(entry_type.pk, allow_replica=False)
+
+    assert _count_selects(queries) == 1
+
+
+@pytest.mark.django_db
+def test_shared_cache_is_disabled_by_default(entry_type):
+    _load_entry_type(entry_type.pk)
+
+    with CaptureQueriesContext(connection) as queries:
+        _load_entry_type(entry_type.pk)
+
+    assert _count_selects(queries) == 1
+
+
+@pytest.mark.django_db
+def test_shared_cache_varies_by_requestor(
+    staff_user, color_attribute, vehicle_entry_type, dataloader_cache_enabled
+):
+    color_attribute.visible_in_website = False
+    color_attribute.save(update_fields=["visible_in_website"])
+    flush_post_commit_hooks()
+
+    def load_attributes(user):
+        loader = EntryAttributesByEntryTypeIdLoader(SimpleNamespace(user=user))
+        return loader.load(vehicle_entry_type.pk).get()
+
+    assert [attribute for attribute, in load_attributes(staff_user)] == [
+        color_attribute
+    ]
+    assert load_attributes(None) == []
+
+
+def _get_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _get_subclasses(subclass)
+
+
+def test_shared_cache_models_are_invalidated():
+    models = {
+        model
+        for loader in _get_subclasses(DataLoader)
+        for model in loader.shared_cache_models
+    }
+
+    assert models | set(FACETS_CACHE_MODELS) <= set(SHARED_CACHE_MODELS)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("model", [EntryAttributeSortKey, EntryChannelVisibility])
+def test_derived_rows_do_not_invalidate_caches(model):
+    flush_post_commit_hooks()
+
+    post_save.send(sender=model, instance=model(), created=True)
+    post_delete.send(sender=model, instance=model(), origin=None)
+
+    assert connection.run_on_commit == []
+
+
+def test_local_cache_evicts_least_recently_used():
+    local = LocalCache(maxsize=2)
+    local.set_many({"a": 1, "b": 2}, timeout=60)
+    local.get_many(["a"])
+
+    local.set_many({"c": 3}, timeout=60)
+
+    assert local.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+def test_local_cache_expires_values():
+    local = LocalCache(maxsize=2)
+    local.set_many({"a": 1}, timeout=-1)
+
+    assert local.get_many(["a"]) == {}
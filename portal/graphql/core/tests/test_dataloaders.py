@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from promise import Promise
+
+from ....channel.models import Channel
+from ....investment.models import Item
+from ...channel.dataloaders import ChannelByIdLoader
+from ...context import get_context_value
+from ...investment.dataloaders import ItemsByInvestmentIdLoader
+from ...tests.utils import get_graphql_content_from_response
+from ..dataloaders import DataLoader
+
+QUERY_CHANNELS = "query { channels { slug } }"
+MUTATION_CHANNEL_DELETE = """
+    mutation {
+        channelDelete(id: "Q2hhbm5lbDox") {
+            errors {
+                field
+            }
+        }
+    }
+"""
+
+
+def test_database_connection_name_is_resolved_per_request(replica_database):
+    query_context = SimpleNamespace(user=None, allow_replica=True)
+    mutation_context = SimpleNamespace(user=None, allow_replica=False)
+
+    query_loader = ChannelByIdLoader(query_context)
+    mutation_loader = ChannelByIdLoader(mutation_context)
+
+    assert query_loader.database_connection_name == "replica"
+    assert mutation_loader.database_connection_name == "default"
+    assert ChannelByIdLoader(query_context).database_connection_name == "replica"
+    assert "database_connection_name" not in vars(ChannelByIdLoader)
+    assert isinstance(DataLoader.__dict__["database_connection_name"], property)
+
+
+def _get_allow_replica(api_client, data):
+    allow_replica = []
+
+    def record_context(request):
+        context = get_context_value(request)
+        allow_replica.append(context.allow_replica)
+        return context
+
+    with mock.patch(
+        "portal.graphql.views.get_context_value", side_effect=record_context
+    ):
+        response = api_client.post(data)
+    get_graphql_content_from_response(response)
+    return allow_replica
+
+
+@pytest.mark.django_db
+def test_queries_are_allowed_to_read_from_replica(api_client):
+    assert _get_allow_replica(api_client, {"query": QUERY_CHANNELS}) == [True]
+
+
+@pytest.mark.django_db
+def test_mutations_read_from_primary_database(api_client):
+    data = [
+        {"query": QUERY_CHANNELS},
+        {"query": MUTATION_CHANNEL_DELETE},
+        {"query": QUERY_CHANNELS},
+    ]
+
+    assert _get_allow_replica(api_client, data) == [True, False, False]
+
+
+@pytest.mark.django_db
+def test_batch_load_is_split_into_chunks(published_investment, settings):
+    settings.GRAPHQL_DATALOADER_MAX_BATCH_SIZE = 2
+    Item.objects.bulk_create(
+        Item(name=name, value=100, investment=published_investment)
+        for name in ["tv", "radio", "internet"]
+    )
+    keys = [-1, published_investment.pk, -2, -3, -4]
+    loader = ItemsByInvestmentIdLoader(SimpleNamespace(user=None))
+
+    with CaptureQueriesContext(connection) as queries:
+        # Loads are batched when made while resolving a promise, like in the
+        # execution of a query.
+        results = Promise.resolve(None).then(lambda _: loader.load_many(keys)).get()
+
+    statements = [
+        query["sql"]
+        for query in queries.captured_queries
+        if "investment_item" in query["sql"]
+    ]
+    assert len(statements) == 3
+    assert all("= ANY(" in sql for sql in statements)
+    assert [len(items) for items in results] == [0, 3, 0, 0, 0]
+
+
+@pytest.mark.django_db
+def test_any_lookup(channel_city_1, channel_city_2):
+    channels = Channel.objects.filter(pk__any=[str(channel_city_2.pk), -1])
+
+    assert list(channels) == [channel_city_2]
+    assert not Channel.objects.filter(slug__any=[]).exists()
+    assert Channel.objects.filter(slug__any=[channel_city_1.slug]).get() == (
+        channel_city_1
+    )
@@ -0,0 +1,114 @@
+from unittest import mock
+
+import pytest
+from graphql import get_default_backend
+
+from ...schema import schema
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+from ..document_cache import DocumentCache, document_cache
+
+QUERY_CHANNELS = """
+    query {
+        channels {
+            slug
+        }
+    }
+"""
+
+
+def test_document_cache_returns_same_document_for_repeated_query():
+    cache = DocumentCache(maxsize=10)
+    backend = get_default_backend()
+
+    document, error = cache.document_from_string(backend, schema, QUERY_CHANNELS)
+    cached_document, cached_error = cache.document_from_string(
+        backend, schema, QUERY_CHANNELS
+    )
+
+    assert error is None
+    assert cached_error is None
+    assert cached_document is document
+    info = cache.info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_document_cache_stores_syntax_errors():
+    cache = DocumentCache(maxsize=10)
+    backend = get_default_backend()
+
+    with mock.patch.object(
+        backend, "document_from_string", wraps=backend.document_from_string
+    ) as document_from_string:
+        _, error = cache.document_from_string(backend, schema, "query {")
+        _, cached_error = cache.document_from_string(backend, schema, "query {")
+
+    assert document_from_string.call_count == 1
+    assert error.invalid
+    assert cached_error.invalid
+    assert cached_error.errors == error.errors
+
+
+def test_document_cache_stores_validation_errors():
+    cache = DocumentCache(maxsize=10)
+    backend = get_default_backend()
+
+    _, error = cache.document_from_string(backend, schema, "{ notExisting }")
+
+    assert error.invalid
+    assert "notExisting" in error.errors[0].message
+    assert cache.info().currsize == 1
+
+
+def test_document_cache_evicts_least_recently_used():
+    cache = DocumentCache(maxsize=2)
+    backend = get_default_backend()
+    first, second, third = (
+        "{ channels { id } }",
+        "{ channels { slug } }",
+        "{ me { id } }",
+    )
+
+    cache.document_from_string(backend, schema, first)
+    cache.document_from_string(backend, schema, second)
+    cache.document_from_string(backend, schema, first)
+    cache.document_from_string(backend, schema, third)
+
+    assert cache.get(cache.get_key(schema, first)) is not None
+    assert cache.get(cache.get_key(schema, second)) is None
+    assert cache.info().currsize == 2
+
+
+def test_document_cache_disabled_with_zero_size():
+    cache = DocumentCache(maxsize=0)
+    backend = get_default_backend()
+
+    document, _ = cache.document_from_string(backend, schema, QUERY_CHANNELS)
+
+    assert document is not None
+    assert cache.info().currsize == 0
+
+
+@pytest.mark.django_db
+def test_view_reuses_cached_document(api_client, channel_city_1):
+    document_cache.clear()
+
+    get_graphql_content(api_client.post_graphql(QUERY_CHANNELS))
+    content = get_graphql_content(api_client.post_graphql(QUERY_CHANNELS))
+
+    assert content["data"]["channels"][0]["slug"] == channel_city_1.slug
+    assert document_cache.info().hits == 1
+
+
+@pytest.mark.django_db
+def test_view_returns_cached_validation_error(api_client):
+    document_cache.clear()
+
+    api_client.post_graphql("{ notExisting }")
+    response = api_client.post_graphql("{ notExisting }")
+
+    content = get_graphql_content_from_response(response)
+    assert response.status_code == 400
+    assert "notExisting" in content["errors"][0]["message"]
+    assert document_cache.info().hits == 1
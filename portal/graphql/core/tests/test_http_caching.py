@@ -0,0 +1,67 @@
+import pytest
+
+from ...tests.fixtures import API_PATH
+from ...tests.utils import get_graphql_content_from_response
+
+QUERY_CHANNELS = "query { channels { slug } }"
+
+
+@pytest.mark.django_db
+def test_get_query_returns_caching_headers(api_client, channel_city_1, settings):
+    settings.GRAPHQL_CACHE_CONTROL = "public, max-age=30"
+
+    response = api_client.get(API_PATH, {"query": QUERY_CHANNELS})
+
+    content = get_graphql_content_from_response(response)
+    assert content["data"]["channels"] == [{"slug": channel_city_1.slug}]
+    assert response.status_code == 200
+    assert response["ETag"].startswith('"')
+    assert response["Cache-Control"] == "public, max-age=30"
+    assert "Authorization" in response["Vary"]
+
+
+@pytest.mark.django_db
+def test_get_query_with_matching_etag_returns_not_modified(api_client, channel_city_1):
+    response = api_client.get(API_PATH, {"query": QUERY_CHANNELS})
+    etag = response["ETag"]
+
+    response = api_client.get(
+        API_PATH, {"query": QUERY_CHANNELS}, HTTP_IF_NONE_MATCH=etag
+    )
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert not response.content
+
+
+@pytest.mark.django_db
+def test_get_query_etag_changes_with_result(api_client, channel_city_1):
+    response = api_client.get(API_PATH, {"query": QUERY_CHANNELS})
+    etag = response["ETag"]
+    channel_city_1.slug = "new-slug"
+    channel_city_1.save(update_fields=["slug"])
+
+    response = api_client.get(
+        API_PATH, {"query": QUERY_CHANNELS}, HTTP_IF_NONE_MATCH=etag
+    )
+
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_get_query_of_authenticated_user_is_private(staff_api_client, channel_city_1):
+    response = staff_api_client.get(API_PATH, {"query": QUERY_CHANNELS})
+
+    assert response.status_code == 200
+    assert "private" in response["Cache-Control"]
+    assert "no-cache" in response["Cache-Control"]
+
+
+@pytest.mark.django_db
+def test_post_query_has_no_caching_headers(api_client, channel_city_1):
+    response = api_client.post_graphql(QUERY_CHANNELS)
+
+    assert response.status_code == 200
+    assert not response.has_header("ETag")
+    assert not response.has_header("Cache-Control")
@@ -0,0 +1,54 @@
+import datetime
+import json
+import uuid
+from collections import OrderedDict
+from decimal import Decimal
+
+import pytest
+from django.core.serializers.json import DjangoJSONEncoder
+
+from ..json_encoder import dumps, iter_dumps
+
+DATA = OrderedDict(
+    [
+        ("decimal", Decimal("10.50")),
+        (
+            "datetime",
+            datetime.datetime(2023, 1, 2, 3, 4, 5, 678901, datetime.timezone.utc),
+        ),
+        ("date", datetime.date(2023, 1, 2)),
+        ("time", datetime.time(3, 4, 5, 678901)),
+        ("uuid", uuid.UUID("12345678-1234-5678-1234-567812345678")),
+        ("nested", {"list": [1, "two", None, {"three": 3.5}], 4: True}),
+    ]
+)
+
+
+@pytest.mark.parametrize("encoder", ["orjson", "json"])
+def test_dumps_matches_django_json_encoder(encoder, settings):
+    settings.GRAPHQL_JSON_ENCODER = encoder
+    expected = json.loads(json.dumps(DATA, cls=DjangoJSONEncoder))
+
+    assert json.loads(dumps(DATA)) == expected
+
+
+@pytest.mark.parametrize("encoder", ["orjson", "json"])
+def test_iter_dumps_yields_list_items_separately(encoder, settings):
+    settings.GRAPHQL_JSON_ENCODER = encoder
+    data = {"data": {"entries": [{"id": 1}, {"id": 2}]}, "errors": []}
+
+    chunks = list(iter_dumps(data))
+
+    assert json.loads(b"".join(chunks)) == data
+    assert b"," + dumps({"id": 2}) in chunks
+
+
+@pytest.mark.django_db
+def test_streaming_response(api_client, channel_city_1, settings):
+    settings.GRAPHQL_STREAMING_RESPONSES = True
+
+    response = api_client.post_graphql("query { channels { slug } }")
+
+    assert response.streaming
+    content = json.loads(b"".join(response.streaming_content))
+    assert content["data"]["channels"] == [{"slug": channel_city_1.slug}]
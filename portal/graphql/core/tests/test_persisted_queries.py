@@ -0,0 +1,133 @@
+import json
+
+import pytest
+from django.core.cache import cache
+
+from ...tests.fixtures import API_PATH
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+from ..persisted_queries import get_persisted_query, get_persisted_query_hash
+
+pytestmark = pytest.mark.django_db
+
+QUERY_CHANNELS = """
+    query {
+        channels {
+            slug
+        }
+    }
+"""
+
+MUTATION_CHANNEL_DELETE = """
+    mutation {
+        channelDelete(id: "Q2hhbm5lbDox") {
+            errors {
+                field
+            }
+        }
+    }
+"""
+
+
+def _persisted_query_extensions(query):
+    return {
+        "persistedQuery": {
+            "version": 1,
+            "sha256Hash": get_persisted_query_hash(query),
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+def test_persisted_query_not_found(api_client):
+    data = {"extensions": _persisted_query_extensions(QUERY_CHANNELS)}
+
+    response = api_client.post(data)
+
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_registered_and_resolved(api_client, channel_city_1):
+    extensions = _persisted_query_extensions(QUERY_CHANNELS)
+
+    response = api_client.post({"query": QUERY_CHANNELS, "extensions": extensions})
+    get_graphql_content(response)
+    response = api_client.post({"extensions": extensions})
+
+    content = get_graphql_content(response)
+    assert content["data"]["channels"][0]["slug"] == channel_city_1.slug
+    query_hash = extensions["persistedQuery"]["sha256Hash"]
+    assert get_persisted_query(query_hash) == QUERY_CHANNELS
+
+
+def test_persisted_query_hash_mismatch(api_client):
+    extensions = _persisted_query_extensions("{ channels { id } }")
+
+    response = api_client.post({"query": QUERY_CHANNELS, "extensions": extensions})
+
+    content = get_graphql_content_from_response(response)
+    assert response.status_code == 400
+    assert content["errors"][0]["message"] == (
+        "Provided sha256Hash does not match query."
+    )
+
+
+def test_persisted_query_invalid_version(api_client):
+    extensions = _persisted_query_extensions(QUERY_CHANNELS)
+    extensions["persistedQuery"]["version"] = 2
+
+    response = api_client.post({"extensions": extensions})
+
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "Unsupported persisted query version."
+
+
+def test_persisted_query_disabled(api_client, settings):
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+    extensions = _persisted_query_extensions(QUERY_CHANNELS)
+
+    response = api_client.post({"query": QUERY_CHANNELS, "extensions": extensions})
+
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotSupported"
+
+
+def test_persisted_query_over_get(api_client, channel_city_1):
+    extensions = _persisted_query_extensions(QUERY_CHANNELS)
+    api_client.post({"query": QUERY_CHANNELS, "extensions": extensions})
+
+    response = api_client.get(API_PATH, {"extensions": json.dumps(extensions)})
+
+    content = get_graphql_content(response)
+    assert content["data"]["channels"][0]["slug"] == channel_city_1.slug
+
+
+def test_persisted_mutation_over_get_is_rejected(api_client):
+    extensions = _persisted_query_extensions(MUTATION_CHANNEL_DELETE)
+
+    response = api_client.get(
+        API_PATH,
+        {
+            "query": MUTATION_CHANNEL_DELETE,
+            "extensions": json.dumps(extensions),
+        },
+    )
+
+    content = get_graphql_content_from_response(response)
+    assert response.status_code == 400
+    assert content["errors"][0]["message"] == (
+        "Can only perform a query operation from a GET request."
+    )
+
+
+def test_get_with_invalid_extensions_json(api_client):
+    response = api_client.get(API_PATH, {"extensions": "{not-json"})
+
+    content = get_graphql_content_from_response(response)
+    assert response.status_code == 400
+    assert content["errors"]
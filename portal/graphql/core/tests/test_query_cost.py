@@ -0,0 +1,168 @@
+from unittest import mock
+
+import pytest
+from graphql.language.parser import parse
+
+from ....customer.models import Client
+from ...schema import schema
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+from ..query_cost import QueryCostAnalyzer, QueryCostError
+
+COST_MAP = {
+    "Query": {
+        "entries": {"complexity": 5, "multipliers": ["first", "last"]},
+        "channels": {"complexity": 5},
+    },
+    "Entry": {
+        "documents": {"complexity": 1, "multipliers": ["first", "last"]},
+        "entryType": {"complexity": 1},
+    },
+}
+
+QUERY_ENTRIES = """
+    query ($first: Int) {
+        entries(first: $first) {
+            edges {
+                node {
+                    name
+                    entryType {
+                        name
+                    }
+                    documents(first: 10) {
+                        edges {
+                            node {
+                                name
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def _get_cost(query, variables=None, operation_name=None):
+    document_ast = parse(query)
+    analyzer = QueryCostAnalyzer(schema, document_ast, variables, COST_MAP)
+    return analyzer.get_cost(operation_name)
+
+
+def test_query_cost_multiplies_connection_fields():
+    # (5 + (entryType 1 + documents (1 + 0) * 10)) * 20
+    assert _get_cost(QUERY_ENTRIES, {"first": 20}) == 320
+
+
+def test_query_cost_without_multiplier_argument():
+    # (5 + (1 + (1 + 0) * 10)) * 1
+    assert _get_cost(QUERY_ENTRIES) == 16
+
+
+def test_query_cost_counts_fragments():
+    query = """
+        query {
+            entries(last: 2) {
+                edges {
+                    node {
+                        ...EntryFragment
+                        ... on Entry {
+                            documents(first: 3) {
+                                totalCount
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        fragment EntryFragment on Entry {
+            entryType {
+                name
+            }
+        }
+    """
+    # (5 + 1 + (1 * 3)) * 2
+    assert _get_cost(query) == 18
+
+
+def _get_doubling_fragments_query(count):
+    # Each fragment spreads the previous one twice, so the query expands to
+    # 2 ** count entry types.
+    fragments = ["fragment F0 on Entry { entryType { name } }"]
+    for i in range(1, count):
+        fragments.append(f"fragment F{i} on Entry {{ ...F{i - 1} ...F{i - 1} }}")
+    query = "query { entries(first: 1) { edges { node { ...F%s } } } }" % (count - 1)
+    return "\n".join([query, *fragments])
+
+
+def test_query_cost_measures_each_fragment_once():
+    query = _get_doubling_fragments_query(20)
+
+    # 5 + 2 ** 19 * 1
+    assert _get_cost(query) == 5 + 2**19
+
+
+def test_query_cost_stops_at_the_limit():
+    query = _get_doubling_fragments_query(40)
+    analyzer = QueryCostAnalyzer(schema, parse(query), None, COST_MAP, limit=1000)
+
+    with pytest.raises(QueryCostError) as error:
+        analyzer.get_cost()
+
+    assert str(error.value) == (
+        "The query exceeds the maximum cost of 1000. Actual cost is 1024."
+    )
+    assert len(analyzer.fragment_costs) == 10
+
+
+def test_query_cost_selects_operation_by_name():
+    query = """
+        query Entries { entries(first: 2) { totalCount } }
+        query Channels { channels { slug } }
+    """
+    assert _get_cost(query, operation_name="Entries") == 10
+    assert _get_cost(query, operation_name="Channels") == 5
+
+
+def test_query_cost_ignores_introspection_fields():
+    assert _get_cost("{ __schema { types { name } } }") == 0
+
+
+@pytest.mark.django_db
+def test_query_cost_returned_in_extensions(api_client, settings):
+    settings.GRAPHQL_QUERY_COST_LIMIT = 1000
+    query = "{ channels { slug } }"
+
+    response = api_client.post_graphql(query)
+
+    content = get_graphql_content(response)
+    assert content["extensions"]["cost"] == {
+        "requestedQueryCost": 5,
+        "maximumAvailable": 1000,
+    }
+
+
+@pytest.mark.django_db
+def test_query_over_cost_limit_is_rejected(api_client, settings):
+    settings.GRAPHQL_QUERY_COST_LIMIT = 100
+
+    response = api_client.post_graphql(QUERY_ENTRIES, {"first": 100})
+
+    content = get_graphql_content_from_response(response)
+    assert response.status_code == 400
+    assert "data" not in content
+    error = content["errors"][0]
+    assert error["message"].startswith("The query exceeds the maximum cost of 100.")
+    assert error["extensions"]["cost"]["maximumAvailable"] == 100
+
+
+@pytest.mark.django_db
+def test_query_cost_uses_tenant_limit(api_client, settings):
+    settings.GRAPHQL_QUERY_COST_LIMIT = 100000
+    tenant = Client(schema_name="tenant", graphql_query_cost_limit=10)
+
+    with mock.patch("portal.graphql.core.query_cost.connection") as connection:
+        connection.tenant = tenant
+        response = api_client.post_graphql(QUERY_ENTRIES, {"first": 100})
+
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["cost"]["maximumAvailable"] == 10
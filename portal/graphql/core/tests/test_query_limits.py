@@ -0,0 +1,125 @@
+import pytest
+from graphql.language.parser import parse
+
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+from ..query_limits import QueryLimitError, QueryShape, QueryShapeAnalyzer
+
+QUERY_NESTED_ENTRIES = """
+    query {
+        entries(first: 1) {
+            edges {
+                node {
+                    documents(first: 1) {
+                        edges {
+                            node {
+                                entry {
+                                    name
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def _get_shape(query, operation_name=None):
+    return QueryShapeAnalyzer(parse(query)).get_shape(operation_name)
+
+
+def test_query_shape_of_nested_query():
+    assert _get_shape(QUERY_NESTED_ENTRIES) == QueryShape(depth=8, aliases=0, fields=8)
+
+
+def test_query_shape_counts_aliases_and_fragments():
+    query = """
+        query {
+            first: channels { ...ChannelFragment }
+            second: channels { ...ChannelFragment }
+        }
+        fragment ChannelFragment on Channel {
+            slug
+            ... on Channel { name }
+        }
+    """
+    assert _get_shape(query) == QueryShape(depth=2, aliases=2, fields=6)
+
+
+def test_query_shape_ignores_introspection_fields():
+    query = "{ __schema { types { name fields { name } } } }"
+    assert _get_shape(query) == QueryShape()
+
+
+def _get_doubling_fragments_query(count):
+    # Each fragment spreads the previous one twice, so the query expands to
+    # 2 ** count fields.
+    fragments = ["fragment F0 on Channel { slug }"]
+    for i in range(1, count):
+        fragments.append(f"fragment F{i} on Channel {{ ...F{i - 1} ...F{i - 1} }}")
+    return "query { channels { ...F%s } }\n%s" % (count - 1, "\n".join(fragments))
+
+
+def test_query_shape_measures_each_fragment_once():
+    query = _get_doubling_fragments_query(20)
+
+    assert _get_shape(query) == QueryShape(depth=2, aliases=0, fields=2**19 + 1)
+
+
+def test_query_shape_stops_at_the_first_exceeded_limit():
+    query = _get_doubling_fragments_query(40)
+    analyzer = QueryShapeAnalyzer(parse(query), QueryShape(fields=1000))
+
+    with pytest.raises(QueryLimitError) as error:
+        analyzer.get_shape()
+
+    assert str(error.value) == (
+        "The query exceeds the maximum number of fields of 1000. "
+        "Actual number of fields is 1024."
+    )
+    assert len(analyzer.fragment_shapes) == 10
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "setting, message",
+    [
+        ("GRAPHQL_MAX_QUERY_DEPTH", "The query exceeds the maximum depth of 7."),
+        ("GRAPHQL_MAX_QUERY_FIELDS", "The query exceeds the maximum number of fields"),
+    ],
+)
+def test_query_over_limit_is_rejected(api_client, settings, setting, message):
+    setattr(settings, setting, 7)
+
+    response = api_client.post_graphql(QUERY_NESTED_ENTRIES)
+
+    content = get_graphql_content_from_response(response)
+    assert response.status_code == 400
+    assert content["errors"][0]["message"].startswith(message)
+
+
+@pytest.mark.django_db
+def test_query_with_too_many_aliases_is_rejected(api_client, settings):
+    settings.GRAPHQL_MAX_QUERY_ALIASES = 1
+    query = "query { a: channels { slug } b: channels { slug } }"
+
+    response = api_client.post_graphql(query)
+
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "The query exceeds the maximum number of aliases of 1. "
+        "Actual number of aliases is 2."
+    )
+
+
+@pytest.mark.django_db
+def test_query_limits_disabled(api_client, settings, channel_city_1):
+    settings.GRAPHQL_MAX_QUERY_DEPTH = 0
+    settings.GRAPHQL_MAX_QUERY_ALIASES = 0
+    settings.GRAPHQL_MAX_QUERY_FIELDS = 0
+    query = "query { a: channels { slug } b: channels { slug } }"
+
+    content = get_graphql_content(api_client.post_graphql(query))
+
+    assert content["data"]["a"] == content["data"]["b"]
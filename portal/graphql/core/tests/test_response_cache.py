@@ -0,0 +1,130 @@
+import pytest
+from django.core.cache import cache
+
+from ....attribute.utils import associate_attribute_values_to_instance
+from ....channel.models import Channel
+from ....tests.utils import flush_post_commit_hooks
+from ...tests.utils import get_graphql_content
+
+QUERY_CHANNELS = "query { channels { name } }"
+
+QUERY_RED_ENTRIES = """
+    query ($channel: String) {
+        entries(
+            first: 10,
+            channel: $channel,
+            filter: {attributes: [{slug: "color", values: ["red"]}]}
+        ) {
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def response_cache_enabled(settings):
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    # Invalidate the cache for the changes made by the other fixtures up front.
+    flush_post_commit_hooks()
+
+
+def _get_channel_names(client):
+    content = get_graphql_content(client.post_graphql(QUERY_CHANNELS))
+    return [channel["name"] for channel in content["data"]["channels"]]
+
+
+@pytest.mark.django_db
+def test_anonymous_query_response_is_cached(
+    api_client, channel_city_1, response_cache_enabled
+):
+    assert _get_channel_names(api_client) == [channel_city_1.name]
+
+    # Bulk updates don't send signals, so the cached response is returned.
+    Channel.objects.update(name="Renamed")
+
+    assert _get_channel_names(api_client) == [channel_city_1.name]
+
+
+@pytest.mark.django_db
+def test_response_cache_disabled_by_default(api_client, channel_city_1):
+    assert _get_channel_names(api_client) == [channel_city_1.name]
+
+    Channel.objects.update(name="Renamed")
+
+    assert _get_channel_names(api_client) == ["Renamed"]
+
+
+@pytest.mark.django_db
+def test_authenticated_query_response_is_not_cached(
+    staff_api_client, channel_city_1, response_cache_enabled
+):
+    assert _get_channel_names(staff_api_client) == [channel_city_1.name]
+
+    Channel.objects.update(name="Renamed")
+
+    assert _get_channel_names(staff_api_client) == ["Renamed"]
+
+
+@pytest.mark.django_db
+def test_response_cache_invalidated_on_model_change(
+    api_client,
+    channel_city_1,
+    response_cache_enabled,
+    django_capture_on_commit_callbacks,
+):
+    assert _get_channel_names(api_client) == [channel_city_1.name]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        channel_city_1.name = "Renamed"
+        channel_city_1.save(update_fields=["name"])
+
+    assert _get_channel_names(api_client) == ["Renamed"]
+
+
+@pytest.mark.django_db
+def test_response_cache_invalidated_on_assigned_values(
+    api_client,
+    provider,
+    color_attribute,
+    channel_city_1,
+    entries_channel_listings,
+    response_cache_enabled,
+):
+    variables = {"channel": channel_city_1.slug}
+
+    def get_entry_names():
+        response = api_client.post_graphql(QUERY_RED_ENTRIES, variables)
+        edges = get_graphql_content(response)["data"]["entries"]["edges"]
+        return [edge["node"]["name"] for edge in edges]
+
+    flush_post_commit_hooks()
+    assert get_entry_names() == []
+
+    red = color_attribute.values.get(slug="red")
+    associate_attribute_values_to_instance(provider, color_attribute, red)
+    flush_post_commit_hooks()
+
+    assert get_entry_names() == [provider.name]
+
+
+@pytest.mark.django_db
+def test_response_cache_key_contains_variables(
+    api_client, channel_city_1, channel_city_2, response_cache_enabled
+):
+    query = "query ($slug: String) { channel(slug: $slug) { name } }"
+
+    for channel in [channel_city_1, channel_city_2]:
+        response = api_client.post_graphql(query, {"slug": channel.slug})
+        content = get_graphql_content(response)
+        assert content["data"]["channel"]["name"] == channel.name
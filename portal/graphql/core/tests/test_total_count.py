@@ -0,0 +1,101 @@
+import pytest
+from django.core.cache import cache
+
+from ....attribute.utils import associate_attribute_values_to_instance
+from ....entry.models import Entry
+from ....tests.utils import flush_post_commit_hooks
+from ...tests.utils import get_graphql_content
+from ..total_count import CACHED, ESTIMATED, get_total_count
+
+QUERY_ENTRIES_TOTAL_COUNT = """
+    query {
+        entries(first: 1) {
+            totalCount
+        }
+    }
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _get_total_count(client):
+    content = get_graphql_content(client.post_graphql(QUERY_ENTRIES_TOTAL_COUNT))
+    return content["data"]["entries"]["totalCount"], content["extensions"]
+
+
+@pytest.mark.django_db
+def test_total_count_strategy_in_extensions(staff_api_client, vehicle_list):
+    total_count, extensions = _get_total_count(staff_api_client)
+
+    assert total_count == len(vehicle_list)
+    assert extensions["totalCount"] == [
+        {"path": ["entries", "totalCount"], "strategy": "exact"}
+    ]
+
+
+@pytest.mark.django_db
+def test_cached_total_count_invalidated_on_change(
+    staff_api_client, vehicle_list, vehicle_entry_type, settings
+):
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGY = CACHED
+    flush_post_commit_hooks()
+    total_count, extensions = _get_total_count(staff_api_client)
+    assert total_count == len(vehicle_list)
+    assert extensions["totalCount"][0]["strategy"] == CACHED
+
+    Entry.objects.create(name="New", slug="new", entry_type=vehicle_entry_type)
+
+    # The cache is invalidated once the transaction is committed.
+    assert _get_total_count(staff_api_client)[0] == len(vehicle_list)
+    flush_post_commit_hooks()
+    assert _get_total_count(staff_api_client)[0] == len(vehicle_list) + 1
+
+
+@pytest.mark.django_db
+@pytest.mark.django_db
+def test_cached_total_count_invalidated_on_assigned_values(
+    vehicle, color_attribute, settings
+):
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGY = CACHED
+    red = color_attribute.values.get(slug="red")
+    entries = Entry.objects.filter(attribute_value_ids__contains=[red.pk])
+    flush_post_commit_hooks()
+    assert get_total_count(entries) == (0, CACHED)
+
+    associate_attribute_values_to_instance(vehicle, color_attribute, red)
+    flush_post_commit_hooks()
+
+    assert get_total_count(entries) == (1, CACHED)
+
+
+@pytest.mark.django_db
+def test_estimated_total_count_of_unfiltered_queryset(vehicle_list, settings):
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGY = ESTIMATED
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 0
+
+    count, strategy = get_total_count(Entry.objects.all())
+
+    assert strategy == ESTIMATED
+    assert count >= 0
+
+
+@pytest.mark.django_db
+def test_estimated_total_count_falls_back_to_cached_count(vehicle_list, settings):
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGY = ESTIMATED
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 0
+    queryset = Entry.objects.filter(slug__in=["vehicle-1", "vehicle-2"])
+
+    assert get_total_count(queryset) == (2, CACHED)
+
+
+@pytest.mark.django_db
+def test_estimated_total_count_of_small_table(vehicle_list, settings):
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGY = ESTIMATED
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 100000
+
+    assert get_total_count(Entry.objects.all()) == (len(vehicle_list), CACHED)
@@ -0,0 +1,164 @@
+import hashlib
+import json
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from ... import __version__ as portal_version
+from ...attribute.models import (
+    AssignedEntryAttributeValue,
+    Attribute,
+    AttributeEntry,
+    AttributeValue,
+)
+from ...attribute.signals import entry_attribute_values_assigned
+from ...channel.models import Channel
+from ...document.models import Document, DocumentFile, DocumentLoad
+from ...entry.models import (
+    Category,
+    CategoryEntry,
+    Consult,
+    Entry,
+    EntryChannelListing,
+    EntryType,
+)
+from ...event.models import Event
+from ...investment.models import Investment, Item
+from ...session.models import Session
+from .cache_versions import (
+    get_cache_version,
+    get_schema_name,
+    invalidate_cache_version_on_commit,
+)
+
+EXACT = "exact"
+CACHED = "cached"
+ESTIMATED = "estimated"
+
+COUNT_CACHE = "count"
+
+# Changes of these models invalidate all cached counts of the tenant. Filters
+# span many models (channel listings, attributes, categories), so the list
+# contains the models of the connections and the models their filters read.
+# Rows derived from them, like sort keys and visibilities, are left out.
+COUNT_CACHE_MODELS = [
+    AssignedEntryAttributeValue,
+    Attribute,
+    AttributeEntry,
+    AttributeValue,
+    Category,
+    CategoryEntry,
+    Channel,
+    Consult,
+    Document,
+    DocumentFile,
+    DocumentLoad,
+    Entry,
+    EntryChannelListing,
+    EntryType,
+    Event,
+    Investment,
+    Item,
+    Session,
+]
+
+
+class TotalCount:
+    """Lazy total count of a queryset, computed with the configured strategy.
+
+    The strategy that produced the count is available in `strategy` once the
+    count was computed.
+    """
+
+    def __init__(self, queryset: QuerySet):
+        self.queryset = queryset
+        self.strategy: Optional[str] = None
+        self.count: Optional[int] = None
+
+    def __call__(self) -> int:
+        if self.strategy is None:
+            self.count, self.strategy = get_total_count(self.queryset)
+        return self.count
+
+
+def get_total_count(queryset: QuerySet) -> Tuple[int, str]:
+    """Count the queryset with the strategy set in `GRAPHQL_TOTAL_COUNT_STRATEGY`.
+
+    The estimated strategy falls back to the cached one for filtered querysets
+    and for tables smaller than `GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD`, where
+    the estimate isn't accurate and the exact count is cheap.
+    """
+    strategy = settings.GRAPHQL_TOTAL_COUNT_STRATEGY
+    if strategy == ESTIMATED:
+        estimate = get_estimated_count(queryset)
+        if estimate is not None:
+            return estimate, ESTIMATED
+        strategy = CACHED
+    if strategy == CACHED:
+        return get_cached_count(queryset), CACHED
+    return queryset.count(), EXACT
+
+
+def get_estimated_count(queryset: QuerySet) -> Optional[int]:
+    """Return the planner's row estimate of an unfiltered queryset."""
+    if queryset.query.where or queryset.query.distinct:
+        return None
+    if connections[queryset.db].vendor != "postgresql":
+        return None
+
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    if estimate < settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD:
+        return None
+    return estimate
+
+
+def get_count_cache_key(queryset: QuerySet) -> str:
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    query_hash = hashlib.sha256(f"{sql}{params!r}".encode("utf-8")).hexdigest()
+    schema_name = get_schema_name()
+    version = get_cache_version(COUNT_CACHE, schema_name)
+    return f"{portal_version}-count-{schema_name}-{version}-{query_hash}"
+
+
+def get_cached_count(queryset: QuerySet) -> int:
+    """Return the exact count, cached per tenant and filtered query."""
+    key = get_count_cache_key(queryset)
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT)
+    return count
+
+
+def invalidate_tenant_counts(sender, **kwargs):
+    invalidate_cache_version_on_commit(COUNT_CACHE)
+
+
+for model in COUNT_CACHE_MODELS:
+    post_save.connect(
+        invalidate_tenant_counts,
+        sender=model,
+        dispatch_uid=f"total_count_post_save_{model._meta.label_lower}",
+    )
+    post_delete.connect(
+        invalidate_tenant_counts,
+        sender=model,
+        dispatch_uid=f"total_count_post_delete_{model._meta.label_lower}",
+    )
+    m2m_changed.connect(
+        invalidate_tenant_counts,
+        sender=model,
+        dispatch_uid=f"total_count_m2m_changed_{model._meta.label_lower}",
+    )
+
+# Values assigned in bulk don't send the model signals.
+entry_attribute_values_assigned.connect(
+    invalidate_tenant_counts,
+    sender=AssignedEntryAttributeValue,
+    dispatch_uid="total_count_entry_attribute_values_assigned",
+)
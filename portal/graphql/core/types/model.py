@@ -4,6 +4,7 @@ from graphene.types.objecttype import ObjectType, ObjectTypeOptions
 
 class ModelObjectOptions(ObjectTypeOptions):
     model = None
+    field_columns = None
 
 
 class ModelObjectType(ObjectType):
@@ -33,6 +34,11 @@ class ModelObjectType(ObjectType):
 
             _meta.model = options.pop("model")
 
+        # Mapping of fields to the model fields their resolvers read; used to
+        # fetch only the needed columns in connections.
+        if "field_columns" in options:
+            _meta.field_columns = options.pop("field_columns")
+
         super(ModelObjectType, cls).__init_subclass_with_meta__(
             interfaces=interfaces,
             possible_types=possible_types,
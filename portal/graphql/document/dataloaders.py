@@ -1,14 +1,14 @@
 from collections import defaultdict
 
 from ...document.models import Document, DocumentFile
-from ..core.dataloaders import DataLoader
+from ..core.dataloaders import AsyncDataLoader, DataLoader
 
 
 class DocumentByIdLoader(DataLoader):
     context_key = "document_by_id"
 
     def batch_load(self, keys):
-        documents = Document.objects.in_bulk(keys)
+        documents = Document.objects.using(self.database_connection_name).in_bulk(keys)
         return [documents.get(document_id) for document_id in keys]
 
 
@@ -18,8 +18,9 @@ class DocumentsByEntryIdLoader(DataLoader):
     def batch_load(self, keys):
         documents_by_entry_ids = defaultdict(list)
         for document in (
-            Document.objects.visible_to_user(self.user)
-            .filter(entry_id__in=keys)
+            Document.objects.using(self.database_connection_name)
+            .visible_to_user(self.user)
+            .filter(entry_id__any=keys)
             .iterator()
         ):
             documents_by_entry_ids[document.entry_id].append(document)
@@ -30,18 +31,22 @@ class DocumentFileByIdLoader(DataLoader):
     context_key = "document_file_by_id"
 
     def batch_load(self, keys):
-        document_files = DocumentFile.objects.in_bulk(keys)
+        document_files = DocumentFile.objects.using(
+            self.database_connection_name
+        ).in_bulk(keys)
         return [document_files.get(document_file_id) for document_file_id in keys]
 
 
-class DocumentFilesByDocumentIdLoader(DataLoader):
+class DocumentFilesByDocumentIdLoader(AsyncDataLoader):
     context_key = "document_files_by_document_id"
 
     def batch_load(self, keys):
         documents_files_by_document_id = defaultdict(list)
-        for document_file in DocumentFile.objects.filter(
-            document_id__in=keys
-        ).iterator():
+        for document_file in (
+            DocumentFile.objects.using(self.database_connection_name)
+            .filter(document_id__any=keys)
+            .iterator()
+        ):
             documents_files_by_document_id[document_file.document_id].append(
                 document_file
             )
@@ -1,10 +1,14 @@
 import graphene
 
 from ..core.types.sort_input import SortInputObjectType
+from ..utils.sorting import sort_by_rank
 
 
 class DocumentSortField(graphene.Enum):
     CREATED = ["created"]
+    RANK = ["search_rank", "id"]
+
+    qs_with_rank = staticmethod(sort_by_rank)
 
 
 class DocumentSortingInput(SortInputObjectType):
@@ -64,6 +64,11 @@ class Document(ModelObjectType):
     class Meta:
         model = models.Document
         interfaces = [graphene.relay.Node]
+        field_columns = {
+            "events": [],
+            "expired": ["expires", "default_file"],
+            "files": [],
+        }
 
     def resolve_expired(self, info):
         if self.expires and self.default_file:
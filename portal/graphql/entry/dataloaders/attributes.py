@@ -2,7 +2,11 @@ from collections import defaultdict
 
 from promise import Promise
 
-from ....attribute.models import AssignedEntryAttributeValue, AttributeEntry
+from ....attribute.models import (
+    AssignedEntryAttributeValue,
+    Attribute,
+    AttributeEntry,
+)
 from ...attribute.dataloaders import AttributesByAttributeId, AttributeValueByIdLoader
 from ...core.dataloaders import DataLoader
 from .entries import EntryByIdLoader
@@ -14,6 +18,11 @@ class BaseEntryAttributesByEntryTypeIdLoader(DataLoader):
     model_name = None
     extra_fields = None
 
+    def get_shared_cache_variant(self):
+        # Attributes hidden in the website are loaded for staff users only.
+        requestor = self.context.user
+        return "staff" if requestor and requestor.is_active else "public"
+
     def batch_load(self, keys):
         if not self.model_name:
             raise ValueError("Provide a model_name for this dataloader.")
@@ -28,7 +37,7 @@ class BaseEntryAttributesByEntryTypeIdLoader(DataLoader):
                 attribute__visible_in_website=True
             )
 
-        entry_type_attribute_pairs = qs.filter(entry_type_id__in=keys).values_list(
+        entry_type_attribute_pairs = qs.filter(entry_type_id__any=keys).values_list(
             "entry_type_id", "attribute_id", *self.extra_fields
         )
 
@@ -60,6 +69,36 @@ class EntryAttributesByEntryTypeIdLoader(BaseEntryAttributesByEntryTypeIdLoader)
 
     context_key = "entry_attributes_by_entrytype"
     model_name = AttributeEntry
+    shared_cache_models = (AttributeEntry, Attribute)
+
+
+def get_assigned_attributes_map(
+    entries, attribute_values, entry_type_attributes, values_by_id_map
+):
+    """Map entry IDs to their attributes with the values assigned to them.
+
+    Assigned values are grouped by entry and attribute in a single pass, so
+    the work grows linearly with the number of values and attributes.
+    """
+    values_by_entry_and_attribute = defaultdict(list)
+    for entry_value in attribute_values:
+        value = values_by_id_map.get(entry_value.value_id)
+        if value:
+            key = (entry_value.entry_id, value.attribute_id)
+            values_by_entry_and_attribute[key].append(value)
+
+    assigned_entry_map = defaultdict(list)
+    for entry in entries:
+        for attribute, *_ in entry_type_attributes[entry.entry_type_id]:
+            assigned_entry_map[entry.id].append(
+                {
+                    "attribute": attribute,
+                    "values": values_by_entry_and_attribute.get(
+                        (entry.id, attribute.id), []
+                    ),
+                }
+            )
+    return assigned_entry_map
 
 
 class AttributeValuesByEntryIdLoader(DataLoader):
@@ -71,7 +110,7 @@ class AttributeValuesByEntryIdLoader(DataLoader):
         # https://docs.djangoproject.com/en/3.2/ref/models/querysets/#iterator
         attribute_values = list(
             AssignedEntryAttributeValue.objects.using(self.database_connection_name)
-            .filter(entry_id__in=keys)
+            .filter(entry_id__any=keys)
             .iterator()
         )
         value_ids = [a.value_id for a in attribute_values]
@@ -84,29 +123,9 @@ class AttributeValuesByEntryIdLoader(DataLoader):
                 attribute_entries, values = result
                 entry_type_attributes = dict(zip(entry_type_ids, attribute_entries))
                 values_by_id_map = dict(zip(value_ids, values))
-                assigned_entry_map = defaultdict(list)
-
-                for entry in entries:
-                    entry_values = [
-                        values_by_id_map.get(entry_value.value_id)
-                        for entry_value in attribute_values
-                        if entry_value.entry_id == entry.id
-                    ]
-
-                    attributes = entry_type_attributes[entry.entry_type_id]
-                    for attribute_tuple in attributes:
-                        attribute = attribute_tuple[0]
-                        values = [
-                            value
-                            for value in entry_values
-                            if value and value.attribute_id == attribute.id
-                        ]
-                        assigned_entry_map[entry.id].append(
-                            {
-                                "attribute": attribute,
-                                "values": values,
-                            }
-                        )
+                assigned_entry_map = get_assigned_attributes_map(
+                    entries, attribute_values, entry_type_attributes, values_by_id_map
+                )
                 return [assigned_entry_map[key] for key in keys]
 
             attributes = EntryAttributesByEntryTypeIdLoader(self.context).load_many(
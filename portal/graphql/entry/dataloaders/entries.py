@@ -13,6 +13,7 @@ from ...core.dataloaders import DataLoader
 
 class EntryTypeByIdLoader(DataLoader):
     context_key = "entry_type_by_id"
+    shared_cache_models = (EntryType,)
 
     def batch_load(self, keys):
         entry_types = EntryType.objects.using(self.database_connection_name).in_bulk(
@@ -23,9 +24,10 @@ class EntryTypeByIdLoader(DataLoader):
 
 class CategoryByIdLoader(DataLoader):
     context_key = "category_by_id"
+    shared_cache_models = (Category,)
 
     def batch_load(self, keys):
-        categories = Category.objects.in_bulk(keys)
+        categories = Category.objects.using(self.database_connection_name).in_bulk(keys)
         return [categories.get(category_id) for category_id in keys]
 
 
@@ -35,8 +37,7 @@ class CategoriesByEntryIdLoader(DataLoader):
     def batch_load(self, keys):
         entry_category_pairs = list(
             CategoryEntry.objects.using(self.database_connection_name)
-            .using(self.database_connection_name)
-            .filter(entry_id__in=keys)
+            .filter(entry_id__any=keys)
             .order_by("id")
             .values_list("entry_id", "category_id")
             .iterator()
@@ -62,7 +63,7 @@ class EntryByIdLoader(DataLoader):
     context_key = "entry_by_id"
 
     def batch_load(self, keys):
-        entries = Entry.objects.in_bulk(keys)
+        entries = Entry.objects.using(self.database_connection_name).in_bulk(keys)
         return [entries.get(entry_id) for entry_id in keys]
 
 
@@ -74,7 +75,7 @@ class ConsultByEntryIdLoader(DataLoader):
         for consult in (
             Consult.objects.all()
             .using(self.database_connection_name)
-            .filter(entry_id__in=keys)
+            .filter(entry_id__any=keys)
             .iterator()
         ):
             consult_by_entry_ids[consult.entry_id].append(consult)
@@ -87,7 +88,7 @@ class EntryChannelListingByEntryIdLoader(DataLoader[int, EntryChannelListing]):
     def batch_load(self, keys):
         entry_channel_listings = (
             EntryChannelListing.objects.using(self.database_connection_name)
-            .filter(entry_id__in=keys)
+            .filter(entry_id__any=keys)
             .iterator()
         )
         channel_listings_by_entry_ids = defaultdict(list)
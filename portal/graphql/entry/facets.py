@@ -0,0 +1,106 @@
+"""Counts of entries by values of the attributes filterable in the website.
+
+Counts of a filtered list of entries are computed with a single grouped
+aggregate and cached per tenant and filtered query, which contains the
+channel and the filters. Keys contain the cache versions of the models the
+counts depend on, bumped when their rows are saved or deleted.
+"""
+
+import hashlib
+from itertools import groupby
+from typing import List, NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, QuerySet
+
+from ... import __version__ as portal_version
+from ...attribute.models import AssignedEntryAttributeValue, Attribute, AttributeValue
+from ...channel.models import Channel
+from ...entry.models import CategoryEntry, Entry, EntryChannelListing
+from ..core.cache_versions import get_schema_name
+from ..core.dataloader_cache import get_models_cache_version
+
+FACETS_CACHE_MODELS = (
+    AssignedEntryAttributeValue,
+    Attribute,
+    AttributeValue,
+    CategoryEntry,
+    Channel,
+    Entry,
+    EntryChannelListing,
+)
+
+
+class AttributeValueCount(NamedTuple):
+    attribute_id: int
+    value_id: int
+    count: int
+
+
+class AttributeFacet(NamedTuple):
+    attribute_id: int
+    values: List[AttributeValueCount]
+
+
+class EntryFacets:
+    """Lazy facets of a filtered list of entries, computed when requested."""
+
+    def __init__(self, queryset: QuerySet):
+        self.queryset = queryset
+        self.facets: Optional[List[AttributeFacet]] = None
+
+    def __call__(self) -> List[AttributeFacet]:
+        if self.facets is None:
+            counts = get_attribute_value_counts(self.queryset)
+            self.facets = [
+                AttributeFacet(attribute_id, list(values))
+                for attribute_id, values in groupby(
+                    counts, key=lambda count: count.attribute_id
+                )
+            ]
+        return self.facets
+
+
+def count_attribute_values(entries: QuerySet) -> List[AttributeValueCount]:
+    """Count the entries by assigned values of the filterable attributes.
+
+    Values without any of the entries are left out.
+    """
+    rows = (
+        AssignedEntryAttributeValue.objects.using(entries.db)
+        .filter(
+            entry_id__in=entries.order_by().values("pk"),
+            value__attribute__filterable_in_website=True,
+        )
+        .values("value__attribute_id", "value_id")
+        .annotate(count=Count("entry_id"))
+        .order_by(
+            "value__attribute__name",
+            "value__attribute_id",
+            "value__sort_order",
+            "value_id",
+        )
+        .values_list("value__attribute_id", "value_id", "count")
+    )
+    return [AttributeValueCount(*row) for row in rows]
+
+
+def get_facets_cache_key(entries: QuerySet) -> str:
+    sql, params = entries.order_by().values("pk").query.sql_with_params()
+    query_hash = hashlib.sha256(f"{sql}{params!r}".encode("utf-8")).hexdigest()
+    schema_name = get_schema_name()
+    version = get_models_cache_version(FACETS_CACHE_MODELS)
+    return f"{portal_version}-facets-{schema_name}-{version}-{query_hash}"
+
+
+def get_attribute_value_counts(entries: QuerySet) -> List[AttributeValueCount]:
+    timeout = settings.GRAPHQL_FACETS_CACHE_TIMEOUT
+    if not timeout:
+        return count_attribute_values(entries)
+    key = get_facets_cache_key(entries)
+    counts = cache.get(key)
+    if counts is None:
+        counts = count_attribute_values(entries)
+        cache.set(key, counts, timeout)
+    return counts
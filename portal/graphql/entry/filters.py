@@ -1,15 +1,23 @@
 from collections import defaultdict
-from typing import Dict, List, Optional, TypedDict
+from typing import Dict, List, Set, Tuple, Union
 
 import django_filters
+import graphene
+from django.conf import settings
 from django.db.models import Exists, OuterRef, Q
 
 from portal.graphql.channel.filters import get_channel_slug_from_filter_data
 
+from ... import __version__ as portal_version
 from ...attribute import AttributeInputType
-from ...attribute.models import AssignedEntryAttributeValue, Attribute, AttributeValue
+from ...attribute.models import Attribute, AttributeValue
 from ...channel.models import Channel
+from ...core.search import SearchMode, fuzzy_search_queryset
 from ...entry.models import Category, CategoryEntry, Entry, EntryChannelListing
+from ..core import dataloader_cache
+from ..core.cache_versions import get_schema_name
+from ..core.dataloader_cache import get_models_cache_version
+from ..core.enums import SearchModeEnum
 from ..core.filters import (
     EnumFilter,
     GlobalIDMultipleChoiceFilter,
@@ -61,81 +69,91 @@ def _filter_entries_is_published(qs, _, value, channel_slug):
 
 
 def filter_entries_by_attributes_values(qs, queries):
+    """Filter entries having any of the values of each of the attributes.
+
+    Attributes filtered by a single value are matched together by a single
+    `@>` predicate, the other ones by `&&` predicates, all covered by the GIN
+    index of the assigned value IDs.
+    """
+    required_value_ids = []
     filters = []
     for values in queries.values():
-        assigned_entry_attribute_values = AssignedEntryAttributeValue.objects.filter(
-            value_id__in=values
-        )
-        entry_attribute_filter = Q(
-            Exists(assigned_entry_attribute_values.filter(entry_id=OuterRef("pk")))
-        )
-        filters.append(entry_attribute_filter)
-
+        if not values:
+            return qs.none()
+        if len(values) == 1:
+            required_value_ids.extend(values)
+        else:
+            filters.append(Q(attribute_value_ids__overlap=values))
+    if required_value_ids:
+        filters.append(Q(attribute_value_ids__contains=required_value_ids))
     return qs.filter(*filters)
 
 
-class KeyValueDict(TypedDict):
-    pk: int
-    values: Dict[Optional[bool], int]
+# Values are looked up by the slug of their attribute and their own slug, or
+# their boolean for boolean attributes.
+AttributeValueKey = Tuple[str, Union[str, bool]]
 
 
-def _clean_entry_attributes_boolean_filter_input(filter_value, queries):
-    attribute_slugs = [slug for slug, _ in filter_value]
-    attributes = Attribute.objects.filter(
-        input_type=AttributeInputType.BOOLEAN, slug__in=attribute_slugs
-    ).prefetch_related("values")
-    values_map: Dict[str, KeyValueDict] = {
-        attr.slug: {
-            "pk": attr.pk,
-            "values": {val.boolean: val.pk for val in attr.values.all()},
-        }
-        for attr in attributes
-    }
+def get_attribute_value_ids_cache_prefix() -> str:
+    schema_name = get_schema_name()
+    version = get_models_cache_version((Attribute, AttributeValue))
+    return f"{portal_version}-attribute-value-ids-{schema_name}-{version}"
 
-    for attr_slug, val in filter_value:
-        attr_pk = values_map[attr_slug]["pk"]
-        value_pk = values_map[attr_slug]["values"].get(val)
-        if value_pk:
-            queries[attr_pk] += [value_pk]
-
-
-def _clean_entry_attributes_filter_input(filter_value, queries):
-    attribute_slugs = []
-    value_slugs = []
-    for attr_slug, val_slugs in filter_value:
-        attribute_slugs.append(attr_slug)
-        value_slugs.extend(val_slugs)
-    attributes_slug_pk_map: Dict[str, int] = {}
-    attributes_pk_slug_map: Dict[int, str] = {}
-    values_map: Dict[str, Dict[str, int]] = defaultdict(dict)
-    for attr_slug, attr_pk in Attribute.objects.filter(
-        slug__in=attribute_slugs
-    ).values_list("slug", "id"):
-        attributes_slug_pk_map[attr_slug] = attr_pk
-        attributes_pk_slug_map[attr_pk] = attr_slug
-
-    for (
-        attr_pk,
-        value_pk,
-        value_slug,
-    ) in AttributeValue.objects.filter(
-        slug__in=value_slugs, attribute_id__in=attributes_pk_slug_map.keys()
-    ).values_list("attribute_id", "pk", "slug"):
-        attr_slug = attributes_pk_slug_map[attr_pk]
-        values_map[attr_slug][value_slug] = value_pk
-
-    # Convert attribute:value pairs into a dictionary where
-    # attributes are keys and values are grouped in lists
-    for attr_name, val_slugs in filter_value:
-        if attr_name not in attributes_slug_pk_map:
-            raise ValueError("Unknown attribute name: %r" % (attr_name,))
-        attr_pk = attributes_slug_pk_map[attr_name]
-        attr_val_pk = [
-            values_map[attr_name][val_slug]
-            for val_slug in val_slugs
-            if val_slug in values_map[attr_name]
-        ]
-        queries[attr_pk] += attr_val_pk
+
+def _load_attribute_value_ids(keys) -> Dict[AttributeValueKey, int]:
+    slugs: Dict[str, Set[str]] = defaultdict(set)
+    booleans: Dict[str, Set[bool]] = defaultdict(set)
+    for attribute_slug, value in keys:
+        if isinstance(value, str):
+            slugs[attribute_slug].add(value)
+        else:
+            booleans[attribute_slug].add(value)
+
+    lookup = Q()
+    for attribute_slug, value_slugs in slugs.items():
+        lookup |= Q(attribute__slug=attribute_slug, slug__in=value_slugs)
+    for attribute_slug, values in booleans.items():
+        lookup |= Q(
+            attribute__slug=attribute_slug,
+            attribute__input_type=AttributeInputType.BOOLEAN,
+            boolean__in=values,
+        )
+    if not lookup:
+        return {}
+
+    loaded: Dict[AttributeValueKey, int] = {}
+    for attribute_slug, input_type, pk, slug, boolean in AttributeValue.objects.filter(
+        lookup
+    ).values_list("attribute__slug", "attribute__input_type", "pk", "slug", "boolean"):
+        if slug in slugs[attribute_slug]:
+            loaded[(attribute_slug, slug)] = pk
+        if (
+            input_type == AttributeInputType.BOOLEAN
+            and boolean in booleans[attribute_slug]
+        ):
+            loaded[(attribute_slug, boolean)] = pk
+    return loaded
+
+
+def get_attribute_value_ids(keys) -> Dict[AttributeValueKey, int]:
+    """Return IDs of the attribute values, by attribute slug and value slug.
+
+    Values of boolean attributes are also returned by attribute slug and
+    boolean. Like the results of reference data loaders, they are cached per
+    tenant until attributes or their values change. Unknown values are left
+    out.
+    """
+    keys = set(keys)
+    if not settings.GRAPHQL_DATALOADER_CACHE_TIMEOUT:
+        return _load_attribute_value_ids(keys)
+    prefix = get_attribute_value_ids_cache_prefix()
+    found = dataloader_cache.get_many(prefix, keys)
+    missing = keys - set(found)
+    if missing:
+        loaded = _load_attribute_value_ids(missing)
+        dataloader_cache.set_many(prefix, loaded)
+        found.update(loaded)
+    return found
 
 
 def filter_entries_by_attributes(
@@ -143,14 +161,30 @@ def filter_entries_by_attributes(
     filter_values,
     filter_boolean_values,
 ):
-    queries: Dict[int, List[int]] = defaultdict(list)
-    try:
-        if filter_values:
-            _clean_entry_attributes_filter_input(filter_values, queries)
-        if filter_boolean_values:
-            _clean_entry_attributes_boolean_filter_input(filter_boolean_values, queries)
-    except ValueError:
-        return Entry.objects.none()
+    value_ids = get_attribute_value_ids(
+        [
+            *(
+                (attr_slug, val_slug)
+                for attr_slug, val_slugs in filter_values
+                for val_slug in val_slugs
+            ),
+            *filter_boolean_values,
+        ]
+    )
+
+    # Group the IDs of the values by attribute. Attributes filtered by values
+    # missing from the database, or unknown, match no entries.
+    queries: Dict[str, List[int]] = defaultdict(list)
+    for attr_slug, val_slugs in filter_values:
+        queries[attr_slug] += [
+            value_ids[(attr_slug, val_slug)]
+            for val_slug in val_slugs
+            if (attr_slug, val_slug) in value_ids
+        ]
+    for attr_slug, val in filter_boolean_values:
+        value_pk = value_ids.get((attr_slug, val))
+        if value_pk:
+            queries[attr_slug] += [value_pk]
     return filter_entries_by_attributes_values(qs, queries)
 
 
@@ -173,6 +207,10 @@ def _filter_attributes(qs, _, value):
     return qs
 
 
+# Fields with trigram indexes, searched by the fuzzy search mode.
+ENTRY_FUZZY_SEARCH_FIELDS = ["name", "document_number", "email"]
+
+
 class CategoryFilter(django_filters.FilterSet):
     search = django_filters.CharFilter(method=search_filter)
     ids = GlobalIDMultipleChoiceFilter(field_name="id")
@@ -184,7 +222,7 @@ class CategoryFilter(django_filters.FilterSet):
 
 class EntryFilter(django_filters.FilterSet):
     is_published = django_filters.BooleanFilter(method="filter_is_published")
-    search = django_filters.CharFilter(method=search_filter)
+    search = django_filters.CharFilter(method="filter_search")
     categories = GlobalIDMultipleChoiceFilter(method=filter_categories)
     entry_types = GlobalIDMultipleChoiceFilter(method=filter_entry_types)
     attributes = ListObjectTypeFilter(
@@ -205,6 +243,11 @@ class EntryFilter(django_filters.FilterSet):
             channel_slug,
         )
 
+    def filter_search(self, queryset, name, value):
+        if self.data.get("search_mode") == SearchMode.FUZZY:
+            return fuzzy_search_queryset(queryset, value, ENTRY_FUZZY_SEARCH_FIELDS)
+        return search_filter(queryset, name, value)
+
     def filter_attributes(self, queryset, name, value):
         return _filter_attributes(queryset, name, value)
 
@@ -215,5 +258,13 @@ class CategoryFilterInput(FilterInputObjectType):
 
 
 class EntryFilterInput(ChannelFilterInputObjectType):
+    search_mode = graphene.Argument(
+        SearchModeEnum,
+        description=(
+            "Mode of the `search` filter, full-text by default. The fuzzy mode "
+            "matches partial or misspelled names, document numbers and emails."
+        ),
+    )
+
     class Meta:
         filterset_class = EntryFilter
@@ -1,6 +1,3 @@
-from django.db.models import Exists, OuterRef
-
-from ...channel.models import Channel
 from ...core.db.utils import get_database_connection_name
 from ...entry import models
 from ..channel import ChannelQsContext
@@ -54,10 +51,4 @@ def resolve_entries(info, channel_slug=None):
         .using(database_connection_name)
         .visible_to_user(user, channel_slug)
     )
-    if channel_slug:
-        channels = Channel.objects.filter(slug=str(channel_slug))
-        entry_channel_listings = models.EntryChannelListing.objects.filter(
-            Exists(channels.filter(pk=OuterRef("channel_id")))
-        )
-        qs = qs.filter(Exists(entry_channel_listings.filter(entry_id=OuterRef("pk"))))
     return ChannelQsContext(qs=qs, channel_slug=channel_slug)
@@ -8,6 +8,7 @@ from portal.graphql.core.connection import (
 
 from ..channel.utils import get_default_channel_slug_or_graphql_error
 from ..core.fields import BaseField, FilterConnectionField
+from .facets import EntryFacets
 from .filters import CategoryFilterInput, EntryFilterInput
 from .mutations import (
     CategoryBulkDelete,
@@ -113,7 +114,9 @@ class Query(graphene.ObjectType):
         qs = resolve_entries(info, channel_slug=channel)
         kwargs["channel"] = channel
         qs = filter_connection_queryset(qs, kwargs)
-        return create_connection_slice(qs, info, kwargs, EntryCountableConnection)
+        connection = create_connection_slice(qs, info, kwargs, EntryCountableConnection)
+        connection.facets = EntryFacets(qs.qs)
+        return connection
 
 
 class Mutation(graphene.ObjectType):
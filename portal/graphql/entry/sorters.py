@@ -1,6 +1,7 @@
 import graphene
 
 from ..core.types import SortInputObjectType
+from ..utils.sorting import sort_by_rank
 
 
 class EntryTypeSortField(graphene.Enum):
@@ -15,6 +16,9 @@ class EntryTypeSortingInput(SortInputObjectType):
 
 class CategorySortField(graphene.Enum):
     NAME = ["name", "slug"]
+    RANK = ["search_rank", "id"]
+
+    qs_with_rank = staticmethod(sort_by_rank)
 
 
 class CategorySortingInput(SortInputObjectType):
@@ -28,9 +32,19 @@ class EntrySortField(graphene.Enum):
     UPDATED = ["updated", "name", "slug"]
     CREATED = ["created", "name", "slug"]
     PUBLISHED = ["is_published", "name", "slug"]
+    RANK = ["search_rank", "id"]
+
+    qs_with_rank = staticmethod(sort_by_rank)
 
 
 class EntrySortingInput(SortInputObjectType):
+    attribute_id = graphene.Argument(
+        graphene.ID,
+        description="Sort entries by the selected attribute's values.",
+    )
+    field = graphene.Argument(
+        EntrySortField, description="Sort entries by the selected field."
+    )
+
     class Meta:
         sort_enum = EntrySortField
-        type_name = "entries"
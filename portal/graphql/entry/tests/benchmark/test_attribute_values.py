@@ -0,0 +1,100 @@
+"""Benchmark of grouping assigned attribute values of a page of entries.
+
+Compares the previous implementation of `AttributeValuesByEntryIdLoader`, which
+rescanned all assigned values for every entry and the entry's values for every
+attribute, with the single pass grouping.
+
+Run it with:
+    BENCHMARK_ATTRIBUTE_VALUES=1 pytest portal/graphql/entry/tests/benchmark -s
+"""
+
+import os
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+
+from ...dataloaders.attributes import get_assigned_attributes_map
+
+ENTRIES_COUNT = int(os.environ.get("BENCHMARK_ATTRIBUTE_VALUES_ENTRIES", 100))
+ATTRIBUTES_COUNT = 20
+VALUES_PER_ATTRIBUTE = 3
+ROUNDS = 20
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("BENCHMARK_ATTRIBUTE_VALUES"),
+    reason="Set BENCHMARK_ATTRIBUTE_VALUES to run the attribute values benchmark.",
+)
+
+
+def legacy_get_assigned_attributes_map(
+    entries, attribute_values, entry_type_attributes, values_by_id_map
+):
+    assigned_entry_map = defaultdict(list)
+
+    for entry in entries:
+        entry_values = [
+            values_by_id_map.get(entry_value.value_id)
+            for entry_value in attribute_values
+            if entry_value.entry_id == entry.id
+        ]
+
+        attributes = entry_type_attributes[entry.entry_type_id]
+        for attribute_tuple in attributes:
+            attribute = attribute_tuple[0]
+            values = [
+                value
+                for value in entry_values
+                if value and value.attribute_id == attribute.id
+            ]
+            assigned_entry_map[entry.id].append(
+                {
+                    "attribute": attribute,
+                    "values": values,
+                }
+            )
+    return assigned_entry_map
+
+
+def _get_page():
+    attributes = [SimpleNamespace(id=index) for index in range(ATTRIBUTES_COUNT)]
+    values_by_id_map = {}
+    for attribute in attributes:
+        for index in range(VALUES_PER_ATTRIBUTE):
+            value_id = attribute.id * VALUES_PER_ATTRIBUTE + index
+            values_by_id_map[value_id] = SimpleNamespace(
+                id=value_id, attribute_id=attribute.id
+            )
+
+    entries = [
+        SimpleNamespace(id=index, entry_type_id=1) for index in range(ENTRIES_COUNT)
+    ]
+    attribute_values = [
+        SimpleNamespace(entry_id=entry.id, value_id=value_id)
+        for entry in entries
+        for value_id in values_by_id_map
+    ]
+    entry_type_attributes = {1: [(attribute,) for attribute in attributes]}
+    return entries, attribute_values, entry_type_attributes, values_by_id_map
+
+
+def _run(get_map, page):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        result = get_map(*page)
+    return result, time.perf_counter() - start
+
+
+def test_attribute_values_grouping_benchmark():
+    page = _get_page()
+
+    legacy_result, legacy_time = _run(legacy_get_assigned_attributes_map, page)
+    result, grouped_time = _run(get_assigned_attributes_map, page)
+
+    assert result == legacy_result
+    print(
+        f"\n{ENTRIES_COUNT} entries with {ATTRIBUTES_COUNT} attributes of "
+        f"{VALUES_PER_ATTRIBUTE} values, {ROUNDS} rounds: "
+        f"legacy {legacy_time:.3f}s, grouped {grouped_time:.3f}s"
+    )
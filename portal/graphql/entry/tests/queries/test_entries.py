@@ -3,8 +3,9 @@ import json
 import graphene
 import pytest
 
+from portal.attribute.utils import associate_attribute_values_to_instance
 from portal.core.exceptions import PermissionDenied
-from portal.entry.models import EntryChannelListing
+from portal.entry.models import Entry, EntryChannelListing
 
 from ....tests.utils import get_graphql_content, get_graphql_content_from_response
 
@@ -196,3 +197,178 @@ def test_entry_with_attributes_query_by_id_as_anonymous(
     content = get_graphql_content(response)
     data = content["data"]["entry"]
     assert len(data["attributes"]) == 0
+
+
+QUERY_ENTRIES_SORTED_BY_ATTRIBUTE = """
+    query ($first: Int, $after: String, $sortBy: EntrySortingInput) {
+        entries(first: $first, after: $after, sortBy: $sortBy) {
+            edges {
+                node {
+                    name
+                }
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
+"""
+
+
+def test_entries_query_sorted_by_attribute(
+    staff_api_client, vehicle_list, color_attribute
+):
+    red = color_attribute.values.get(slug="red")
+    blue = color_attribute.values.get(slug="blue")
+    associate_attribute_values_to_instance(vehicle_list[0], color_attribute, red)
+    associate_attribute_values_to_instance(vehicle_list[1], color_attribute, blue)
+    variables = {
+        "first": 2,
+        "sortBy": {
+            "attributeId": graphene.Node.to_global_id("Attribute", color_attribute.pk),
+            "direction": "ASC",
+        },
+    }
+
+    response = staff_api_client.post_graphql(
+        QUERY_ENTRIES_SORTED_BY_ATTRIBUTE, variables
+    )
+    content = get_graphql_content(response)
+    data = content["data"]["entries"]
+    assert [edge["node"]["name"] for edge in data["edges"]] == [
+        "Vehicle 2",
+        "Vehicle 1",
+    ]
+    assert data["pageInfo"]["hasNextPage"] is True
+
+    variables["after"] = data["pageInfo"]["endCursor"]
+    response = staff_api_client.post_graphql(
+        QUERY_ENTRIES_SORTED_BY_ATTRIBUTE, variables
+    )
+    content = get_graphql_content(response)
+    data = content["data"]["entries"]
+    assert [edge["node"]["name"] for edge in data["edges"]] == ["Vehicle 3"]
+    assert data["pageInfo"]["hasNextPage"] is False
+
+
+def test_entries_query_sorted_without_field_and_attribute(
+    staff_api_client, vehicle_list
+):
+    variables = {"first": 2, "sortBy": {"direction": "ASC"}}
+
+    response = staff_api_client.post_graphql(
+        QUERY_ENTRIES_SORTED_BY_ATTRIBUTE, variables
+    )
+
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "You must provide either `field` or `attributeId` to sort the entries."
+    )
+
+
+QUERY_ENTRIES_SEARCH = """
+    query ($first: Int, $after: String, $filter: EntryFilterInput,
+           $sortBy: EntrySortingInput) {
+        entries(first: $first, after: $after, filter: $filter, sortBy: $sortBy) {
+            edges {
+                node {
+                    name
+                }
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
+"""
+
+
+def test_entries_query_sorted_by_search_rank(staff_api_client, vehicle_list):
+    Entry.objects.create(name="Truck", slug="truck", document_number="vehicle-9")
+    variables = {
+        "first": 3,
+        "filter": {"search": "vehicle"},
+        "sortBy": {"field": "RANK", "direction": "DESC"},
+    }
+
+    response = staff_api_client.post_graphql(QUERY_ENTRIES_SEARCH, variables)
+    content = get_graphql_content(response)
+    data = content["data"]["entries"]
+    # Entries of the same rank are sorted by their IDs.
+    assert [edge["node"]["name"] for edge in data["edges"]] == [
+        "Vehicle 3",
+        "Vehicle 2",
+        "Vehicle 1",
+    ]
+    assert data["pageInfo"]["hasNextPage"] is True
+
+    variables["after"] = data["pageInfo"]["endCursor"]
+    response = staff_api_client.post_graphql(QUERY_ENTRIES_SEARCH, variables)
+    content = get_graphql_content(response)
+    data = content["data"]["entries"]
+    assert [edge["node"]["name"] for edge in data["edges"]] == ["Truck"]
+    assert data["pageInfo"]["hasNextPage"] is False
+
+
+def test_entries_query_sorted_by_search_rank_without_search(
+    staff_api_client, vehicle_list
+):
+    variables = {"first": 2, "sortBy": {"field": "RANK", "direction": "DESC"}}
+
+    response = staff_api_client.post_graphql(QUERY_ENTRIES_SEARCH, variables)
+
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Sorting by RANK is available only with the `search` filter."
+    )
+
+
+@pytest.mark.usefixtures("pg_trgm")
+@pytest.mark.parametrize(
+    ("search", "names"),
+    [
+        ("Veh", ["Vehicle 1", "Vehicle 2", "Vehicle 3"]),
+        ("Vehiclle", ["Vehicle 1", "Vehicle 2", "Vehicle 3"]),
+        ("56789b", ["Vehicle 2"]),
+        ("truck@", ["Truck"]),
+    ],
+)
+def test_entries_query_fuzzy_search(staff_api_client, vehicle_list, search, names):
+    Entry.objects.create(
+        name="Truck", slug="truck", document_number="987", email="truck@email.com"
+    )
+    variables = {"first": 5, "filter": {"search": search, "searchMode": "FUZZY"}}
+
+    response = staff_api_client.post_graphql(QUERY_ENTRIES_SEARCH, variables)
+
+    content = get_graphql_content(response)
+    data = content["data"]["entries"]
+    assert sorted(edge["node"]["name"] for edge in data["edges"]) == names
+
+
+@pytest.mark.usefixtures("pg_trgm")
+def test_entries_query_fuzzy_search_sorted_by_rank(staff_api_client, vehicle_list):
+    variables = {
+        "first": 5,
+        "filter": {"search": "123456789b", "searchMode": "FUZZY"},
+        "sortBy": {"field": "RANK", "direction": "DESC"},
+    }
+
+    response = staff_api_client.post_graphql(QUERY_ENTRIES_SEARCH, variables)
+
+    content = get_graphql_content(response)
+    data = content["data"]["entries"]
+    assert data["edges"][0]["node"]["name"] == "Vehicle 2"
+
+
+def test_entries_query_full_text_search_doesnt_match_partial_words(
+    staff_api_client, vehicle_list
+):
+    variables = {"first": 5, "filter": {"search": "Veh", "searchMode": "FULL_TEXT"}}
+
+    response = staff_api_client.post_graphql(QUERY_ENTRIES_SEARCH, variables)
+
+    content = get_graphql_content(response)
+    assert content["data"]["entries"]["edges"] == []
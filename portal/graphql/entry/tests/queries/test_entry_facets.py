@@ -0,0 +1,151 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .....attribute.utils import associate_attribute_values_to_instance
+from .....entry.models import Entry, EntryChannelListing, EntryChannelVisibility
+from .....tests.utils import flush_post_commit_hooks
+from ....tests.utils import get_graphql_content
+from ...facets import get_attribute_value_counts
+
+pytestmark = pytest.mark.django_db
+
+QUERY_ENTRIES_FACETS = """
+    query ($channel: String, $filter: EntryFilterInput) {
+        entries(first: 1, channel: $channel, filter: $filter) {
+            edges {
+                node {
+                    name
+                }
+            }
+            facets {
+                attribute {
+                    slug
+                }
+                values {
+                    value {
+                        slug
+                    }
+                    count
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def vehicles_with_attributes(vehicle_list, color_attribute, size_attribute):
+    red = color_attribute.values.get(slug="red")
+    blue = color_attribute.values.get(slug="blue")
+    small = size_attribute.values.get(slug="small")
+    vehicle_1, vehicle_2, vehicle_3 = vehicle_list
+    associate_attribute_values_to_instance(vehicle_1, color_attribute, red)
+    associate_attribute_values_to_instance(vehicle_1, size_attribute, small)
+    associate_attribute_values_to_instance(vehicle_2, color_attribute, red)
+    associate_attribute_values_to_instance(vehicle_3, color_attribute, blue)
+    associate_attribute_values_to_instance(vehicle_3, size_attribute, small)
+    return vehicle_list
+
+
+def _get_facets(content):
+    return {
+        facet["attribute"]["slug"]: {
+            value["value"]["slug"]: value["count"] for value in facet["values"]
+        }
+        for facet in content["data"]["entries"]["facets"]
+    }
+
+
+def test_entries_facets_of_filtered_entries(staff_api_client, vehicles_with_attributes):
+    variables = {"filter": {"attributes": [{"slug": "size", "values": ["small"]}]}}
+
+    with CaptureQueriesContext(connection) as queries:
+        response = staff_api_client.post_graphql(QUERY_ENTRIES_FACETS, variables)
+
+    content = get_graphql_content(response)
+    assert _get_facets(content) == {
+        "color": {"red": 1, "blue": 1},
+        "size": {"small": 2},
+    }
+    counts = [
+        query
+        for query in queries.captured_queries
+        if 'COUNT("attribute_assignedentryattributevalue"' in query["sql"]
+    ]
+    assert len(counts) == 1
+
+
+def test_entries_facets_of_filterable_attributes(
+    staff_api_client, vehicles_with_attributes, size_attribute
+):
+    size_attribute.filterable_in_website = False
+    size_attribute.save(update_fields=["filterable_in_website"])
+
+    response = staff_api_client.post_graphql(QUERY_ENTRIES_FACETS)
+
+    content = get_graphql_content(response)
+    assert _get_facets(content) == {"color": {"red": 2, "blue": 1}}
+
+
+def test_entries_facets_of_entries_visible_in_channel(
+    api_client, vehicles_with_attributes, channel_city_1
+):
+    vehicle_1, vehicle_2, _ = vehicles_with_attributes
+    EntryChannelListing.objects.bulk_create(
+        [
+            EntryChannelListing(
+                entry=vehicle_1, channel=channel_city_1, is_published=True
+            ),
+            EntryChannelListing(
+                entry=vehicle_2, channel=channel_city_1, is_published=False
+            ),
+        ]
+    )
+    EntryChannelVisibility.objects.refresh()
+    variables = {"channel": channel_city_1.slug}
+
+    response = api_client.post_graphql(QUERY_ENTRIES_FACETS, variables)
+
+    content = get_graphql_content(response)
+    assert _get_facets(content) == {"color": {"red": 1}, "size": {"small": 1}}
+
+
+@pytest.fixture
+def facets_cache_enabled(settings):
+    settings.GRAPHQL_FACETS_CACHE_TIMEOUT = 60
+    flush_post_commit_hooks()
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _get_color_counts(entries, color_attribute):
+    return [
+        (count.value_id, count.count)
+        for count in get_attribute_value_counts(entries)
+        if count.attribute_id == color_attribute.pk
+    ]
+
+
+def test_attribute_value_counts_are_cached_until_assignments_change(
+    vehicles_with_attributes, color_attribute, facets_cache_enabled
+):
+    red = color_attribute.values.get(slug="red")
+    blue = color_attribute.values.get(slug="blue")
+    entries = Entry.objects.filter(slug__in=["vehicle-1", "vehicle-2"])
+    assert _get_color_counts(entries, color_attribute) == [(red.pk, 2)]
+
+    associate_attribute_values_to_instance(
+        vehicles_with_attributes[1], color_attribute, blue
+    )
+    with CaptureQueriesContext(connection) as queries:
+        assert _get_color_counts(entries, color_attribute) == [(red.pk, 2)]
+    assert not any(
+        "attribute_assignedentryattributevalue" in query["sql"]
+        for query in queries.captured_queries
+    )
+
+    flush_post_commit_hooks()
+    assert _get_color_counts(entries, color_attribute) == [(red.pk, 1), (blue.pk, 1)]
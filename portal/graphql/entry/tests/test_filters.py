@@ -0,0 +1,142 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ....attribute import AttributeInputType, AttributeType
+from ....attribute.models import Attribute, AttributeValue
+from ....attribute.utils import associate_attribute_values_to_instance
+from ....entry.models import Entry
+from ....tests.utils import flush_post_commit_hooks
+from ...core.dataloader_cache import local_cache
+from ..filters import filter_entries_by_attributes, get_attribute_value_ids
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def attribute_value_ids_cache_enabled(settings):
+    settings.GRAPHQL_DATALOADER_CACHE_TIMEOUT = 60
+    flush_post_commit_hooks()
+    cache.clear()
+    local_cache.clear()
+    yield
+    cache.clear()
+    local_cache.clear()
+
+
+@pytest.fixture
+def boolean_attribute():
+    attribute = Attribute.objects.create(
+        slug="insured",
+        name="Insured",
+        type=AttributeType.ENTRY_TYPE,
+        input_type=AttributeInputType.BOOLEAN,
+    )
+    AttributeValue.objects.create(
+        attribute=attribute, name="Insured: Yes", slug="insured-yes", boolean=True
+    )
+    AttributeValue.objects.create(
+        attribute=attribute, name="Insured: No", slug="insured-no", boolean=False
+    )
+    return attribute
+
+
+def test_filter_entries_by_attributes_uses_array_predicates(
+    vehicle_list, color_attribute, size_attribute
+):
+    red, blue = color_attribute.values.order_by("pk")
+    small = size_attribute.values.get(slug="small")
+    vehicle_1, vehicle_2, vehicle_3 = vehicle_list
+    associate_attribute_values_to_instance(vehicle_1, color_attribute, red)
+    associate_attribute_values_to_instance(vehicle_1, size_attribute, small)
+    associate_attribute_values_to_instance(vehicle_2, color_attribute, red)
+    associate_attribute_values_to_instance(vehicle_3, color_attribute, blue)
+    associate_attribute_values_to_instance(vehicle_3, size_attribute, small)
+
+    red_and_small = filter_entries_by_attributes(
+        Entry.objects.all(), [("color", ["red"]), ("size", ["small"])], []
+    )
+    any_color_and_small = filter_entries_by_attributes(
+        Entry.objects.all(), [("color", ["red", "blue"]), ("size", ["small"])], []
+    )
+
+    assert list(red_and_small) == [vehicle_1]
+    assert list(any_color_and_small) == [vehicle_1, vehicle_3]
+    sql = str(any_color_and_small.query)
+    assert "attribute_value_ids" in sql
+    assert "attribute_assignedentryattributevalue" not in sql
+
+
+def test_filter_entries_by_unknown_attribute_values(vehicle_list, color_attribute):
+    entries = filter_entries_by_attributes(
+        Entry.objects.all(), [("color", ["unknown"])], []
+    )
+    unknown_attribute_entries = filter_entries_by_attributes(
+        Entry.objects.all(), [("unknown", ["red"])], []
+    )
+
+    assert not entries.exists()
+    assert not unknown_attribute_entries.exists()
+
+
+def test_filter_entries_by_boolean_attribute(vehicle_list, boolean_attribute):
+    true_value = boolean_attribute.values.get(boolean=True)
+    vehicle_1, vehicle_2, _ = vehicle_list
+    associate_attribute_values_to_instance(vehicle_1, boolean_attribute, true_value)
+
+    entries = filter_entries_by_attributes(
+        Entry.objects.all(), [], [(boolean_attribute.slug, True)]
+    )
+
+    assert list(entries) == [vehicle_1]
+
+
+def test_attribute_value_ids_are_loaded_by_slugs(color_attribute):
+    red = color_attribute.values.get(slug="red")
+
+    with CaptureQueriesContext(connection) as queries:
+        value_ids = get_attribute_value_ids([("color", "red"), ("unknown", "red")])
+
+    assert value_ids == {("color", "red"): red.pk}
+    selects = [
+        query["sql"]
+        for query in queries.captured_queries
+        if query["sql"].startswith("SELECT")
+    ]
+    assert len(selects) == 1
+    assert "'blue'" not in selects[0]
+
+
+def test_attribute_value_ids_are_cached(
+    color_attribute, attribute_value_ids_cache_enabled
+):
+    red, blue = color_attribute.values.order_by("pk")
+    get_attribute_value_ids([("color", "red"), ("color", "blue")])
+
+    with CaptureQueriesContext(connection) as queries:
+        value_ids = get_attribute_value_ids([("color", "red"), ("color", "unknown")])
+
+    assert value_ids == {("color", "red"): red.pk}
+    # Only the unknown slug, missing from the cache, is looked up again.
+    selects = [
+        query["sql"]
+        for query in queries.captured_queries
+        if query["sql"].startswith("SELECT")
+    ]
+    assert len(selects) == 1
+    assert "'unknown'" in selects[0]
+
+
+def test_attribute_value_ids_cache_is_invalidated_on_commit(
+    color_attribute, attribute_value_ids_cache_enabled
+):
+    red = color_attribute.values.get(slug="red")
+    get_attribute_value_ids([("color", "red")])
+
+    red.slug = "crimson"
+    red.save(update_fields=["slug"])
+    assert get_attribute_value_ids([("color", "red")]) == {("color", "red"): red.pk}
+
+    flush_post_commit_hooks()
+    assert get_attribute_value_ids([("color", "red")]) == {}
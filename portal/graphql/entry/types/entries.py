@@ -4,11 +4,13 @@ from ....attribute import models as attribute_models
 from ....core.db.utils import get_database_connection_name
 from ....core.permissions import EntryPermissions
 from ....entry import models
+from ...attribute.dataloaders import AttributesByAttributeId, AttributeValueByIdLoader
 from ...attribute.filters import AttributeFilterInput
 from ...attribute.resolvers import resolve_attributes
 from ...attribute.types import (
     Attribute,
     AttributeCountableConnection,
+    AttributeValue,
     SelectedAttribute,
 )
 from ...channel import ChannelContext
@@ -31,6 +33,7 @@ from ..dataloaders import (
     SelectedAttributesByEntryIdLoader,
 )
 from ..dataloaders.attributes import EntryAttributesByEntryTypeIdLoader
+from ..facets import AttributeFacet, AttributeValueCount, EntryFacets
 from .channels import EntryChannelListing
 
 
@@ -103,6 +106,14 @@ class Entry(ChannelContextType):
         default_resolver = ChannelContextType.resolver_with_context
         model = models.Entry
         interfaces = [graphene.relay.Node]
+        field_columns = {
+            "attributes": [],
+            "categories": [],
+            "channel": [],
+            "channel_listings": [],
+            "consult": [],
+            "documents": [],
+        }
 
     @staticmethod
     def resolve_channel(root: ChannelContext[models.Entry], _info):
@@ -138,6 +149,50 @@ class Entry(ChannelContextType):
         return EntryChannelListingByEntryIdLoader(info.context).load(root.node.id)
 
 
+class EntryAttributeValueFacet(graphene.ObjectType):
+    value = graphene.Field(AttributeValue, required=True)
+    count = graphene.Int(
+        required=True, description="Number of the entries with the value."
+    )
+
+    class Meta:
+        description = "Number of the filtered entries with an attribute value."
+
+    @staticmethod
+    def resolve_value(root: AttributeValueCount, info):
+        return AttributeValueByIdLoader(info.context).load(root.value_id)
+
+
+class EntryAttributeFacet(graphene.ObjectType):
+    attribute = graphene.Field(Attribute, required=True)
+    values = NonNullList(EntryAttributeValueFacet, required=True)
+
+    class Meta:
+        description = (
+            "Numbers of the filtered entries by values of an attribute filterable "
+            "in the website."
+        )
+
+    @staticmethod
+    def resolve_attribute(root: AttributeFacet, info):
+        return AttributesByAttributeId(info.context).load(root.attribute_id)
+
+
 class EntryCountableConnection(CountableConnection):
+    facets = NonNullList(
+        EntryAttributeFacet,
+        description=(
+            "Numbers of the filtered entries by values of the attributes "
+            "filterable in the website, counted with a single query."
+        ),
+    )
+
     class Meta:
         node = Entry
+
+    @staticmethod
+    def resolve_facets(root, _info):
+        facets = getattr(root, "facets", None)
+        if isinstance(facets, EntryFacets):
+            return facets()
+        return None
@@ -1,14 +1,18 @@
 from collections import defaultdict
 
 from ...event.models import Event
-from ..core.dataloaders import DataLoader
+from ..core.dataloaders import AsyncDataLoader
 
 
-class EventsByDocumentIdLoader(DataLoader):
+class EventsByDocumentIdLoader(AsyncDataLoader):
     context_key = "events_by_document_id"
 
     def batch_load(self, keys):
         events_by_document_ids = defaultdict(list)
-        for event in Event.objects.filter(document_id__in=keys).iterator():
+        for event in (
+            Event.objects.using(self.database_connection_name)
+            .filter(document_id__any=keys)
+            .iterator()
+        ):
             events_by_document_ids[event.document_id].append(event)
         return [events_by_document_ids.get(key, []) for key in keys]
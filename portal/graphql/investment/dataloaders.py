@@ -9,6 +9,10 @@ class ItemsByInvestmentIdLoader(DataLoader):
 
     def batch_load(self, keys):
         items_by_investments_ids = defaultdict(list)
-        for item in Item.objects.filter(investment_id__in=keys).iterator():
+        for item in (
+            Item.objects.using(self.database_connection_name)
+            .filter(investment_id__any=keys)
+            .iterator()
+        ):
             items_by_investments_ids[item.investment_id].append(item)
         return [items_by_investments_ids.get(key, []) for key in keys]
@@ -38,6 +38,7 @@ class Investment(ModelObjectType):
     class Meta:
         model = models.Investment
         interfaces = [graphene.relay.Node]
+        field_columns = {"items": [], "total": []}
 
     @staticmethod
     def resolve_items(root, info):
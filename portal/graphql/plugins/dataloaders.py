@@ -16,7 +16,7 @@ class EmailTemplatesByPluginConfigurationLoader(DataLoader):
     def batch_load(self, keys):
         email_templates = EmailTemplate.objects.using(
             self.database_connection_name
-        ).filter(plugin_configuration_id__in=keys)
+        ).filter(plugin_configuration_id__any=keys)
 
         config_to_template = defaultdict(list)
         for et in email_templates:
@@ -0,0 +1,95 @@
+# Costs of the fields used by the static query cost analysis. Fields resolved
+# through a dataloader are batched across the whole request, so they are cheaper
+# than fields whose resolver runs its own database query. Connection fields are
+# multiplied by the number of requested records.
+LOADER = 1
+QUERY = 5
+CONNECTION = ["first", "last"]
+
+COST_MAP = {
+    "Query": {
+        "attribute": {"complexity": QUERY},
+        "attributes": {"complexity": QUERY, "multipliers": CONNECTION},
+        "categories": {"complexity": QUERY, "multipliers": CONNECTION},
+        "category": {"complexity": QUERY},
+        "channel": {"complexity": QUERY},
+        "channels": {"complexity": QUERY},
+        "document": {"complexity": QUERY},
+        "documentLoad": {"complexity": QUERY},
+        "documents": {"complexity": QUERY, "multipliers": CONNECTION},
+        "entries": {"complexity": QUERY, "multipliers": CONNECTION},
+        "entry": {"complexity": QUERY},
+        "entryType": {"complexity": QUERY},
+        "entryTypes": {"complexity": QUERY, "multipliers": CONNECTION},
+        "events": {"complexity": QUERY, "multipliers": CONNECTION},
+        "investment": {"complexity": QUERY},
+        "investments": {"complexity": QUERY, "multipliers": CONNECTION},
+        "me": {"complexity": LOADER},
+        "plugin": {"complexity": QUERY},
+        "plugins": {"complexity": QUERY, "multipliers": CONNECTION},
+        "session": {"complexity": QUERY},
+        "sessions": {"complexity": QUERY, "multipliers": CONNECTION},
+    },
+    "Attribute": {
+        "choices": {"complexity": QUERY, "multipliers": CONNECTION},
+        "documents": {"complexity": QUERY, "multipliers": CONNECTION},
+        "entries": {"complexity": QUERY, "multipliers": CONNECTION},
+    },
+    "AttributeValue": {
+        "date": {"complexity": LOADER},
+        "inputType": {"complexity": LOADER},
+        "reference": {"complexity": LOADER},
+    },
+    "Category": {
+        "totalEntries": {"complexity": QUERY},
+    },
+    "Channel": {
+        "totalEntries": {"complexity": QUERY},
+    },
+    "Consult": {
+        "entry": {"complexity": QUERY},
+    },
+    "Document": {
+        "defaultFile": {"complexity": LOADER},
+        "entry": {"complexity": LOADER},
+        "events": {"complexity": LOADER},
+        "files": {"complexity": LOADER},
+    },
+    "DocumentFile": {
+        "document": {"complexity": QUERY},
+    },
+    "DocumentLoad": {
+        "document": {"complexity": QUERY},
+        "documentFile": {"complexity": QUERY},
+    },
+    "Entry": {
+        "attributes": {"complexity": LOADER},
+        "categories": {"complexity": LOADER},
+        "channelListings": {"complexity": LOADER},
+        "consult": {"complexity": LOADER},
+        "documents": {"complexity": LOADER, "multipliers": CONNECTION},
+        "entryType": {"complexity": LOADER},
+    },
+    "EntryChannelListing": {
+        "channel": {"complexity": LOADER},
+    },
+    "EntryType": {
+        "availableAttributes": {"complexity": QUERY, "multipliers": CONNECTION},
+        "entryAttributes": {"complexity": LOADER},
+    },
+    "Event": {
+        "document": {"complexity": LOADER},
+        "user": {"complexity": QUERY},
+    },
+    "Investment": {
+        "channel": {"complexity": LOADER},
+        "items": {"complexity": LOADER},
+        "total": {"complexity": LOADER},
+    },
+    "Item": {
+        "investment": {"complexity": QUERY},
+    },
+    "Session": {
+        "channel": {"complexity": LOADER},
+    },
+}
@@ -19,6 +19,7 @@ class Session(ModelObjectType):
     class Meta:
         model = models.Session
         interfaces = [graphene.relay.Node]
+        field_columns = {"channel": ["channel"]}
 
     @staticmethod
     def resolve_channel(root, info):
@@ -23,6 +23,15 @@ def _sort_queryset_by_attribute(queryset, sorting_attribute, sorting_direction):
     return queryset
 
 
+def sort_by_rank(queryset: QuerySet, **_kwargs) -> QuerySet:
+    """Check that the records are ranked by the `search` filter."""
+    if "search_rank" not in queryset.query.annotations:
+        raise GraphQLError(
+            "Sorting by RANK is available only with the `search` filter."
+        )
+    return queryset
+
+
 def sort_queryset_for_connection(iterable, args):
     sort_by = args.get("sort_by")
     reversed = True if "last" in args else False
@@ -61,6 +70,10 @@ def sort_queryset(
         return _sort_queryset_by_attribute(
             queryset, sorting_attribute, sorting_direction
         )
+    elif sorting_field is None:
+        raise GraphQLError(
+            "You must provide either `field` or `attributeId` to sort the entries."
+        )
 
     sort_enum = sort_by._meta.sort_enum
     sorting_fields = sort_enum.get(sorting_field)
@@ -1,18 +1,34 @@
+import copy
 import hashlib
 import importlib
 import json
 from inspect import isclass
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.cache import cache
-from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
+from django.db import connection
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotAllowed,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.http.response import HttpResponseBase
 from django.shortcuts import render
 from django.urls import reverse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
 from django.utils.functional import SimpleLazyObject
+from django.utils.http import quote_etag
 from django.views.generic import View
 from graphql import GraphQLDocument, get_default_backend
-from graphql.error import GraphQLError, GraphQLSyntaxError
+from graphql.error import GraphQLError
 from graphql.execution import ExecutionResult
 from jwt.exceptions import PyJWTError
 
@@ -20,8 +36,17 @@ from portal.customer.models import Client
 from portal.graphql.utils.files import place_files_in_operations
 
 from .. import __version__ as portal_version
+from ..core.auth import get_token_from_request
+from ..core.db.replicas import is_primary_sticky, set_primary_sticky
 from ..core.exceptions import PermissionDenied, ReadOnlyException
 from .context import get_context_value
+from .core.batching import call_with_tenant_connection, get_batch_executor
+from .core.document_cache import document_cache
+from .core.json_encoder import dumps, iter_dumps
+from .core.persisted_queries import resolve_persisted_query
+from .core.query_cost import validate_query_cost
+from .core.query_limits import validate_query_limits
+from .core.response_cache import get_response_cache_key, is_response_cacheable
 from .utils import format_error
 
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
@@ -85,17 +110,22 @@ class GraphQLView(View):
 
     def dispatch(self, request, *args, **kwargs):
         # Handle options method the GraphQlView restricts it.
+        # GET requests with a query or a persisted query hash are executed, so
+        # their responses can be cached by browsers and proxies.
         if request.method == "GET":
+            if self.is_query_request(request):
+                return self.handle_query(request)
             if settings.PLAYGROUND_ENABLED:
                 return self.render_playground(request)
             return HttpResponseNotAllowed(["OPTIONS", "POST"])
         elif request.method == "POST":
             return self.handle_query(request)
         else:
-            if settings.PLAYGROUND_ENABLED:
-                return HttpResponseNotAllowed(["GET", "OPTIONS", "POST"])
-            else:
-                return HttpResponseNotAllowed(["OPTIONS", "POST"])
+            return HttpResponseNotAllowed(["GET", "OPTIONS", "POST"])
+
+    @staticmethod
+    def is_query_request(request: HttpRequest) -> bool:
+        return "query" in request.GET or "extensions" in request.GET
 
     def render_playground(self, request):
         return render(
@@ -107,7 +137,7 @@ class GraphQLView(View):
             },
         )
 
-    def _handle_query(self, request: HttpRequest) -> JsonResponse:
+    def _handle_query(self, request: HttpRequest) -> HttpResponseBase:
         try:
             data = self.parse_body(request)
         except ValueError:
@@ -117,16 +147,111 @@ class GraphQLView(View):
             )
 
         if isinstance(data, list):
-            responses = [self.get_response(request, entry) for entry in data]
+            batch_max_size = settings.GRAPHQL_BATCH_MAX_SIZE
+            if batch_max_size and len(data) > batch_max_size:
+                msg = f"Batch cannot contain more than {batch_max_size} operations."
+                return JsonResponse(
+                    data={"errors": [self.format_error(GraphQLError(msg))]},
+                    status=400,
+                )
+            responses = self.get_batch_responses(request, data)
             result: Union[list, Optional[dict]] = [
                 response for response, code in responses
             ]
             status_code = max((code for response, code in responses), default=200)
         else:
             result, status_code = self.get_response(request, data)
-        return JsonResponse(data=result, status=status_code, safe=False)
+        if settings.GRAPHQL_STREAMING_RESPONSES and request.method != "GET":
+            # GET responses are not streamed, as their ETag needs the whole body.
+            return StreamingHttpResponse(
+                iter_dumps(result), status=status_code, content_type="application/json"
+            )
+        response = HttpResponse(
+            dumps(result), status=status_code, content_type="application/json"
+        )
+        if request.method == "GET" and status_code == 200:
+            return self.get_conditional_response(request, response)
+        return response
 
-    def handle_query(self, request: HttpRequest) -> JsonResponse:
+    @staticmethod
+    def get_conditional_response(
+        request: HttpRequest, response: HttpResponse
+    ) -> HttpResponse:
+        """Add HTTP caching headers to the response of a GET query.
+
+        The strong ETag is computed from the serialized result, and `304 Not
+        Modified` is returned instead when it matches `If-None-Match`. Responses
+        of anonymous requests can be stored by shared caches.
+        """
+        etag = quote_etag(hashlib.sha256(response.content).hexdigest())
+        response["ETag"] = etag
+        if get_token_from_request(request):
+            patch_cache_control(response, private=True, no_cache=True)
+        elif settings.GRAPHQL_CACHE_CONTROL:
+            response["Cache-Control"] = settings.GRAPHQL_CACHE_CONTROL
+        patch_vary_headers(response, ["Authorization", "Authorization-Bearer"])
+        return get_conditional_response(request, etag=etag, response=response)
+
+    def get_batch_responses(
+        self, request: HttpRequest, data: list
+    ) -> List[Tuple[Optional[Dict[str, List[Any]]], int]]:
+        """Execute a batch of operations and return responses in the same order.
+
+        With `GRAPHQL_BATCH_CONCURRENCY` enabled, consecutive read-only queries
+        are executed concurrently in a thread pool. Mutations act as barriers:
+        each one runs alone, after all preceding operations have finished.
+        """
+        if settings.GRAPHQL_BATCH_CONCURRENCY < 2:
+            return [self.get_response(request, entry) for entry in data]
+
+        responses: list = [None] * len(data)
+        queries: List[int] = []
+        for index, entry in enumerate(data):
+            if self.is_read_only_operation(request, entry):
+                queries.append(index)
+                continue
+            self.execute_concurrently(request, data, queries, responses)
+            queries = []
+            responses[index] = self.get_response(request, entry)
+        self.execute_concurrently(request, data, queries, responses)
+        return responses
+
+    def execute_concurrently(
+        self, request: HttpRequest, data: list, indexes: List[int], responses: list
+    ):
+        if len(indexes) < 2:
+            for index in indexes:
+                responses[index] = self.get_response(request, data[index])
+            return
+
+        # Each operation gets its own copy of the request, as the GraphQL context
+        # (dataloaders, authenticated user) is stored on the request object.
+        tenant = getattr(connection, "tenant", None)
+        executor = get_batch_executor()
+        futures = {
+            index: executor.submit(
+                call_with_tenant_connection,
+                tenant,
+                self.get_response,
+                copy.copy(request),
+                data[index],
+            )
+            for index in indexes
+        }
+        for index, future in futures.items():
+            responses[index] = future.result()
+
+    def is_read_only_operation(self, request: HttpRequest, data: dict) -> bool:
+        try:
+            query, _, operation_name = self.get_graphql_params(request, data)
+        except GraphQLError:
+            return False
+        document, _ = self.parse_query(query)
+        if document is None:
+            return False
+        return document.get_operation_type(operation_name) == "query"
+
+    def handle_query(self, request: HttpRequest) -> HttpResponseBase:
         # Disable extending spans from header due to:
         # https://github.com/DataDog/dd-trace-py/issues/2030
 
@@ -137,7 +262,11 @@ class GraphQLView(View):
         # Add `from opentracing.propagation import Format` to imports
         # Add `child_of=span_ontext` to `start_active_span`
 
+        if is_primary_sticky(request):
+            request.allow_replica = False  # type: ignore[attr-defined]
         response = self._handle_query(request)
+        if getattr(request, "executed_mutation", False):
+            set_primary_sticky(response)
         return response
 
     def get_response(
@@ -173,7 +302,10 @@ class GraphQLView(View):
 
         If no query was given or query is not a string, it returns an error.
         If the query is invalid, it returns an error as well.
-        Otherwise, it returns the parsed gql document.
+        Otherwise, it returns the parsed and validated gql document.
+
+        Documents and parsing failures are served from the process-wide
+        document cache when the same query was seen before.
         """
         if not query or not isinstance(query, str):
             return (
@@ -183,14 +315,7 @@ class GraphQLView(View):
                 ),
             )
 
-        # Attempt to parse the query, if it fails, return the error
-        try:
-            return (
-                self.backend.document_from_string(self.schema, query),
-                None,
-            )
-        except (ValueError, GraphQLSyntaxError) as e:
-            return None, ExecutionResult(errors=[e], invalid=True)
+        return document_cache.document_from_string(self.backend, self.schema, query)
 
     def check_if_query_contains_only_schema(self, document: GraphQLDocument):
         query_with_schema = False
@@ -207,16 +332,36 @@ class GraphQLView(View):
         return query_with_schema
 
     def execute_graphql_request(self, request: HttpRequest, data: dict):
-        query, variables, operation_name = self.get_graphql_params(request, data)
+        try:
+            query, variables, operation_name = self.get_graphql_params(request, data)
+        except GraphQLError as e:
+            return ExecutionResult(errors=[e], invalid=True)
 
         document, error = self.parse_query(query)
         if error or document is None:
             return error
 
+        if (
+            request.method == "GET"
+            and document.get_operation_type(operation_name) != "query"
+        ):
+            msg = "Can only perform a query operation from a GET request."
+            return ExecutionResult(errors=[GraphQLError(msg)], invalid=True)
+
+        if document.get_operation_type(operation_name) != "query":
+            # Mutations, and operations following them in a batch, read from
+            # the primary database to see the changes they made.
+            request.allow_replica = False  # type: ignore[attr-defined]
+            request.executed_mutation = True  # type: ignore[attr-defined]
+
         raw_query_string = document.document_string
 
         try:
             query_contains_schema = self.check_if_query_contains_only_schema(document)
+            validate_query_limits(document.document_ast, operation_name)
+            query_cost, query_cost_limit = validate_query_cost(
+                self.schema, document.document_ast, operation_name, variables
+            )
         except GraphQLError as e:
             return ExecutionResult(errors=[e], invalid=True)
 
@@ -228,10 +373,16 @@ class GraphQLView(View):
             extra_options["executor"] = self.executor
         try:
             response = None
+            response_cache_key = None
             should_use_cache_for_scheme = query_contains_schema & (not settings.DEBUG)
             if should_use_cache_for_scheme:
                 key = generate_cache_key(raw_query_string)
                 response = cache.get(key)
+            elif is_response_cacheable(request, document, operation_name):
+                response_cache_key = get_response_cache_key(
+                    raw_query_string, operation_name, variables
+                )
+                response = cache.get(response_cache_key)
 
             if not response:
                 response = document.execute(
@@ -244,7 +395,20 @@ class GraphQLView(View):
                 )
                 if should_use_cache_for_scheme:
                     cache.set(key, response)
-
+                elif response_cache_key and not response.errors:
+                    cache.set(
+                        response_cache_key,
+                        response,
+                        settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT,
+                    )
+
+            response.extensions["cost"] = {
+                "requestedQueryCost": query_cost,
+                "maximumAvailable": query_cost_limit,
+            }
+            total_count_strategies = getattr(request, "total_count_strategies", None)
+            if total_count_strategies:
+                response.extensions["totalCount"] = total_count_strategies
             return response
         except Exception as e:
             # In the graphql-core version that we are using,
@@ -256,6 +420,15 @@ class GraphQLView(View):
 
     @staticmethod
     def parse_body(request: HttpRequest):
+        if request.method == "GET":
+            data = {
+                "query": request.GET.get("query"),
+                "operationName": request.GET.get("operationName"),
+            }
+            for key in ["variables", "extensions"]:
+                value = request.GET.get(key)
+                data[key] = json.loads(value) if value else None
+            return data
         content_type = request.content_type
         if content_type == "application/graphql":
             return {"query": request.body.decode("utf-8")}
@@ -279,6 +452,9 @@ class GraphQLView(View):
         operation_name = data.get("operationName")
         if operation_name == "null":
             operation_name = None
+        extensions = data.get("extensions")
+        if isinstance(extensions, dict) and "persistedQuery" in extensions:
+            query = resolve_persisted_query(query, extensions["persistedQuery"])
         return query, variables, operation_name
 
     @classmethod
@@ -286,6 +462,26 @@ class GraphQLView(View):
         return format_error(error, cls.HANDLED_EXCEPTIONS)
 
 
+class AsyncGraphQLView(GraphQLView):
+    """Asynchronous variant of `GraphQLView` served by ASGI deployments.
+
+    Resolvers and the ORM are synchronous, so every request is executed in a
+    worker thread using the tenant's database connection. The event loop keeps
+    serving other requests while that thread waits on the database or the file
+    storage, instead of queueing all sync views in a single thread.
+    """
+
+    view_is_async = True
+
+    async def dispatch(self, request, *args, **kwargs):
+        # Middlewares set the tenant on the request; the database connection of
+        # the worker thread has to be switched to its schema.
+        tenant = getattr(request, "tenant", None)
+        return await sync_to_async(call_with_tenant_connection, thread_sensitive=False)(
+            tenant, super().dispatch, request, *args, **kwargs
+        )
+
+
 def get_key(key):
     try:
         int_key = int(key)
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("channel", "0001_initial"),
+        ("investment", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="investment",
+            index=models.Index(fields=["created"], name="investment_created_idx"),
+        ),
+    ]
@@ -18,6 +18,9 @@ class Investment(ModelWithDates, PublishableModel):
 
     class Meta:
         ordering = ["-created"]
+        indexes = [
+            models.Index(fields=["created"], name="investment_created_idx"),
+        ]
         unique_together = ("year", "month", "channel")
         permissions = (
             (InvestmentPermissions.MANAGE_INVESTMENTS.codename, "Manage investments."),
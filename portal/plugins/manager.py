@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Any, Callable, List, Optional, Type
 from django.conf import settings
 from django.utils.module_loading import import_string
 
+from ..core.db.utils import get_replica_connection_name
 from .models import PluginConfiguration
 
 if TYPE_CHECKING:
@@ -56,9 +57,7 @@ class PluginsManager:
             self.all_plugins.append(plugin)
 
     def _get_db_plugin_configs(self):
-        qs = PluginConfiguration.objects.all().using(
-            settings.DATABASE_CONNECTION_REPLICA_NAME
-        )
+        qs = PluginConfiguration.objects.all().using(get_replica_connection_name())
         global_configs = {}
         for db_plugin_config in qs:
             global_configs[db_plugin_config.identifier] = db_plugin_config
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class SessionConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "portal.session"
+
+    def ready(self):
+        # Connect the receivers maintaining the search vectors.
+        from . import search  # noqa: F401
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:59
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("channel", "0001_initial"),
+        ("session", "0002_session_session_created_idx_session_session_name_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="session",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="session",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="session_search_vector_idx"
+            ),
+        ),
+    ]
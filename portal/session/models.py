@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from ..channel.models import Channel
@@ -11,9 +13,15 @@ class Session(ModelWithDates, ModelWithSlug, PublishableModel):
     content = SanitizedJSONField(blank=True, null=True, sanitizer=clean_editor_js)
     date = models.DateTimeField()
     channel = models.ForeignKey(Channel, on_delete=models.CASCADE)
+    search_vector = SearchVectorField(blank=True, null=True)
 
     class Meta:
         ordering = ["-created"]
+        indexes = [
+            models.Index(fields=["created"], name="session_created_idx"),
+            models.Index(fields=["name"], name="session_name_idx"),
+            GinIndex(fields=["search_vector"], name="session_search_vector_idx"),
+        ]
         permissions = (
             (SessionPermissions.MANAGE_SESSIONS.codename, "Manage sessions."),
         )
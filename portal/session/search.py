@@ -0,0 +1,35 @@
+from django.db import models
+from django.db.models import QuerySet, Value
+from django.dispatch import receiver
+
+from ..core.search import get_search_vector
+from ..core.utils.editorjs import clean_editor_js
+from .models import Session
+
+
+def prepare_session_search_vector(session: Session):
+    content = clean_editor_js(session.content, to_string=True)
+    return get_search_vector("name", weight="A") + get_search_vector(
+        Value(content), weight="B"
+    )
+
+
+def update_sessions_search_vector(sessions: QuerySet):
+    """Rebuild search vectors of the sessions from their name and content.
+
+    Plain text of the EditorJS content is extracted in Python, so each session
+    is updated separately.
+    """
+    for session in sessions.order_by().only("pk", "content").iterator():
+        Session.objects.filter(pk=session.pk).update(
+            search_vector=prepare_session_search_vector(session)
+        )
+
+
+@receiver(models.signals.post_save, sender=Session)
+def update_session_search_vector(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    Session.objects.filter(pk=instance.pk).update(
+        search_vector=prepare_session_search_vector(instance)
+    )
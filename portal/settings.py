@@ -3,11 +3,12 @@ import os.path
 import re
 from datetime import timedelta
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 import dj_database_url
 import dj_email_url
 import pkg_resources
+from corsheaders.defaults import default_headers
 from django.core.management.utils import get_random_secret_key
 from dotenv import load_dotenv
 
@@ -59,6 +60,10 @@ CORS_ALLOWED_ORIGIN_REGEXES = [
 
 CORS_ALLOW_ALL_ORIGINS = DEBUG
 
+# Clients not keeping cookies echo the header to read their own writes.
+CORS_ALLOW_HEADERS = (*default_headers, "read-primary-until")
+CORS_EXPOSE_HEADERS = ["Read-Primary-Until"]
+
 SHARED_APPS = [
     # libs
     "django_celery_beat",
@@ -163,6 +168,40 @@ DATABASES = {
     ),
 }
 
+# Read replicas of the default database, as comma-separated database URLs, and
+# their relative weights in the replica selection, 1 by default. Reads of
+# GraphQL queries are spread across the replicas.
+DATABASE_REPLICAS: Dict[str, int] = {}
+DATABASE_REPLICA_WEIGHTS = get_list(os.environ.get("DATABASE_REPLICA_WEIGHTS", ""))
+for index, replica_url in enumerate(
+    get_list(os.environ.get("DATABASE_REPLICA_URLS", ""))
+):
+    if not replica_url:
+        continue
+    replica_name = f"replica_{index + 1}"
+    DATABASES[replica_name] = dj_database_url.parse(
+        replica_url,
+        conn_max_age=600,
+        engine="django_tenants.postgresql_backend",
+        test_options={"MIRROR": DATABASE_CONNECTION_DEFAULT_NAME},
+    )
+    weight = (
+        DATABASE_REPLICA_WEIGHTS[index] if index < len(DATABASE_REPLICA_WEIGHTS) else ""
+    )
+    DATABASE_REPLICAS[replica_name] = int(weight or 1)
+# Replicas lagging behind the default database by more than this many seconds
+# are not read from. The lag is probed at most once per interval by each
+# worker process.
+DATABASE_REPLICA_MAX_LAG = float(os.environ.get("DATABASE_REPLICA_MAX_LAG", 5))
+DATABASE_REPLICA_LAG_CHECK_INTERVAL = float(
+    os.environ.get("DATABASE_REPLICA_LAG_CHECK_INTERVAL", 5)
+)
+# Seconds clients read from the default database after running a mutation,
+# so they read their own writes.
+DATABASE_PRIMARY_STICKY_TIMEOUT = int(
+    os.environ.get("DATABASE_PRIMARY_STICKY_TIMEOUT", 10)
+)
+
 DATABASE_ROUTERS = ("django_tenants.routers.TenantSyncRouter",)
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -182,6 +221,11 @@ USE_I18N = True
 
 USE_TZ = True
 
+# PostgreSQL text search configuration of the search vectors, e.g. "portuguese"
+# to match words by their stems. Search vectors must be rebuilt with the
+# `update_search_vectors` command after changing it.
+SEARCH_CONFIG = os.environ.get("SEARCH_CONFIG", "simple")
+
 BUILTIN_PLUGINS = [
     "portal.plugins.admin_email.plugin.AdminEmailPlugin",
     "portal.plugins.sendgrid.plugin.SendgridEmailPlugin",
@@ -200,8 +244,90 @@ for entry_point in installed_plugins:
 
 PLUGINS = BUILTIN_PLUGINS + EXTERNAL_PLUGINS
 
+# Redis cache shared by the worker processes. The GraphQL caches below
+# invalidate their entries in all processes through it, so it's required when
+# they are enabled. Each process uses its own memory cache when it's not set.
+CACHE_URL = os.environ.get("CACHE_URL")
+if CACHE_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+        }
+    }
+
 GRAPHQL_MIDDLEWARE: List[str] = []
 GRAPHQL_PAGINATION_LIMIT = 100
+# Maximum number of parsed and validated query documents kept in memory
+# by each worker process. Set to 0 to disable the cache.
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.environ.get("GRAPHQL_DOCUMENT_CACHE_SIZE", 1000))
+GRAPHQL_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ENABLED", True
+)
+# Time in seconds an automatic persisted query is kept in the cache.
+GRAPHQL_PERSISTED_QUERIES_TIMEOUT = int(
+    os.environ.get("GRAPHQL_PERSISTED_QUERIES_TIMEOUT", 60 * 60 * 24)
+)
+# Default maximum cost of a single query, tenants can override it. Set to 0 to
+# disable the query cost limit.
+GRAPHQL_QUERY_COST_LIMIT = int(os.environ.get("GRAPHQL_QUERY_COST_LIMIT", 50000))
+# Maximum selection depth, number of aliases and number of fields of a query,
+# 0 means no limit.
+GRAPHQL_MAX_QUERY_DEPTH = int(os.environ.get("GRAPHQL_MAX_QUERY_DEPTH", 15))
+GRAPHQL_MAX_QUERY_ALIASES = int(os.environ.get("GRAPHQL_MAX_QUERY_ALIASES", 50))
+GRAPHQL_MAX_QUERY_FIELDS = int(os.environ.get("GRAPHQL_MAX_QUERY_FIELDS", 1000))
+# Maximum number of operations in a single batched request, 0 means no limit.
+GRAPHQL_BATCH_MAX_SIZE = int(os.environ.get("GRAPHQL_BATCH_MAX_SIZE", 50))
+# Number of threads used to execute read-only operations of a batch
+# concurrently. Each thread uses its own database connection. Values lower
+# than 2 execute batches serially.
+GRAPHQL_BATCH_CONCURRENCY = int(os.environ.get("GRAPHQL_BATCH_CONCURRENCY", 0))
+# Number of threads running the batch loads of async data loaders. Each thread
+# uses its own database connection. 0 runs the batch loads in the thread
+# executing the query.
+GRAPHQL_DATALOADER_CONCURRENCY = int(
+    os.environ.get("GRAPHQL_DATALOADER_CONCURRENCY", 0)
+)
+# Maximum number of keys loaded by a single data loader query. Larger batches
+# are split into chunks, loaded separately. 0 disables it.
+GRAPHQL_DATALOADER_MAX_BATCH_SIZE = int(
+    os.environ.get("GRAPHQL_DATALOADER_MAX_BATCH_SIZE", 1000)
+)
+# Seconds results of reference data loaders (entry types, categories, channels,
+# attributes) are shared between requests, per tenant. 0 disables it.
+GRAPHQL_DATALOADER_CACHE_TIMEOUT = int(
+    os.environ.get("GRAPHQL_DATALOADER_CACHE_TIMEOUT", 0)
+)
+# Maximum number of shared data loader results kept in memory by each worker
+# process, in front of the Django cache.
+GRAPHQL_DATALOADER_CACHE_SIZE = int(
+    os.environ.get("GRAPHQL_DATALOADER_CACHE_SIZE", 10000)
+)
+# Seconds anonymous query responses are cached for, per tenant. 0 disables it.
+GRAPHQL_RESPONSE_CACHE_TIMEOUT = int(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_TIMEOUT", 0)
+)
+# Cache-Control header of GET query responses of anonymous requests.
+GRAPHQL_CACHE_CONTROL = os.environ.get("GRAPHQL_CACHE_CONTROL", "public, max-age=60")
+# Encoder of GraphQL responses, "orjson" (used when installed) or "json".
+GRAPHQL_JSON_ENCODER = os.environ.get("GRAPHQL_JSON_ENCODER", "orjson")
+# Stream responses of POST requests instead of encoding them at once.
+GRAPHQL_STREAMING_RESPONSES = get_bool_from_env("GRAPHQL_STREAMING_RESPONSES", False)
+# Strategy of computing `totalCount` of connections: "exact", "cached" (exact
+# counts cached per tenant and filters) or "estimated" (planner estimates for
+# unfiltered lists larger than the threshold, cached counts otherwise).
+GRAPHQL_TOTAL_COUNT_STRATEGY = os.environ.get("GRAPHQL_TOTAL_COUNT_STRATEGY", "exact")
+GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT", 30)
+)
+GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD", 100000)
+)
+# Seconds attribute value counts (`facets`) of filtered entries are cached for,
+# per tenant and filters. 0 disables it.
+GRAPHQL_FACETS_CACHE_TIMEOUT = int(os.environ.get("GRAPHQL_FACETS_CACHE_TIMEOUT", 0))
+# Serve the API with the asynchronous view; enable it when running under ASGI.
+GRAPHQL_ASYNC_VIEW = get_bool_from_env("GRAPHQL_ASYNC_VIEW", False)
 PLAYGROUND_ENABLED = DEBUG
 
 
@@ -244,8 +370,6 @@ STATICFILES_FINDERS = [
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
-DATABASE_CONNECTION_REPLICA_NAME = "default"
-
 JWT_EXPIRE = False
 JWT_TTL_ACCESS = timedelta(seconds=10)
 JWT_TTL_APP_ACCESS = timedelta(seconds=10)
@@ -1,13 +1,27 @@
+from unittest import mock
+
 import pytest
 from django.contrib.auth.models import Permission
+from django.db import connections
 
 from portal.account.models import User
 from portal.attribute import AttributeInputType, AttributeType
 from portal.attribute.models import Attribute, AttributeValue
 from portal.attribute.utils import associate_attribute_values_to_instance
 from portal.channel.models import Channel
+from portal.core.db.replicas import lag_probe
 from portal.document.models import Document, DocumentFile
-from portal.entry.models import Category, Entry, EntryChannelListing, EntryType
+from portal.entry.models import (
+    Category,
+    Entry,
+    EntryChannelListing,
+    EntryChannelVisibility,
+    EntryType,
+)
+from portal.entry.search import (
+    update_categories_search_vector,
+    update_entries_search_vector,
+)
 from portal.investment.models import Investment, Item
 
 
@@ -269,6 +283,8 @@ def category_list():
             Category(name="Category 3", slug="category-3"),
         ]
     )
+    # Bulk created categories don't send signals updating the search vectors.
+    update_categories_search_vector(Category.objects.all())
     return categories
 
 
@@ -314,6 +330,7 @@ def vehicle_list(vehicle_category, vehicle_entry_type):
     )
     for vehicle in vehicles:
         vehicle.categories.add(vehicle_category)
+    update_entries_search_vector(Entry.objects.all())
     return vehicles
 
 
@@ -335,6 +352,8 @@ def entries_channel_listings(vehicle, provider, channel_city_1):
             ),
         ]
     )
+    # Bulk created listings don't send signals refreshing the visibilities.
+    EntryChannelVisibility.objects.refresh()
     return listings
 
 
@@ -448,3 +467,30 @@ def investment_with_items():
         name="Internet", slug="internet", value=200, investment=investment
     )
     return investment
+
+
+@pytest.fixture
+def replica_database(settings):
+    """Configure a `replica` database mirroring the default one, without lag."""
+    replica_settings = {
+        **connections.settings["default"],
+        "TEST": {**connections.settings["default"]["TEST"], "MIRROR": "default"},
+    }
+    settings.DATABASE_REPLICAS = {"replica": 1}
+    lag_probe.clear()
+    with mock.patch.dict(connections.settings, {"replica": replica_settings}):
+        with mock.patch.object(lag_probe, "get_lag", return_value=0):
+            yield "replica"
+    lag_probe.clear()
+    if hasattr(connections._connections, "replica"):
+        connections["replica"].close()
+        del connections["replica"]
+
+
+@pytest.fixture
+def pg_trgm(db):
+    with connections["default"].cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        installed = cursor.fetchone() is not None
+    if not installed:
+        pytest.skip("The pg_trgm extension isn't installed in the test database.")
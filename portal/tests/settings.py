@@ -15,6 +15,6 @@ DATABASE_ROUTERS = []
 
 AUTH_PASSWORD_VALIDATORS = []
 
-DATABASE_CONNECTION_REPLICA_NAME = DATABASE_CONNECTION_DEFAULT_NAME
+DATABASE_REPLICAS = {}
 
 JWT_EXPIRE = True
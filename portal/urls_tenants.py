@@ -6,12 +6,14 @@ from django.views.decorators.csrf import csrf_exempt
 from portal.core.views import TenantView
 
 from .graphql.schema import schema
-from .graphql.views import GraphQLView
+from .graphql.views import AsyncGraphQLView, GraphQLView
+
+graphql_view = AsyncGraphQLView if settings.GRAPHQL_ASYNC_VIEW else GraphQLView
 
 urlpatterns = [
     path("", TenantView.as_view()),
     path("admin/", admin.site.urls),
-    path("graphql/", csrf_exempt(GraphQLView.as_view(schema=schema)), name="api"),
+    path("graphql/", csrf_exempt(graphql_view.as_view(schema=schema)), name="api"),
 ]
 
 if settings.DEBUG: